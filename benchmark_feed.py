@@ -0,0 +1,171 @@
+"""Замер времени выполнения запросов ленты заданий бота (таблица task_feeds).
+
+Скрипт в одной транзакции наполняет базу данных синтетическими данными (по умолчанию
+100 000 заданий и 50 000 пользователей) и замеряет:
+- чтение: первую страницу ленты и количество оставшихся заданий одним запросом,
+  как обработчик просмотра заданий бота;
+- запись: обновление задания в лентах пользователей (TaskFeedRepository.refresh_tasks),
+  выполняемое при синхронизации заданий, и перестроение ленты пользователя
+  (TaskFeedRepository.refresh_users), выполняемое при изменении его категорий.
+Для каждой операции выводятся перцентили времени выполнения. Затем в той же транзакции удаляются
+индексы, используемые этими операциями, и замер повторяется. В конце транзакция откатывается,
+поэтому данные и индексы в базе не меняются, но на время работы скрипта таблицы заданий,
+подписок на категории и лент блокируются.
+
+Запускать на базе данных для разработки после применения миграций:
+
+    python3 benchmark_feed.py [количество_заданий] [количество_пользователей]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime
+from random import randint
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.db import get_session
+from src.core.db.repository import TaskFeedRepository, TaskRepository
+
+TASKS_COUNT = 100_000
+USERS_COUNT = 50_000
+CATEGORIES_COUNT = 50
+CATEGORIES_PER_USER = 5
+ARCHIVED_TASKS_SHARE = 5  # Каждое пятое задание архивное
+ID_OFFSET = 1_000_000_000  # Синтетические данные не пересекаются с существующими
+READ_SAMPLES_COUNT = 500
+# Каждое обновление записывает тысячи строк лент, поэтому замеров записи меньше
+WRITE_SAMPLES_COUNT = 50
+FEED_PAGE_SIZE = 3
+FEED_START_TIME = datetime(2000, 1, 1)
+FEED_INDEXES = (
+    # Чтение страницы ленты пользователя
+    "ix_task_feeds_user_id_actualizing_time",
+    # Удаление строк заданий из лент в refresh_tasks
+    "ix_task_feeds_task_id",
+    # Выбор заданий из категорий пользователей в refresh_users
+    "ix_users_categories_user_id_category_id",
+    "ix_tasks_active_category_id",
+)
+
+
+async def fill_synthetic_data(session: AsyncSession, tasks_count: int, users_count: int) -> None:
+    """Добавляет синтетические категории, задания, пользователей, их подписки на категории и ленты заданий."""
+    params = {
+        "offset": ID_OFFSET,
+        "categories": CATEGORIES_COUNT,
+        "tasks": tasks_count,
+        "users": users_count,
+        "per_user": CATEGORIES_PER_USER,
+        "archived_share": ARCHIVED_TASKS_SHARE,
+    }
+    await session.execute(
+        text(
+            """INSERT INTO categories (id, name, is_archived)
+            SELECT :offset + n, 'Категория ' || n, false FROM generate_series(1, :categories) n"""
+        ),
+        params,
+    )
+    await session.execute(
+        text(
+            """INSERT INTO tasks (id, title, category_id, bonus, location, link, deadline, is_archived, updated_at)
+            SELECT :offset + n, 'Задание ' || n, :offset + 1 + n % :categories, 1 + n % 10, 'Москва',
+                'https://procharity.ru/tasks/' || n, current_date + 30, n % :archived_share = 0,
+                current_timestamp - n * interval '1 minute'
+            FROM generate_series(1, :tasks) n"""
+        ),
+        params,
+    )
+    await session.execute(
+        text(
+            """INSERT INTO users (id, telegram_id, has_mailing)
+            SELECT :offset + n, :offset + n, true FROM generate_series(1, :users) n"""
+        ),
+        params,
+    )
+    await session.execute(
+        text(
+            """INSERT INTO users_categories (user_id, category_id, updated_at)
+            SELECT :offset + u, :offset + 1 + (u * 7 + k * 11) % :categories,
+                current_timestamp - (u % 1000) * interval '1 hour'
+            FROM generate_series(1, :users) u, generate_series(0, :per_user - 1) k
+            ON CONFLICT DO NOTHING"""
+        ),
+        params,
+    )
+    await TaskFeedRepository(session).refresh_users(range(ID_OFFSET + 1, ID_OFFSET + users_count + 1), commit=False)
+    await session.execute(text("ANALYZE categories, tasks, users, users_categories, task_feeds"))
+
+
+async def measure(
+    session: AsyncSession, operation: Callable[[int], Awaitable[object]], ids_count: int, samples_count: int
+) -> list[float]:
+    """Возвращает время (в миллисекундах) выполнения операции operation для случайных синтетических id."""
+    durations = []
+    for _ in range(samples_count):
+        object_id = ID_OFFSET + randint(1, ids_count)
+        start = time.perf_counter()
+        await operation(object_id)
+        durations.append((time.perf_counter() - start) * 1000)
+        session.expunge_all()
+    return durations
+
+
+async def measure_all(session: AsyncSession, tasks_count: int, users_count: int) -> dict[str, list[float]]:
+    """Замеряет чтение страницы ленты и обновление лент."""
+    task_repository = TaskRepository(session)
+    task_feed_repository = TaskFeedRepository(session)
+
+    async def read_page(user_id: int) -> None:
+        await task_repository.get_user_tasks_page_actualized_after(user_id, FEED_START_TIME, 0, FEED_PAGE_SIZE)
+
+    async def refresh_task(task_id: int) -> None:
+        await task_feed_repository.refresh_tasks([task_id], commit=False)
+
+    async def refresh_user(user_id: int) -> None:
+        await task_feed_repository.refresh_users([user_id], commit=False)
+
+    return {
+        "Страница ленты": await measure(session, read_page, users_count, READ_SAMPLES_COUNT),
+        "Обновление задания в лентах": await measure(session, refresh_task, tasks_count, WRITE_SAMPLES_COUNT),
+        "Перестроение ленты пользователя": await measure(session, refresh_user, users_count, WRITE_SAMPLES_COUNT),
+    }
+
+
+def print_statistics(title: str, durations: list[float]) -> None:
+    percentiles = statistics.quantiles(durations, n=100)
+    print(
+        f"{title}: p50 = {percentiles[49]:.2f} мс, p95 = {percentiles[94]:.2f} мс, "
+        f"p99 = {percentiles[98]:.2f} мс, max = {max(durations):.2f} мс"
+    )
+
+
+async def run(tasks_count: int, users_count: int) -> None:
+    session_manager = asynccontextmanager(get_session)
+    async with session_manager() as session:
+        try:
+            await fill_synthetic_data(session, tasks_count, users_count)
+            print(
+                f"Заданий: {tasks_count}, пользователей: {users_count}, "
+                f"замеров чтения: {READ_SAMPLES_COUNT}, замеров записи: {WRITE_SAMPLES_COUNT}."
+            )
+            with_indexes = await measure_all(session, tasks_count, users_count)
+            for index_name in FEED_INDEXES:
+                await session.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+            without_indexes = await measure_all(session, tasks_count, users_count)
+            for title in with_indexes:
+                print_statistics(f"{title}, с индексами", with_indexes[title])
+                print_statistics(f"{title}, без индексов", without_indexes[title])
+        finally:
+            await session.rollback()
+
+
+if __name__ == "__main__":
+    tasks_count = int(sys.argv[1]) if len(sys.argv) > 1 else TASKS_COUNT
+    users_count = int(sys.argv[2]) if len(sys.argv) > 2 else USERS_COUNT
+    asyncio.run(run(tasks_count, users_count))
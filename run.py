@@ -1,6 +1,26 @@
+import argparse
+
 import uvicorn
 
-from src import app
+from src.core.enums import RunMode
+from src.main import main
+from src.settings import settings
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Запуск процесса приложения ProCharity.")
+    parser.add_argument(
+        "--mode",
+        type=RunMode,
+        choices=list(RunMode),
+        default=settings.RUN_MODE,
+        help="Роль процесса: api, bot, worker или all (по умолчанию — из настройки RUN_MODE).",
+    )
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    args = parse_args()
+    uvicorn.run(main(run_mode=args.mode), host=args.host, port=args.port)
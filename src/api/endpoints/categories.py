@@ -4,7 +4,6 @@ from fastapi import APIRouter, Depends
 from src.api.auth import check_header_contains_token
 from src.api.schemas import CategoryRequest, CategoryResponse
 from src.api.services import CategoryService
-from src.core.db.models import Category
 from src.core.depends import Container
 
 category_router = APIRouter(
@@ -33,4 +32,4 @@ async def actualize_categories(
     categories: list[CategoryRequest],
     category_service: CategoryService = Depends(Provide[Container.api_services_container.category_service]),
 ) -> None:
-    await category_service.actualize_objects(categories, Category)
+    await category_service.actualize_objects(categories)
@@ -11,7 +11,9 @@ health_check_router = APIRouter(dependencies=[Depends(check_header_contains_toke
 
 
 @logger_decor
-@health_check_router.get("", description="Проверяет соединение с БД, ботом и выводит информацию о последнем коммите.")
+@health_check_router.get(
+    "", description="Проверяет соединение с БД, ботом и выводит информацию о последнем коммите и кэшах."
+)
 @inject
 async def get_health_check(
     health_check_service: HealthCheckService = Depends(Provide[Container.api_services_container.health_check_service]),
@@ -20,4 +22,5 @@ async def get_health_check(
         db=await health_check_service.check_db_connection(),
         bot=await health_check_service.check_bot(),
         git=health_check_service.get_last_commit(),
+        caches=health_check_service.get_caches_status(),
     )
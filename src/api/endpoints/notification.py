@@ -1,10 +1,13 @@
 import structlog
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, status
 
 from src.api.auth import check_header_contains_token
+from src.api.pagination import MailingRecipientPaginator
 from src.api.schemas import (
     InfoRate,
+    MailingJobResponse,
+    MailingRecipientsPaginateResponse,
     MessageList,
     TelegramNotificationByFilterRequest,
     TelegramNotificationRequest,
@@ -12,6 +15,7 @@ from src.api.schemas import (
 )
 from src.api.services import TelegramNotificationService
 from src.core.depends import Container
+from src.core.enums import MailingRecipientStatus
 
 notification_router_by_token = APIRouter(prefix="/messages", dependencies=[Depends(check_header_contains_token)])
 notification_router_by_admin = APIRouter()
@@ -22,7 +26,12 @@ log = structlog.get_logger()
 
 @notification_router_by_admin.post(
     "/send_telegram_notification",
-    description="Отправляет сообщение пользователям, соответствующим заданному критерию.",
+    response_model=MailingJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    description=(
+        "Ставит в очередь отправку сообщения пользователям, соответствующим заданному критерию. "
+        "Возвращает состояние созданной рассылки."
+    ),
 )
 @inject
 async def send_message(
@@ -30,15 +39,19 @@ async def send_message(
     telegram_notification_service: TelegramNotificationService = Depends(
         Provide[Container.api_services_container.message_service]
     ),
-) -> InfoRate:
+) -> MailingJobResponse:
     filters = dict(has_mailing=notification.has_mailing.to_bool_or_none(), banned=False)
-    results = await telegram_notification_service.send_message_to_users_by_filters(filters, notification.message)
-    return InfoRate.from_results(results)
+    return await telegram_notification_service.enqueue_message_to_users_by_filters(filters, notification.message)
 
 
 @messages_router_by_admin.post(
     "",
-    description="Отправляет сообщение пользователям, соответствующим заданным критериям.",
+    response_model=MailingJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    description=(
+        "Ставит в очередь отправку сообщения пользователям, соответствующим заданным критериям. "
+        "Возвращает состояние созданной рассылки."
+    ),
 )
 @inject
 async def send_message_to_users_by_filters(
@@ -46,11 +59,49 @@ async def send_message_to_users_by_filters(
     telegram_notification_service: TelegramNotificationService = Depends(
         Provide[Container.api_services_container.message_service]
     ),
-) -> InfoRate:
+) -> MailingJobResponse:
     filters = notification.mode.model_dump()
     filters.update(banned=False)
-    results = await telegram_notification_service.send_message_to_users_by_filters(filters, notification.message)
-    return InfoRate.from_results(results)
+    return await telegram_notification_service.enqueue_message_to_users_by_filters(filters, notification.message)
+
+
+@messages_router_by_admin.get(
+    "/jobs/{mailing_id}",
+    response_model=MailingJobResponse,
+    description="Получает состояние рассылки: количество отправленных сообщений, скорость отправки и т.д.",
+)
+@inject
+async def get_mailing_job(
+    mailing_id: int,
+    telegram_notification_service: TelegramNotificationService = Depends(
+        Provide[Container.api_services_container.message_service]
+    ),
+) -> MailingJobResponse:
+    return await telegram_notification_service.get_mailing_job(mailing_id)
+
+
+@messages_router_by_admin.get(
+    "/jobs/{mailing_id}/recipients",
+    response_model=MailingRecipientsPaginateResponse,
+    description="Получает список получателей рассылки с результатами отправки сообщений.",
+)
+@inject
+async def get_mailing_job_recipients(
+    request: Request,
+    mailing_id: int,
+    recipient_status: MailingRecipientStatus | None = Query(default=None, alias="status"),
+    page: int = Query(default=1, ge=1),
+    limit: int = Query(default=20, ge=1),
+    telegram_notification_service: TelegramNotificationService = Depends(
+        Provide[Container.api_services_container.message_service]
+    ),
+    mailing_recipient_paginate: MailingRecipientPaginator = Depends(
+        Provide[Container.api_paginate_container.mailing_recipient_paginate]
+    ),
+) -> MailingRecipientsPaginateResponse:
+    filter_by = {"mailing_id": mailing_id, "status": recipient_status}
+    recipients = await telegram_notification_service.get_mailing_recipients_by_page(filter_by, page, limit)
+    return await mailing_recipient_paginate.paginate(recipients, page, limit, request.url.path, filter_by)
 
 
 @notification_router_by_token.post(
@@ -65,11 +116,10 @@ async def send_messages_to_users(
     ),
 ) -> InfoRate:
     await log.ainfo("Начало отправки сообщений для группы пользователей")
-    results = (
-        await telegram_notification_service.send_message_to_user_by_id_hash(message.id_hash, message.message)
-        for message in message_list.messages
+    results = await telegram_notification_service.send_messages_to_users_by_id_hashes(
+        [(message.id_hash, message.message) for message in message_list.messages]
     )
-    response = await InfoRate.from_results_async(results)
+    response = InfoRate.from_results(results)
     await log.ainfo("Конец отправки сообщений для группы пользователей")
     return response
 
@@ -1,62 +1,128 @@
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from src.api.auth import check_header_contains_token
-from src.api.schemas import TaskRequest, TaskResponse, TasksRequest, UserResponseToTaskRequest
+from src.api.schemas import (
+    TaskRequest,
+    TaskResponse,
+    TasksDeltaRequest,
+    TasksRequest,
+    TasksSyncResponse,
+    UserResponseToTaskRequest,
+)
 from src.api.services import ExternalSiteUserService, TaskService
 from src.api.services.messages import TelegramNotificationService
-from src.bot.keyboards import get_task_info_keyboard
-from src.core.db.models import Task, User
+from src.api.streaming import iter_json_array, validate_by_chunks
 from src.core.depends import Container
-from src.core.messages import display_task
-from src.core.services.notification import TelegramMessageTemplate
+from src.core.exceptions import BadRequestException
 
 tasks_router = APIRouter(dependencies=[Depends(check_header_contains_token)])
 task_read_router = APIRouter()
 task_write_router = APIRouter(dependencies=[Depends(check_header_contains_token)])
 task_response_router = APIRouter(dependencies=[Depends(check_header_contains_token)])
 
+task_list_adapter = TypeAdapter(list[TaskRequest])
 
-class TaskInfoMessageTemplate(TelegramMessageTemplate):
-    """Шаблон телеграм-сообщения с информацией о задаче."""
 
-    def __init__(self, task: Task, updated_task: bool):
-        self.task = task
-        self.text = display_task(task, updated_task)
+@tasks_router.post(
+    "",
+    description="Актуализирует список задач (полная синхронизация). "
+    "Если передан sync_token, он сохраняется как токен последней применённой синхронизации.",
+)
+@inject
+async def actualize_tasks(
+    tasks: TasksRequest,
+    sync_token: str | None = None,
+    task_service: TaskService = Depends(Provide[Container.api_services_container.task_service]),
+    telegram_notification_service: TelegramNotificationService = Depends(
+        Provide[Container.api_services_container.message_service]
+    ),
+    trigger_mailing_fields: str = Depends(Provide[Container.settings.provided.TRIGGER_MAILING_FIELDS]),
+) -> None:
+    new_tasks_ids, updated_tasks_ids = await task_service.actualize_objects(tasks.root, trigger_mailing_fields)
+    if sync_token is not None:
+        await task_service.set_sync_token(sync_token)
+    await telegram_notification_service.enqueue_task_mailings(
+        [(task_id, False) for task_id in new_tasks_ids] + [(task_id, True) for task_id in updated_tasks_ids]
+    )
 
-    async def render(self, user: User) -> dict:
-        """Возвращает словарь с атрибутами text и reply_markup телеграм-сообщения
-        с информацией о задаче, предназначенного для заданного пользователя.
-        """
-        site_user = user.external_user
-        if site_user is None:
-            return {}
 
-        return dict(
-            text=self.text,
-            reply_markup=await get_task_info_keyboard(self.task, site_user),
+@tasks_router.post(
+    "/stream",
+    description="Актуализирует список задач (полная синхронизация), читая тело запроса потоком. "
+    "Задачи проверяются и записываются порциями по мере получения, поэтому расход памяти "
+    "не зависит от размера списка. Формат тела запроса совпадает с POST /tasks.",
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/TaskRequest"}}}
+            },
+            "required": True,
+        }
+    },
+)
+@inject
+async def actualize_tasks_stream(
+    request: Request,
+    sync_token: str | None = None,
+    task_service: TaskService = Depends(Provide[Container.api_services_container.task_service]),
+    telegram_notification_service: TelegramNotificationService = Depends(
+        Provide[Container.api_services_container.message_service]
+    ),
+    trigger_mailing_fields: str = Depends(Provide[Container.settings.provided.TRIGGER_MAILING_FIELDS]),
+    chunk_size: int = Depends(Provide[Container.settings.provided.TASKS_STREAM_CHUNK_SIZE]),
+) -> None:
+    chunks = validate_by_chunks(iter_json_array(request.stream()), task_list_adapter, chunk_size)
+    try:
+        new_tasks_ids, updated_tasks_ids = await task_service.actualize_objects_by_chunks(
+            chunks, trigger_mailing_fields
         )
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors())
+    except ValueError as exc:
+        raise BadRequestException(str(exc))
+    if sync_token is not None:
+        await task_service.set_sync_token(sync_token)
+    await telegram_notification_service.enqueue_task_mailings(
+        [(task_id, False) for task_id in new_tasks_ids] + [(task_id, True) for task_id in updated_tasks_ids]
+    )
 
 
-@tasks_router.post("", description="Актуализирует список задач.")
+@tasks_router.get(
+    "/sync",
+    response_model=TasksSyncResponse,
+    description="Возвращает токен последней применённой синхронизации задач.",
+)
 @inject
-async def actualize_tasks(
-    tasks: TasksRequest,
+async def get_tasks_sync_token(
+    task_service: TaskService = Depends(Provide[Container.api_services_container.task_service]),
+) -> TasksSyncResponse:
+    return TasksSyncResponse(sync_token=await task_service.get_sync_token())
+
+
+@tasks_router.post(
+    "/sync",
+    response_model=TasksSyncResponse,
+    description="Применяет изменения задач, произошедшие после синхронизации previous_sync_token. "
+    "Если previous_sync_token не совпадает с последним применённым токеном, возвращает 409: "
+    "в этом случае нужна полная синхронизация через POST /tasks.",
+)
+@inject
+async def sync_tasks(
+    delta: TasksDeltaRequest,
     task_service: TaskService = Depends(Provide[Container.api_services_container.task_service]),
     telegram_notification_service: TelegramNotificationService = Depends(
         Provide[Container.api_services_container.message_service]
     ),
     trigger_mailing_fields: str = Depends(Provide[Container.settings.provided.TRIGGER_MAILING_FIELDS]),
-) -> None:
-    new_tasks_ids, updated_tasks_ids = await task_service.actualize_objects(tasks.root, Task, trigger_mailing_fields)
-    updated_tasks_ids_set = set(updated_tasks_ids)
-    mailing_category_tasks = await task_service.get_tasks_with_categories_by_tasks_ids(
-        new_tasks_ids + updated_tasks_ids
+) -> TasksSyncResponse:
+    new_tasks_ids, updated_tasks_ids = await task_service.apply_delta(delta, trigger_mailing_fields)
+    await telegram_notification_service.enqueue_task_mailings(
+        [(task_id, False) for task_id in new_tasks_ids] + [(task_id, True) for task_id in updated_tasks_ids]
     )
-    for task in mailing_category_tasks:
-        await telegram_notification_service.send_task_to_users_with_category(
-            task.category_id, TaskInfoMessageTemplate(task, task.id in updated_tasks_ids_set)
-        )
+    return TasksSyncResponse(sync_token=delta.sync_token)
 
 
 @tasks_router.get(
@@ -114,22 +180,9 @@ async def create_update_task(
     ),
     trigger_mailing_fields: str = Depends(Provide[Container.settings.provided.TRIGGER_MAILING_FIELDS]),
 ):
-    task_obj = await task_service.get_or_none(task.id, None)
-    trigger_fields_changed, new_task = False, False
-    if task_obj:
-        trigger_fields_changed = await task_service.update(
-            task_obj, trigger_mailing_fields, **task.model_dump(), is_archived=False
-        )
-    else:
-        await task_service.create(**task.model_dump())
-        new_task = True
-    if trigger_fields_changed or new_task:
-        task_with_category = await task_service.get_task_with_category_by_task_id(task.id)
-        if task_with_category:
-            await telegram_notification_service.send_task_to_users_with_category(
-                task_with_category.category_id,
-                TaskInfoMessageTemplate(task_with_category, not new_task),
-            )
+    result = await task_service.upsert(task, trigger_mailing_fields)
+    if result.inserted or result.changed:
+        await telegram_notification_service.enqueue_task_mailings([(result.id, result.changed)])
 
 
 @task_write_router.delete(
@@ -1,41 +1,136 @@
+from functools import partial
+
 from dependency_injector.wiring import Provide, inject
 from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 from telegram.ext import Application
 
-from src.bot import shutdown_bot, startup_bot
+from src.api.utils import create_token_for_main_admin
+from src.bot import shutdown_bot, start_bot, start_updates_fetching, stop_updates_fetching
+from src.bot.mailing import MailingWorkerPool
+from src.core.db import ScopedSession
 from src.core.depends import Container
+from src.core.enums import RunMode
+from src.core.services import (
+    BotStatusQueue,
+    CacheInvalidation,
+    LastInteractionBuffer,
+    LeaderElection,
+    ProcharityHTTPClient,
+    TelegramNotification,
+)
 from src.core.utils import set_ngrok
+from src.settings import Settings
 
 
 @inject
 async def startup(
     fastapi_app: FastAPI,
-    run_bot: bool,
+    run_mode: RunMode,
     bot: Application = Provide[Container.applications_container.telegram_bot],
     use_ngrok: bool = Provide[Container.settings.provided.USE_NGROK],
     bot_webhook_mode: bool = Provide[Container.settings.provided.BOT_WEBHOOK_MODE],
-    telegram_webhook_url: str = Provide[Container.settings.provided.telegram_webhook_url],
-    telegram_secret_token: str = Provide[Container.settings.provided.TELEGRAM_SECRET_TOKEN],
+    bot_status_queue: BotStatusQueue = Provide[Container.core_services_container.bot_status_queue],
+    last_interaction_buffer: LastInteractionBuffer = Provide[Container.core_services_container.last_interaction_buffer],
+    cache_invalidation: CacheInvalidation = Provide[Container.caches_container.cache_invalidation],
 ):
     if use_ngrok is True:
         set_ngrok()
-    if run_bot:
-        fastapi_app.state.bot_instance = await startup_bot(
-            bot=bot,
-            bot_webhook_mode=bot_webhook_mode,
-            telegram_webhook_url=telegram_webhook_url,
-            telegram_secret_token=telegram_secret_token,
-        )
+    cache_invalidation.start()
+    bot_status_queue.start()
+    if run_mode.runs_bot:
+        last_interaction_buffer.start()
+        fastapi_app.state.bot_instance = await start_bot(bot=bot, bot_webhook_mode=bot_webhook_mode)
+    if run_mode.runs_workers:
+        fastapi_app.state.mailing_worker_pool = startup_mailing_workers()
+    fastapi_app.state.leader_elections = startup_leader_elections(run_mode)
 
 
 @inject
 async def shutdown(
     fastapi_app: FastAPI,
-    run_bot: bool,
-    bot_webhook_mode: str = Provide[Container.settings.provided.BOT_WEBHOOK_MODE],
+    run_mode: RunMode,
+    bot_status_queue: BotStatusQueue = Provide[Container.core_services_container.bot_status_queue],
+    last_interaction_buffer: LastInteractionBuffer = Provide[Container.core_services_container.last_interaction_buffer],
+    procharity_http_client: ProcharityHTTPClient = Provide[Container.core_services_container.procharity_http_client],
+    cache_invalidation: CacheInvalidation = Provide[Container.caches_container.cache_invalidation],
+    session: ScopedSession = Provide[Container.database_connection_container.session],
 ):
-    if run_bot:
-        await shutdown_bot(
-            fastapi_app.state.bot_instance,
-            bot_webhook_mode=bot_webhook_mode,
+    for leader_election in fastapi_app.state.leader_elections:
+        await leader_election.stop()
+    if run_mode.runs_workers:
+        await fastapi_app.state.mailing_worker_pool.stop()
+    if run_mode.runs_bot:
+        await shutdown_bot(fastapi_app.state.bot_instance)
+        await last_interaction_buffer.stop()
+    await bot_status_queue.stop()
+    await cache_invalidation.stop()
+    await procharity_http_client.close()
+    # Закрывает общую сессию, использованную вне HTTP-запросов и обновлений бота
+    await session.remove()
+
+
+@inject
+def startup_mailing_workers(
+    sessionmaker: async_sessionmaker = Provide[Container.database_connection_container.sessionmaker],
+    telegram_notification: TelegramNotification = Provide[Container.core_services_container.telegram_notification],
+    bot_status_queue: BotStatusQueue = Provide[Container.core_services_container.bot_status_queue],
+    cache_invalidation: CacheInvalidation = Provide[Container.caches_container.cache_invalidation],
+    settings: Settings = Provide[Container.settings],
+) -> MailingWorkerPool:
+    """Запускает фоновые обработчики очереди рассылок."""
+    mailing_worker_pool = MailingWorkerPool(
+        sessionmaker=sessionmaker,
+        telegram_notification=telegram_notification,
+        bot_status_queue=bot_status_queue,
+        cache_invalidation=cache_invalidation,
+        workers_count=settings.MAILING_WORKERS,
+        batch_size=settings.MAILING_BATCH_SIZE,
+        poll_interval=settings.MAILING_POLL_INTERVAL,
+        lease_time=settings.MAILING_LEASE_TIME,
+        max_attempts=settings.MAILING_MAX_ATTEMPTS,
+    )
+    mailing_worker_pool.start()
+    return mailing_worker_pool
+
+
+@inject
+def startup_leader_elections(
+    run_mode: RunMode,
+    bot: Application = Provide[Container.applications_container.telegram_bot],
+    engine: AsyncEngine = Provide[Container.database_connection_container.engine],
+    settings: Settings = Provide[Container.settings],
+) -> list[LeaderElection]:
+    """Запускает выбор ведущих процессов для задач, которые среди всех процессов приложения
+    должен выполнять только один: получение обновлений бота в режиме polling и регистрация
+    webhook, создание приглашения главного администратора.
+    """
+    leader_elections = []
+    if run_mode.runs_bot:
+        leader_elections.append(
+            LeaderElection(
+                engine=engine,
+                name="bot_updates",
+                retry_interval=settings.LEADER_ELECTION_INTERVAL,
+                on_elected=partial(
+                    start_updates_fetching,
+                    bot,
+                    settings.BOT_WEBHOOK_MODE,
+                    settings.telegram_webhook_url,
+                    settings.TELEGRAM_SECRET_TOKEN,
+                ),
+                on_demoted=partial(stop_updates_fetching, bot),
+            )
+        )
+    if run_mode.runs_api:
+        leader_elections.append(
+            LeaderElection(
+                engine=engine,
+                name="main_admin_token",
+                retry_interval=settings.LEADER_ELECTION_INTERVAL,
+                on_elected=create_token_for_main_admin,
+            )
         )
+    for leader_election in leader_elections:
+        leader_election.start()
+    return leader_elections
@@ -4,13 +4,15 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from src.api.constants import API_DESCRIPTION
-from src.api.utils import create_token_for_main_admin
+from src.core.db import ScopedSession
+from src.core.db.middleware import SessionScopeMiddleware
+from src.core.enums import RunMode
 from src.core.logging.middleware import LoggingMiddleware
 from src.core.logging.setup import setup_logging
 from src.settings import Settings
 
 
-def add_middleware(fastapi_app: FastAPI):
+def add_middleware(fastapi_app: FastAPI, session: ScopedSession):
     origins = ["*"]
     fastapi_app.add_middleware(
         CORSMiddleware,
@@ -19,43 +21,49 @@ def add_middleware(fastapi_app: FastAPI):
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    fastapi_app.add_middleware(SessionScopeMiddleware, session=session)
     setup_logging()
     fastapi_app.add_middleware(LoggingMiddleware)
     fastapi_app.add_middleware(CorrelationIdMiddleware)
 
 
-def include_router(fastapi_app: FastAPI):
-    from src.api.router import api_router
+def include_router(fastapi_app: FastAPI, run_mode: RunMode):
+    from src.api.router import api_router, service_router, telegram_router
 
-    fastapi_app.include_router(api_router)
+    fastapi_app.include_router(api_router if run_mode.runs_api else service_router)
+    if run_mode.runs_bot:
+        fastapi_app.include_router(telegram_router)
 
 
-def set_events(fastapi_app: FastAPI, run_bot: bool):
+def set_events(fastapi_app: FastAPI, run_mode: RunMode):
     @fastapi_app.on_event("startup")
     async def on_startup():
         from .events import startup
 
-        await startup(fastapi_app, run_bot)
-        await create_token_for_main_admin()
+        await startup(fastapi_app, run_mode)
 
     @fastapi_app.on_event("shutdown")
     async def on_shutdown():
         """Действия после остановки сервера."""
         from .events import shutdown
 
-        await shutdown(fastapi_app, run_bot)
+        await shutdown(fastapi_app, run_mode)
 
 
 def init_fastapi(
     fastapi_app: FastAPI,
     settings: Settings,
-    run_bot: bool,
+    session: ScopedSession,
+    run_mode: RunMode,
 ) -> FastAPI:
-    """Инициализация приложения FastAPI."""
+    """Инициализация приложения FastAPI.
 
-    add_middleware(fastapi_app)
-    include_router(fastapi_app)
-    set_events(fastapi_app, run_bot)
+    Набор маршрутов и фоновых задач определяется ролью процесса run_mode.
+    """
+
+    add_middleware(fastapi_app, session)
+    include_router(fastapi_app, run_mode)
+    set_events(fastapi_app, run_mode)
 
     fastapi_app.description = API_DESCRIPTION
 
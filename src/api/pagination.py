@@ -1,8 +1,14 @@
 import math
 from typing import Any, Generic, TypeVar
 
-from src.core.db.models import AdminUser, TechMessage, User
-from src.core.db.repository import AbstractRepository, AdminUserRepository, TechMessageRepository, UserRepository
+from src.core.db.models import AdminUser, MailingRecipient, TechMessage, User
+from src.core.db.repository import (
+    AbstractRepository,
+    AdminUserRepository,
+    MailingRecipientRepository,
+    TechMessageRepository,
+    UserRepository,
+)
 from src.core.db.repository.base import FilterableRepository
 
 DatabaseModel = TypeVar("DatabaseModel")
@@ -74,3 +80,10 @@ class TechMessagePaginator(FilterablePaginator[TechMessage]):
 
     def __init__(self, repository: TechMessageRepository) -> None:
         super().__init__(repository)
+
+
+class MailingRecipientPaginator(FilterablePaginator[MailingRecipient]):
+    """Класс для пагинации и фильтрации данных из модели MailingRecipient."""
+
+    def __init__(self, repository: MailingRecipientRepository) -> None:
+        super().__init__(repository)
@@ -28,8 +28,15 @@ api_router.include_router(tasks_router, prefix="/tasks", tags=["Content"])
 api_router.include_router(task_read_router, prefix="/task", tags=["Content"])
 api_router.include_router(task_write_router, prefix="/task", tags=["Content"])
 api_router.include_router(task_response_router, prefix="/task_response", tags=["Content"])
-api_router.include_router(telegram_webhook_router, prefix="/telegram", tags=["Telegram"])
 api_router.include_router(admin_auth_router, prefix="/auth", tags=["AdminAuth"])
 api_router.include_router(admin_user_router, prefix="/admins", tags=["Admins"])
 api_router.include_router(site_user_router, prefix="/auth/external_user_registration", tags=["ExternalSiteUser"])
 api_router.include_router(feedback_router, prefix="/feedback", tags=["Feedback Form"])
+
+# Маршруты процессов, в которых не запущено API: проверка состояния процесса
+service_router = APIRouter(prefix=settings.ROOT_PATH)
+service_router.include_router(health_check_router, prefix="/health_check", tags=["Healthcheck"])
+
+# Маршруты процесса бота: получение обновлений в режиме webhook
+telegram_router = APIRouter(prefix=settings.ROOT_PATH)
+telegram_router.include_router(telegram_webhook_router, prefix="/telegram", tags=["Telegram"])
@@ -9,16 +9,35 @@ from .external_site_user import (
     ExternalSiteVolunteerRequest,
 )
 from .feedback import FeedbackSchema
-from .health_check import BotStatus, CommitStatus, DBStatus, HealthCheck
+from .health_check import (
+    BotStatus,
+    BotUpdatesStatus,
+    CacheStats,
+    CachesStatus,
+    CommitStatus,
+    DBStatus,
+    HealthCheck,
+    TaskRenderCacheStatus,
+)
 from .notification import (
     InfoRate,
+    MailingJobResponse,
+    MailingRecipientResponse,
+    MailingRecipientsPaginateResponse,
     Message,
     MessageList,
     TelegramNotificationByFilterRequest,
     TelegramNotificationRequest,
     TelegramNotificationToGroupRequest,
 )
-from .tasks import TaskRequest, TaskResponse, TasksRequest, UserResponseToTaskRequest
+from .tasks import (
+    TaskRequest,
+    TaskResponse,
+    TasksDeltaRequest,
+    TasksRequest,
+    TasksSyncResponse,
+    UserResponseToTaskRequest,
+)
 from .tech_messages import TechMessagePaginateResponse, TechMessageRequest, TechMessageResponce
 from .token_schemas import TokenCheckResponse
 from .users import UserResponse, UsersPaginatedResponse
@@ -39,10 +58,17 @@ __all__ = (
     "ExternalSiteFundPartialUpdate",
     "ExternalSiteVolunteerPartialUpdate",
     "BotStatus",
+    "BotUpdatesStatus",
+    "CacheStats",
+    "CachesStatus",
     "CommitStatus",
     "DBStatus",
     "HealthCheck",
+    "TaskRenderCacheStatus",
     "InfoRate",
+    "MailingJobResponse",
+    "MailingRecipientResponse",
+    "MailingRecipientsPaginateResponse",
     "Message",
     "MessageList",
     "ReasonCancelingStatistics",
@@ -51,7 +77,9 @@ __all__ = (
     "TelegramNotificationToGroupRequest",
     "TaskRequest",
     "TaskResponse",
+    "TasksDeltaRequest",
     "TasksRequest",
+    "TasksSyncResponse",
     "TokenCheckResponse",
     "FeedbackSchema",
     "UserResponse",
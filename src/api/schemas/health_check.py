@@ -12,6 +12,15 @@ class DBStatus(TypedDict):
     db_connection_error: NotRequired[str]
 
 
+class BotUpdatesStatus(TypedDict):
+    """Класс ответа с метриками обработки обновлений бота."""
+
+    queue: int
+    pending: int
+    in_progress: int
+    handlers: dict[str, dict[str, float]]
+
+
 class BotStatus(TypedDict):
     """Класс ответа для проверки работы бота."""
 
@@ -19,6 +28,7 @@ class BotStatus(TypedDict):
     method: NotRequired[str]
     url: NotRequired[str]
     error: NotRequired[str]
+    updates: NotRequired[BotUpdatesStatus]
 
 
 class CommitStatus(TypedDict):
@@ -30,9 +40,31 @@ class CommitStatus(TypedDict):
     commit_error: NotRequired[str]
 
 
+class CacheStats(TypedDict):
+    """Класс ответа со статистикой кэша."""
+
+    size: int
+    hits: int
+    misses: int
+
+
+class TaskRenderCacheStatus(TypedDict):
+    """Класс ответа со статистикой кэша карточек задач и клавиатур к ним."""
+
+    texts: CacheStats
+    keyboards: CacheStats
+
+
+class CachesStatus(TypedDict):
+    """Класс ответа со статистикой кэшей процесса."""
+
+    task_render: TaskRenderCacheStatus
+
+
 class HealthCheck(ResponseBase):
     """Класс модели запроса для проверки работы бота."""
 
     db: DBStatus
     bot: BotStatus
     git: CommitStatus
+    caches: CachesStatus
@@ -1,9 +1,10 @@
+from datetime import datetime
 from typing import AsyncIterable, Iterable, Self
 
 from pydantic import BaseModel, Field
 
-from src.api.schemas.base import RequestBase
-from src.core.enums import TelegramNotificationUsersGroups
+from src.api.schemas.base import PaginateBase, RequestBase, ResponseBase
+from src.core.enums import MailingRecipientStatus, MailingType, TelegramNotificationUsersGroups
 
 from .users import UserFilter
 
@@ -75,3 +76,35 @@ class InfoRate(BaseModel):
         async for res in results:
             rate.add_result(*res)
         return rate
+
+
+class MailingJobResponse(ResponseBase):
+    """Состояние рассылки, выполняемой в фоновом режиме."""
+
+    id: int = Field(..., description="Идентификатор рассылки")
+    type: MailingType
+    created_at: datetime
+    total: int = Field(0, description="Общее количество получателей")
+    sent: int = Field(0, description="Количество отправленных сообщений")
+    failed: int = Field(0, description="Количество неотправленных сообщений")
+    pending: int = Field(0, description="Количество сообщений, ожидающих отправки")
+    throughput: float | None = Field(None, description="Средняя скорость отправки, сообщений в секунду")
+    eta: float | None = Field(None, description="Оценка времени до завершения рассылки, в секундах")
+    finished: bool = Field(False, description="Рассылка завершена")
+
+
+class MailingRecipientResponse(ResponseBase):
+    """Результат отправки сообщения рассылки получателю."""
+
+    user_id: int
+    telegram_id: int
+    status: MailingRecipientStatus
+    attempts: int
+    sent_at: datetime | None
+    error: str | None
+
+
+class MailingRecipientsPaginateResponse(PaginateBase):
+    """Постраничный список получателей рассылки."""
+
+    result: list[MailingRecipientResponse] | None
@@ -84,6 +84,29 @@ class TasksRequest(RootModel[list[TaskRequest]]):
     root: list[TaskRequest]
 
 
+class TasksDeltaRequest(RequestBase):
+    """Схема запроса на инкрементальную синхронизацию задач."""
+
+    previous_sync_token: str | None = Field(
+        None,
+        examples=["1700000000"],
+        description="Токен синхронизации, после которой сформированы изменения. "
+        "Должен совпадать с последним применённым токеном.",
+    )
+    sync_token: str = Field(..., examples=["1700000060"], description="Токен этой синхронизации.")
+    created: list[TaskRequest] = Field([], description="Новые задачи.")
+    updated: list[TaskRequest] = Field([], description="Изменённые задачи.")
+    archived: list[PositiveInt] = Field([], examples=[[1, 2]], description="ID задач, снятых с публикации.")
+
+
+class TasksSyncResponse(ResponseBase):
+    """Схема ответа с токеном последней применённой синхронизации задач."""
+
+    sync_token: str | None = Field(
+        ..., examples=["1700000060"], description="Токен последней применённой синхронизации задач."
+    )
+
+
 class TaskResponse(ResponseBase, TaskCommonFieldsMixin):
     """Схема ответа для модели Task."""
 
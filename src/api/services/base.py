@@ -1,9 +1,13 @@
 import abc
+from collections.abc import AsyncIterable, Sequence
 from typing import Any
 
+import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.db.repository import ContentRepository
+from src.core.db.repository import ContentRepository, UpsertResult
+
+log = structlog.get_logger()
 
 
 class ContentService(abc.ABC):
@@ -16,14 +20,13 @@ class ContentService(abc.ABC):
     async def actualize_objects(
         self,
         objects: list[Any],
-        model_class: Any,
         trigger_fields: list[str] | None = None,
-    ) -> tuple[list[Any], list[Any]]:
-        """Актуализирует объекты в базе данных.
+    ) -> tuple[list[int], list[int]]:
+        """Актуализирует объекты в базе данных: отсутствующие в objects объекты архивируются,
+        остальные добавляются или обновляются одним запросом.
 
         Args:
             objects: Список pydantic объектов для обновления.
-            model_class: Класс соответствующей модели объектов.
             trigger_fields: Список полей, изменение которых считается обновлением объекта.
 
         Returns:
@@ -32,27 +35,60 @@ class ContentService(abc.ABC):
             updated_ids: Список id объектов, у которых произошло изменение хотя бы в одном из
             триггерных полей, заданных trigger_fields
         """
-        to_create, to_update, updated_ids = [], [], []
-        ids = [obj.id for obj in objects]
+
+        async def chunks():
+            yield objects
+
+        return await self.actualize_objects_by_chunks(chunks(), trigger_fields)
+
+    async def actualize_objects_by_chunks(
+        self,
+        chunks: AsyncIterable[Sequence[Any]],
+        trigger_fields: list[str] | None = None,
+    ) -> tuple[list[int], list[int]]:
+        """Актуализирует объекты в базе данных, получая их порциями (например, при потоковом
+        чтении запроса). Каждая порция записывается сразу после получения, объекты, отсутствующие
+        во всех порциях, архивируются в конце. Все изменения применяются в одной транзакции.
+
+        Args:
+            chunks: Порции pydantic объектов для обновления.
+            trigger_fields: Список полей, изменение которых считается обновлением объекта.
+
+        Returns:
+            Кортеж из двух списков (created_ids, updated_ids), как в actualize_objects.
+        """
+        ids, created_ids, updated_ids, modified_ids = [], [], [], []
         async with self._session as session:
-            await self._repository.archive_by_ids(ids, commit=False)
-            already_have = await self._repository.get_by_ids(ids)
-            for obj in objects:
-                obj_dict = obj.dict()
-                if obj.id not in already_have:
-                    to_create.append(model_class(**obj_dict, is_archived=False))
-                else:
-                    to_update.append({**obj_dict, "is_archived": False})
-                    if trigger_fields:
-                        filter = {key: obj_dict[key] for key in trigger_fields if key in obj_dict}
-                        if not await self._repository.get_by_filter(id=obj.id, **filter):
-                            updated_ids.append(obj.id)
-            if to_create:
-                await self._repository.create_all(to_create, commit=False)
-            if to_update:
-                await self._repository.update_all(to_update, commit=False)
+            async for objects in chunks:
+                results = await self._repository.upsert(
+                    [obj.model_dump() for obj in objects], trigger_fields or [], commit=False
+                )
+                ids.extend(obj.id for obj in objects)
+                created_ids.extend(result.id for result in results if result.inserted)
+                updated_ids.extend(result.id for result in results if result.changed)
+                modified_ids.extend(result.id for result in results if result.modified)
+            archived_ids = await self._repository.archive_by_ids(ids, commit=False)
             await session.commit()
-            return [obj.id for obj in to_create], updated_ids
+        await log.ainfo(f"{type(self).__name__}: заархивировано объектов: {len(archived_ids)}.")
+        self._invalidate_caches([*created_ids, *modified_ids, *archived_ids])
+        return created_ids, updated_ids
+
+    async def upsert(self, obj: Any, trigger_fields: list[str] | None = None) -> UpsertResult:
+        """Добавляет новый или обновляет существующий объект.
+
+        Args:
+            obj: pydantic объект.
+            trigger_fields: Список полей, изменение которых считается обновлением объекта.
+        """
+        (result,) = await self._repository.upsert([obj.model_dump()], trigger_fields or [])
+        if result.inserted or result.modified:
+            self._invalidate_caches([result.id])
+        return result
+
+    def _invalidate_caches(self, ids: list[int]) -> None:
+        """Вызывается после добавления, изменения или архивирования объектов с заданными id.
+        Позволяет сервисам сбрасывать кэши, зависящие от этих объектов.
+        """
 
     async def get_all(self) -> list[Any]:
         return await self._repository.get_all()
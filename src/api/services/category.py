@@ -1,11 +1,42 @@
+from collections.abc import AsyncIterable, Sequence
+from typing import Any
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.services.base import ContentService
+from src.core.category_tree import CategoryTreeCache
 from src.core.db.repository.category import CategoryRepository
+from src.core.enums import CacheName
+from src.core.services import CacheInvalidation
 
 
 class CategoryService(ContentService):
     """Сервис для работы с моделью Category."""
 
-    def __init__(self, category_repository: CategoryRepository, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        category_repository: CategoryRepository,
+        session: AsyncSession,
+        category_tree_cache: CategoryTreeCache,
+        cache_invalidation: CacheInvalidation,
+    ) -> None:
         super().__init__(category_repository, session)
+        self._category_tree_cache = category_tree_cache
+        self._cache_invalidation = cache_invalidation
+
+    async def actualize_objects_by_chunks(
+        self,
+        chunks: AsyncIterable[Sequence[Any]],
+        trigger_fields: list[str] | None = None,
+    ) -> tuple[list[int], list[int]]:
+        """Актуализирует категории, перестраивает снимок дерева категорий бота
+        и сбрасывает снимки остальных процессов.
+        """
+        result = await super().actualize_objects_by_chunks(chunks, trigger_fields)
+        await self._category_tree_cache.rebuild(self._repository)
+        self._cache_invalidation.publish(CacheName.CATEGORY_TREE)
+        return result
+
+    def _invalidate_caches(self, ids: list[int]) -> None:
+        # Названия категорий выводятся в карточках задач
+        self._cache_invalidation.invalidate(CacheName.TASK_RENDER)
@@ -8,8 +8,9 @@ from src.api.schemas import (
 )
 from src.core.db.models import ExternalSiteUser
 from src.core.db.repository import ExternalSiteUserRepository, TaskRepository, UserRepository
-from src.core.enums import UserResponseAction, UserRoles
+from src.core.enums import CacheName, UserResponseAction, UserRoles
 from src.core.exceptions import BadRequestException
+from src.core.services import CacheInvalidation
 
 
 class ExternalSiteUserService:
@@ -21,11 +22,13 @@ class ExternalSiteUserService:
         site_user_repository: ExternalSiteUserRepository,
         task_repository: TaskRepository,
         session: AsyncSession,
+        cache_invalidation: CacheInvalidation,
     ) -> None:
         self._user_repository: UserRepository = user_repository
         self._site_user_repository: ExternalSiteUserRepository = site_user_repository
         self._task_repository: TaskRepository = task_repository
         self._session: AsyncSession = session
+        self._cache_invalidation: CacheInvalidation = cache_invalidation
 
     async def register(self, site_user_schema: ExternalSiteVolunteerRequest | ExternalSiteFundRequest) -> None:
         """Создаёт в БД нового пользователя сайта или обновляет данные существующего."""
@@ -64,6 +67,7 @@ class ExternalSiteUserService:
 
             await self._user_repository.update(user.id, user)
             await self._user_repository.set_categories_to_user(user.id, site_user.specializations)
+        self._cache_invalidation.invalidate(CacheName.IDENTITY, [site_user.id])
 
     async def partial_update(
         self, external_id: int, site_user_schema: ExternalSiteVolunteerPartialUpdate | ExternalSiteFundPartialUpdate
@@ -87,10 +91,12 @@ class ExternalSiteUserService:
 
             if site_user.role == UserRoles.VOLUNTEER:
                 await self._user_repository.set_categories_to_user(user.id, site_user.specializations)
+        self._cache_invalidation.invalidate(CacheName.IDENTITY, [site_user.id])
 
     async def archive(self, external_id: int) -> None:
         """Архивирует пользователя сайта и удаляет его связь с ботом."""
         await self._site_user_repository.archive(external_id)
+        self._cache_invalidation.invalidate(CacheName.IDENTITY)
 
     async def change_user_response_to_task(self, site_user_id: int, task_id: int, action: UserResponseAction) -> None:
         """Изменяет отклик заданного пользователя на заданную задачу."""
@@ -6,17 +6,22 @@ from sqlalchemy.exc import SQLAlchemyError
 from telegram.ext import Application
 
 from src.api.constants import DATE_TIME_FORMAT
-from src.api.schemas import BotStatus, CommitStatus, DBStatus
+from src.api.schemas import BotStatus, BotUpdatesStatus, CachesStatus, CommitStatus, DBStatus
+from src.bot.update_processor import ChatOrderedUpdateProcessor
 from src.core.db.repository import TaskRepository
+from src.core.render_cache import TaskRenderCache
 from src.settings import settings
 
 
 class HealthCheckService:
     """Сервис для проверки работы бота."""
 
-    def __init__(self, task_repository: TaskRepository, telegram_bot: Application) -> None:
+    def __init__(
+        self, task_repository: TaskRepository, telegram_bot: Application, task_render_cache: TaskRenderCache
+    ) -> None:
         self._repository = task_repository
         self._bot = telegram_bot
+        self._task_render_cache = task_render_cache
 
     async def check_bot(self) -> BotStatus:
         try:
@@ -27,11 +32,26 @@ class HealthCheckService:
         if settings.BOT_WEBHOOK_MODE:
             method = "webhooks"
             bot_status: BotStatus = {"status": True, "method": method, "url": webhook_info.url}
-            return bot_status
-        method = "pulling"
-        bot_status: BotStatus = {"status": True, "method": method}
+        else:
+            method = "pulling"
+            bot_status: BotStatus = {"status": True, "method": method}
+        if self._bot.running and isinstance(self._bot.update_processor, ChatOrderedUpdateProcessor):
+            bot_status["updates"] = self.get_updates_status()
         return bot_status
 
+    def get_updates_status(self) -> BotUpdatesStatus:
+        """Возвращает размер очереди обновлений бота и метрики их обработки."""
+        updates_status: BotUpdatesStatus = {
+            "queue": self._bot.update_queue.qsize(),
+            **self._bot.update_processor.metrics.snapshot(),
+        }
+        return updates_status
+
+    def get_caches_status(self) -> CachesStatus:
+        """Возвращает размеры кэшей процесса и счётчики попаданий и промахов."""
+        caches_status: CachesStatus = {"task_render": self._task_render_cache.stats()}
+        return caches_status
+
     @cache
     def get_last_commit(self) -> CommitStatus:
         """В режиме dev - возвращает сведения о последнем коммите, или берет данные из переменных окружения."""
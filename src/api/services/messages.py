@@ -1,12 +1,13 @@
-from typing import Any
+from typing import Any, Iterable, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import contains_eager
 
-from src.core.db.models import Category, ExternalSiteUser, User
-from src.core.db.repository import UserRepository
-from src.core.services.notification import TelegramMessageTemplate, TelegramNotification
+from src.core.db.models import ExternalSiteUser, Mailing, MailingRecipient, User
+from src.core.db.repository import MailingRecipientRepository, MailingRepository, UserRepository
+from src.core.enums import MailingRecipientStatus
+from src.core.services.bot_status import BotStatusQueue
+from src.core.services.notification import TelegramNotification
 
 
 class TelegramNotificationService:
@@ -18,15 +19,64 @@ class TelegramNotificationService:
         session: AsyncSession,
         telegram_notification: TelegramNotification,
         user_repository: UserRepository,
+        mailing_repository: MailingRepository,
+        mailing_recipient_repository: MailingRecipientRepository,
+        bot_status_queue: BotStatusQueue,
     ) -> None:
         self._session = session
         self._telegram_notification = telegram_notification
         self._user_repository = user_repository
+        self._mailing_repository = mailing_repository
+        self._mailing_recipient_repository = mailing_recipient_repository
+        self._bot_status_queue = bot_status_queue
 
-    async def send_message_to_users_by_filters(self, filters: dict[str, Any], message: str) -> tuple[bool, str]:
-        """Отправляет сообщение пользователям, соответствующим заданным критериям (фильтрам)"""
-        users = await self._user_repository.get_filtered_objects_by_page(filters, 0, 0)
-        return await self._telegram_notification.send_messages(users=users, message=message)
+    async def enqueue_message_to_users_by_filters(self, filters: dict[str, Any], message: str) -> dict:
+        """Ставит в очередь отправку сообщения пользователям, соответствующим заданным
+        критериям (фильтрам), и возвращает состояние созданной рассылки.
+        Сообщения отправляются фоновыми обработчиками очереди рассылок.
+        """
+        recipients = self._user_repository.get_recipients_by_filter_statement(filters)
+        mailing = await self._mailing_repository.create_message_mailing(message, recipients)
+        return await self._get_mailing_job(mailing)
+
+    async def get_mailing_job(self, mailing_id: int) -> dict:
+        """Возвращает состояние рассылки: количество отправленных, неотправленных
+        и ожидающих отправки сообщений, среднюю скорость отправки и оценку времени до завершения.
+        """
+        return await self._get_mailing_job(await self._mailing_repository.get(mailing_id))
+
+    async def _get_mailing_job(self, mailing: Mailing) -> dict:
+        statistics = await self._mailing_repository.get_recipients_statistics(mailing)
+        sent, sent_updated_at = statistics.get(MailingRecipientStatus.SENT, (0, None))
+        failed, failed_updated_at = statistics.get(MailingRecipientStatus.FAILED, (0, None))
+        pending = sum(
+            statistics.get(status, (0, None))[0]
+            for status in (MailingRecipientStatus.PENDING, MailingRecipientStatus.PROCESSING)
+        )
+        throughput = eta = None
+        last_processed_at = max(filter(None, (sent_updated_at, failed_updated_at)), default=None)
+        if last_processed_at is not None and last_processed_at > mailing.created_at:
+            throughput = (sent + failed) / (last_processed_at - mailing.created_at).total_seconds()
+            eta = pending / throughput if pending else 0.0
+        return dict(
+            id=mailing.id,
+            type=mailing.type,
+            created_at=mailing.created_at,
+            total=sent + failed + pending,
+            sent=sent,
+            failed=failed,
+            pending=pending,
+            throughput=throughput,
+            eta=eta,
+            finished=not pending,
+        )
+
+    async def get_mailing_recipients_by_page(
+        self, filter_by: dict[str, Any], page: int, limit: int
+    ) -> Sequence[MailingRecipient]:
+        """Возвращает получателей рассылки с результатами отправки, ограниченных параметрами page и limit."""
+        await self._mailing_repository.get(filter_by["mailing_id"])
+        return await self._mailing_recipient_repository.get_filtered_objects_by_page(filter_by, page, limit)
 
     async def send_message_to_user_by_id_hash(self, id_hash: str, message: str) -> tuple[bool, str]:
         """Отправляет сообщение пользователю по указанному id_hash"""
@@ -37,6 +87,34 @@ class TelegramNotificationService:
             return False, "Телеграм пользователя не найден."
         return await self._telegram_notification.send_message(telegram_id=site_user.user.telegram_id, message=message)
 
+    async def send_messages_to_users_by_id_hashes(
+        self, messages: Sequence[tuple[str, str]]
+    ) -> list[tuple[bool, str]]:
+        """Отправляет персональные сообщения пользователям по id_hash.
+        Пользователи загружаются одним запросом, а сообщения отправляются одновременно
+        с учётом ограничений Telegram. Результаты возвращаются в порядке сообщений.
+
+        Args:
+            messages: Пары (id_hash пользователя, текст сообщения).
+        """
+        rows = await self._session.execute(
+            select(ExternalSiteUser.id_hash, User.telegram_id)
+            .outerjoin(ExternalSiteUser.user)
+            .where(ExternalSiteUser.id_hash.in_({id_hash for id_hash, _ in messages}))
+        )
+        telegram_ids = dict(rows.tuples().all())
+
+        async def send(id_hash: str, message: str) -> tuple[bool, str]:
+            if id_hash not in telegram_ids:
+                return False, "Пользователь не найден."
+            if telegram_ids[id_hash] is None:
+                return False, "Телеграм пользователя не найден."
+            return await self._telegram_notification.send_message(telegram_id=telegram_ids[id_hash], message=message)
+
+        results = await self._telegram_notification.map(lambda item: send(*item), messages)
+        await self._ban_blocked_users()
+        return results
+
     async def send_message_by_telegram_id(self, telegram_id: int, message: str) -> tuple[bool, str]:
         """Отправляет сообщение пользователю по указанному telegram_id"""
         user = await self._session.scalar(select(User).where(User.telegram_id == telegram_id))
@@ -44,22 +122,21 @@ class TelegramNotificationService:
             return False, "Пользователь не найден."
         return await self._telegram_notification.send_message(telegram_id=user.telegram_id, message=message)
 
-    async def send_task_to_users_with_category(self, category_id: int, template: TelegramMessageTemplate):
-        """Отправляет задание всем зарегистрированным пользователям, подписанным на заданную категорию.
+    async def enqueue_task_mailings(self, tasks: Iterable[tuple[int, bool]]) -> None:
+        """Ставит в очередь отправки задания для всех зарегистрированных пользователей,
+        подписанных на категории этих заданий. Каждый пользователь получит одно сообщение
+        со всеми заданиями из своих категорий.
+        Сообщения отправляются фоновыми обработчиками очереди рассылок.
 
         Args:
-            category_id: идентификатор категории, подписчикам которой отправится сообщение;
-            template: шаблон сообщения.
+            tasks: пары (id задания, признак обновления задания).
         """
-        qr = await self._session.scalars(
-            select(Category)
-            .join(Category.users)
-            .join(User.external_user)
-            .options(contains_eager(Category.users).contains_eager(User.external_user))
-            .where(User.external_user is not None)
-            .where(User.has_mailing.is_(True) & User.banned.is_(False))
-            .where(Category.id == category_id)
-        )
-        if (category := qr.first()) is None:
-            return
-        await self._telegram_notification.send_messages_by_template(category.users, template)
+        await self._mailing_repository.create_task_mailing(tasks)
+
+    async def _ban_blocked_users(self) -> None:
+        """Помечает заблокировавших бота пользователей, выявленных при рассылке,
+        и ставит в очередь отправку их статуса бота на сайт.
+        """
+        blocked_telegram_ids = self._telegram_notification.pop_blocked_telegram_ids()
+        if blocked_telegram_ids:
+            self._bot_status_queue.put(await self._user_repository.ban_by_telegram_ids(blocked_telegram_ids))
@@ -1,15 +1,66 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.schemas import TasksDeltaRequest
 from src.api.services import ContentService
 from src.core.db.models import Task
-from src.core.db.repository import TaskRepository
+from src.core.db.repository import SyncTokenRepository, TaskRepository
+from src.core.enums import CacheName, SyncStream
+from src.core.exceptions import SyncTokenConflict
+from src.core.services import CacheInvalidation
 
 
 class TaskService(ContentService):
     """Сервис для работы с моделью Task."""
 
-    def __init__(self, task_repository: TaskRepository, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        task_repository: TaskRepository,
+        sync_token_repository: SyncTokenRepository,
+        session: AsyncSession,
+        cache_invalidation: CacheInvalidation,
+    ) -> None:
         super().__init__(task_repository, session)
+        self._sync_token_repository = sync_token_repository
+        self._cache_invalidation = cache_invalidation
+
+    async def get_sync_token(self) -> str | None:
+        """Возвращает токен последней применённой синхронизации задач."""
+        return await self._sync_token_repository.get_token(SyncStream.TASKS)
+
+    async def set_sync_token(self, sync_token: str) -> None:
+        """Сохраняет токен синхронизации задач (например, после полной синхронизации)."""
+        await self._sync_token_repository.set_token(SyncStream.TASKS, sync_token)
+
+    async def apply_delta(
+        self, delta: TasksDeltaRequest, trigger_fields: list[str] | None = None
+    ) -> tuple[list[int], list[int]]:
+        """Применяет изменения задач, произошедшие на сайте после синхронизации delta.previous_sync_token.
+        Новые и изменённые задачи добавляются или обновляются, задачи из delta.archived архивируются.
+        Если delta.previous_sync_token не совпадает с токеном последней применённой синхронизации,
+        возбуждает SyncTokenConflict: пропущенные изменения восстанавливаются только полной синхронизацией.
+
+        Returns:
+            Кортеж из двух списков (created_ids, updated_ids), как в actualize_objects.
+        """
+        objects = [*delta.created, *delta.updated]
+        async with self._session as session:
+            sync_token = await self._sync_token_repository.get_token(SyncStream.TASKS, for_update=True)
+            if sync_token != delta.previous_sync_token:
+                raise SyncTokenConflict(sync_token)
+            results = await self._repository.upsert(
+                [obj.model_dump() for obj in objects], trigger_fields or [], commit=False
+            )
+            archived_ids = []
+            if delta.archived:
+                archived_ids = await self._repository.archive_selected(delta.archived, commit=False)
+            await self._sync_token_repository.set_token(SyncStream.TASKS, delta.sync_token, commit=False)
+            await session.commit()
+        self._invalidate_caches(
+            [*(result.id for result in results if result.inserted or result.modified), *archived_ids]
+        )
+        return [result.id for result in results if result.inserted], [
+            result.id for result in results if result.changed
+        ]
 
     async def get(self, id: int, *, is_archived: bool | None = False) -> Task:
         """Получает задачу по её ID.
@@ -32,19 +83,8 @@ class TaskService(ContentService):
     async def get_tasks_by_filter(self, **filter_by) -> list[Task]:
         return await self._repository.get_tasks_by_filter(**filter_by)
 
-    async def create(self, **attrs):
-        """Создание новой задачи."""
-        return await self._repository.create(Task(**attrs))
-
-    async def update(self, task: Task, trigger_fields: list[str] = [], **attrs) -> bool:
-        """Обновление задачи значениями attrs.
-        Returns:
-            True, если изменилось хотя бы одно из полей, указанных в trigger_fields
-        """
-        old_task_dict = task.to_dict()
-        changed = any(attrs.get(name) and attrs.get(name) != old_task_dict.get(name) for name in trigger_fields)
-        await self._repository.update(task.id, Task(**attrs))
-        return changed
-
     async def archive(self, id: int) -> None:
         await self._repository.archive(id)
+
+    def _invalidate_caches(self, ids: list[int]) -> None:
+        self._cache_invalidation.invalidate(CacheName.TASK_RENDER, ids)
@@ -0,0 +1,91 @@
+import codecs
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any, TypeVar
+
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+# Состояния разбора JSON-массива
+_START = "start"
+_FIRST_VALUE = "first_value"
+_VALUE = "value"
+_SEPARATOR = "separator"
+_END = "end"
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Разбирает JSON-массив, поступающий частями, и возвращает его элементы по мере получения.
+    В памяти хранится только ещё не разобранный остаток поступивших данных.
+    При некорректных данных возбуждает ValueError.
+    """
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer, state = "", _START
+    async for chunk in chunks:
+        values, buffer, state = _parse(buffer + text_decoder.decode(chunk), state, final=False)
+        for value in values:
+            yield value
+    values, buffer, state = _parse(buffer + text_decoder.decode(b"", final=True), state, final=True)
+    for value in values:
+        yield value
+    if state != _END:
+        raise ValueError("Некорректный JSON: массив не завершён.")
+
+
+def _parse(buffer: str, state: str, final: bool) -> tuple[list[Any], str, str]:
+    """Разбирает начало buffer. Возвращает разобранные элементы массива,
+    неразобранный остаток buffer и новое состояние разбора.
+    """
+    values, position = [], 0
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE:
+            position += 1
+        if position == len(buffer):
+            break
+        char = buffer[position]
+        if state == _START:
+            if char != "[":
+                raise ValueError("Некорректный JSON: ожидается массив.")
+            state, position = _FIRST_VALUE, position + 1
+        elif state in (_FIRST_VALUE, _SEPARATOR) and char == "]":
+            state, position = _END, position + 1
+        elif state == _SEPARATOR:
+            if char != ",":
+                raise ValueError(f"Некорректный JSON: ожидается ',' или ']', получено {char!r}.")
+            state, position = _VALUE, position + 1
+        elif state in (_FIRST_VALUE, _VALUE):
+            try:
+                value, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # Элемент может быть ещё не получен полностью
+                if final:
+                    raise
+                break
+            # Число в конце буфера может продолжиться в следующей части данных
+            if end == len(buffer) and not final:
+                break
+            values.append(value)
+            state, position = _SEPARATOR, end
+        else:
+            raise ValueError("Некорректный JSON: данные после конца массива.")
+    return values, buffer[position:], state
+
+
+async def validate_by_chunks(
+    items: AsyncIterable[Any], adapter: TypeAdapter[list[T]], chunk_size: int
+) -> AsyncIterator[list[T]]:
+    """Проверяет элементы items порциями по chunk_size элементов и возвращает проверенные порции.
+    При некорректных данных возбуждает pydantic.ValidationError.
+    """
+    chunk = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield adapter.validate_python(chunk)
+            chunk = []
+    if chunk:
+        yield adapter.validate_python(chunk)
@@ -1,8 +1,9 @@
-from .bot import create_bot, shutdown_bot, start_bot, startup_bot
+from .bot import create_bot, shutdown_bot, start_bot, start_updates_fetching, stop_updates_fetching
 
 __all__ = (
     "start_bot",
     "create_bot",
     "shutdown_bot",
-    "startup_bot",
+    "start_updates_fetching",
+    "stop_updates_fetching",
 )
@@ -1,36 +1,56 @@
 import structlog
-from telegram.ext import AIORateLimiter, Application
+from telegram.ext import Application, BaseRateLimiter
+
+from src.bot.update_processor import ChatOrderedUpdateProcessor
+from src.core.db import ScopedSession
 
 log = structlog.get_logger()
 
 
-def create_bot(bot_token) -> Application:
-    bot = Application.builder().token(bot_token).rate_limiter(AIORateLimiter()).build()
+def create_bot(
+    bot_token,
+    session: ScopedSession,
+    concurrent_updates: int,
+    max_pending_updates: int,
+    rate_limiter: BaseRateLimiter,
+) -> Application:
+    bot = (
+        Application.builder()
+        .token(bot_token)
+        .rate_limiter(rate_limiter)
+        .concurrent_updates(ChatOrderedUpdateProcessor(session, concurrent_updates, max_pending_updates))
+        .build()
+    )
     return bot
 
 
-async def start_bot(
-    bot: Application, bot_webhook_mode: bool, telegram_webhook_url: str, telegram_secret_token: str
-) -> Application:
-    """Запуск бота в `Background` режиме."""
+async def start_bot(bot: Application, bot_webhook_mode: bool) -> Application:
+    """Запуск обработки обновлений бота в `Background` режиме.
+
+    Обновления, полученные через webhook, обрабатываются любым процессом. Получение обновлений
+    в режиме polling и регистрацию webhook выполняет только ведущий процесс, см. start_updates_fetching.
+    """
     await bot.initialize()
     if bot_webhook_mode is True:
         bot.updater = None
-        await bot.bot.set_webhook(
-            url=telegram_webhook_url,
-            secret_token=telegram_secret_token,
-        )
-    else:
-        await bot.updater.start_polling()  # type: ignore
     await bot.start()
     await log.ainfo("Bot started")
     return bot
 
 
-async def startup_bot(
-    bot: Application, bot_webhook_mode: bool, telegram_webhook_url: str, telegram_secret_token: str
-) -> Application:
-    bot_instance = await start_bot(bot, bot_webhook_mode, telegram_webhook_url, telegram_secret_token)
+async def start_updates_fetching(
+    bot_instance: Application, bot_webhook_mode: bool, telegram_webhook_url: str, telegram_secret_token: str
+) -> None:
+    """Регистрирует webhook или запускает получение обновлений в режиме polling
+    и устанавливает команды бота.
+    """
+    if bot_webhook_mode is True:
+        await bot_instance.bot.set_webhook(
+            url=telegram_webhook_url,
+            secret_token=telegram_secret_token,
+        )
+    else:
+        await bot_instance.updater.start_polling()  # type: ignore
     result = await bot_instance.bot.setMyCommands(
         [
             [
@@ -44,11 +64,15 @@ async def startup_bot(
         ]
     )
     await log.ainfo(result)
-    return bot_instance
 
 
-async def shutdown_bot(bot_instance, bot_webhook_mode: bool):
-    if bot_webhook_mode is True:
+async def stop_updates_fetching(bot_instance: Application) -> None:
+    """Останавливает получение обновлений в режиме polling."""
+    if bot_instance.updater is not None and bot_instance.updater.running:
         await bot_instance.updater.stop()
+
+
+async def shutdown_bot(bot_instance: Application):
+    await stop_updates_fetching(bot_instance)
     await bot_instance.stop()
     await bot_instance.shutdown()
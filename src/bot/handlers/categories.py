@@ -5,14 +5,14 @@ from telegram.ext import Application, CallbackQueryHandler, ContextTypes
 
 from src.bot.constants import callback_data, patterns
 from src.bot.keyboards import (
-    get_checked_categories_keyboard,
-    get_subcategories_keyboard,
+    build_checked_categories_keyboard,
+    build_subcategories_keyboard,
     get_tasks_and_open_menu_keyboard,
     get_view_categories_keyboard,
 )
 from src.bot.services import CategoryService, ExternalSiteUserService, UserService
 from src.bot.utils import delete_previous_message, get_marked_list, registered_user_required
-from src.core.db.models import ExternalSiteUser
+from src.core.db.repository import SiteUserIdentity
 from src.core.depends import Container
 from src.core.logging.utils import logger_decor
 from src.core.services.procharity_api import ProcharityAPI
@@ -30,17 +30,17 @@ text_choose_category = (
 async def categories_callback(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
     category_service: CategoryService = Provide[Container.bot_services_container.bot_category_service],
     user_service: UserService = Provide[Container.bot_services_container.bot_user_service],
 ):
     context.user_data["parent_id"] = None
-    categories = await category_service.get_unarchived_parents_with_children_count()
+    tree = await category_service.get_tree()
     selected_categories_with_parents = await user_service.get_user_categories_with_parents(update.effective_user.id)
     await context.bot.send_message(
         chat_id=update.effective_chat.id,
         text=text_choose_category,
-        reply_markup=await get_checked_categories_keyboard(categories, selected_categories_with_parents),
+        reply_markup=build_checked_categories_keyboard(tree, selected_categories_with_parents),
     )
 
 
@@ -79,7 +79,7 @@ async def view_categories(
 @logger_decor
 @registered_user_required
 async def view_current_categories_callback(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, ext_site_user: ExternalSiteUser
+    update: Update, context: ContextTypes.DEFAULT_TYPE, ext_site_user: SiteUserIdentity
 ):
     """Выводит список выбранных волонтером категорий перед их изменением."""
     text_format = "*Твои профессиональные компетенции:*\n\n" "{categories}\n\n"
@@ -93,7 +93,7 @@ async def view_current_categories_callback(
 @logger_decor
 @registered_user_required
 async def confirm_categories_callback(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, ext_site_user: ExternalSiteUser
+    update: Update, context: ContextTypes.DEFAULT_TYPE, ext_site_user: SiteUserIdentity
 ):
     """Выводит список выбранных волонтером категорий после их изменения и включает рассылку (если еще не включена)."""
     text_format = (
@@ -115,7 +115,7 @@ async def confirm_categories_callback(
 async def subcategories_callback(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
     user_service: UserService = Provide[Container.bot_services_container.bot_user_service],
 ):
     parent_id = int(context.match.group(1))
@@ -129,7 +129,7 @@ async def subcategories_callback(
 async def select_subcategory_callback(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
     user_service: UserService = Provide[Container.bot_services_container.bot_user_service],
     site_user_service: ExternalSiteUserService = Provide[Container.bot_services_container.bot_site_user_service],
     procharity_api: ProcharityAPI = Provide[Container.core_services_container.procharity_api],
@@ -156,7 +156,7 @@ async def select_subcategory_callback(
         await procharity_api.send_user_categories(ext_site_user.external_id, selected_categories_ids)
         or always_synchronize_ext_site_user
     ):
-        await site_user_service.set_specializations(ext_site_user, selected_categories_ids)
+        await site_user_service.set_specializations(ext_site_user.id, selected_categories_ids)
 
     parent_id = context.user_data["parent_id"]
     await _display_choose_subcategories_message(update, parent_id, selected_categories)
@@ -170,11 +170,11 @@ async def _display_choose_subcategories_message(
 ) -> None:
     """Отображает сообщение с предложением выбрать подкатегории и кнопки подкатегорий."""
     query = update.callback_query
-    parent = await category_service.get(parent_id, is_archived=None)
-    subcategories = await category_service.get_unarchived_subcategories(parent_id)
+    tree = await category_service.get_tree()
+    parent = tree.get(parent_id)
     await query.message.edit_text(
         f'Ты выбрал категорию <b>"{parent.name}"</b>. Отметь любое количество компетенций и нажми "Назад ⬅️"',
-        reply_markup=await get_subcategories_keyboard(parent_id, subcategories, selected_categories),
+        reply_markup=build_subcategories_keyboard(parent, selected_categories),
         parse_mode=ParseMode.HTML,
     )
 
@@ -184,17 +184,17 @@ async def _display_choose_subcategories_message(
 async def back_subcategory_callback(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
     category_service: CategoryService = Provide[Container.bot_services_container.bot_category_service],
     user_service: UserService = Provide[Container.bot_services_container.bot_user_service],
 ):
     query = update.callback_query
-    categories = await category_service.get_unarchived_parents_with_children_count()
+    tree = await category_service.get_tree()
     selected_categories_with_parents = await user_service.get_user_categories_with_parents(update.effective_user.id)
 
     await query.message.edit_text(
         text_choose_category,
-        reply_markup=await get_checked_categories_keyboard(categories, selected_categories_with_parents),
+        reply_markup=build_checked_categories_keyboard(tree, selected_categories_with_parents),
     )
 
 
@@ -16,7 +16,7 @@ from src.bot.keyboards import (
 )
 from src.bot.services import ExternalSiteUserService, UnsubscribeReasonService, UserService
 from src.bot.utils import delete_previous_message, registered_user_required
-from src.core.db.models import ExternalSiteUser
+from src.core.db.repository import SiteUserIdentity
 from src.core.depends import Container
 from src.core.logging.utils import logger_decor
 from src.core.services.email import EmailProvider
@@ -31,10 +31,11 @@ log = structlog.get_logger()
 async def menu_callback(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
+    user_service: UserService = Provide[Container.bot_services_container.bot_user_service],
 ):
     """Отображает меню."""
-    user = ext_site_user.user
+    user = await user_service.get_by_telegram_id(update.effective_user.id)
     filling = ("", "тебя") if user.is_volunteer else ("те", "вас")
     text = "Выбери{}, что {} интересует:".format(*filling)
     await context.bot.send_message(
@@ -50,7 +51,7 @@ async def menu_callback(
 async def set_mailing(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
     unsubscribe_reason_service: UnsubscribeReasonService = Provide[
         Container.bot_services_container.unsubscribe_reason_service
     ],
@@ -72,7 +73,7 @@ async def set_mailing(
         keyboard = await get_tasks_and_back_menu_keyboard()
         parse_mode = ParseMode.MARKDOWN
         if await procharity_api.send_user_bot_status(user) or always_synchronize_ext_site_user:
-            await site_user_service.set_mailing_new_tasks_status(ext_site_user, True)
+            await site_user_service.set_mailing_new_tasks_status(ext_site_user.id, True)
     else:
         text = (
             "<b>Ты отписался от заданий</b>\n\n"
@@ -98,7 +99,7 @@ async def set_mailing(
 async def unsubscription_reason_handler(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
     unsubscribe_reason_service: UnsubscribeReasonService = Provide[
         Container.bot_services_container.unsubscribe_reason_service
     ],
@@ -124,7 +125,7 @@ async def unsubscription_reason_handler(
     )
     asyncio.create_task(background_task)
     if await procharity_api.send_user_bot_status(user) or always_synchronize_ext_site_user:
-        await site_user_service.set_mailing_new_tasks_status(ext_site_user, False)
+        await site_user_service.set_mailing_new_tasks_status(ext_site_user.id, False)
     await log.ainfo(
         f"Пользователь {update.effective_user.username} ({update.effective_user.id}) отписался от "
         f"рассылки по причине: {reason}"
@@ -142,7 +143,7 @@ async def unsubscription_reason_handler(
 async def support_service_callback(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
     volunteer_faq_url: str = Provide[Container.settings.provided.procharity_volunteer_faq_url],
     fund_faq_url: str = Provide[Container.settings.provided.procharity_fund_faq_url],
     user_service: UserService = Provide[Container.bot_services_container.bot_user_service],
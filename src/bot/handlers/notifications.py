@@ -8,7 +8,7 @@ from src.bot.constants import callback_data, patterns
 from src.bot.keyboards import get_back_menu, get_notification_settings_keyboard
 from src.bot.services import UserService
 from src.bot.utils import registered_user_required
-from src.core.db.models import ExternalSiteUser
+from src.core.db.repository import SiteUserIdentity
 from src.core.depends import Container
 from src.core.logging.utils import logger_decor
 from src.core.services.procharity_api import ProcharityAPI
@@ -23,7 +23,7 @@ text_notification_settings_fund = 'Выберите, какие уведомле
 async def notification_settings(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
     user_service: UserService = Provide[Container.bot_services_container.bot_user_service],
 ):
     query = update.callback_query
@@ -43,7 +43,7 @@ async def notification_settings(
 async def confirm_notification_settings(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
     user_service: UserService = Provide[Container.bot_services_container.bot_user_service],
     volunteer_auth_url: str = Provide[Container.settings.provided.procharity_volunteer_auth_url],
     fund_auth_url: str = Provide[Container.settings.provided.procharity_fund_auth_url],
@@ -69,7 +69,7 @@ async def confirm_notification_settings(
 async def notification_field_callback(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
     user_service: UserService = Provide[Container.bot_services_container.bot_user_service],
     site_user_service: ExternalSiteUserService = Provide[Container.bot_services_container.bot_site_user_service],
     procharity_api: ProcharityAPI = Provide[Container.core_services_container.procharity_api],
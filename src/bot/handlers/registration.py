@@ -7,9 +7,9 @@ from telegram.ext import Application, ChatMemberHandler, CommandHandler, Context
 
 from src.bot.constants import commands
 from src.bot.keyboards import get_start_keyboard
-from src.bot.services import UserService
+from src.bot.services import ExternalSiteUserService, UserService
 from src.bot.utils import registered_user_required
-from src.core.db.models import ExternalSiteUser
+from src.core.db.repository import SiteUserIdentity
 from src.core.depends import Container
 from src.core.logging.utils import logger_decor
 from src.core.services.procharity_api import ProcharityAPI
@@ -21,13 +21,15 @@ from src.core.services.procharity_api import ProcharityAPI
 async def start_command(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
     user_service: UserService = Provide[Container.bot_services_container.bot_user_service],
+    site_user_service: ExternalSiteUserService = Provide[Container.bot_services_container.bot_site_user_service],
     volunteer_auth_url: str = Provide[Container.settings.provided.procharity_volunteer_auth_url],
     fund_auth_url: str = Provide[Container.settings.provided.procharity_fund_auth_url],
 ):
     telegram_user = update.effective_user or Never
-    user = await user_service.register_user(ext_site_user, telegram_user)
+    site_user = await site_user_service.get_by_id(ext_site_user.id)
+    user = await user_service.register_user(site_user, telegram_user)
     auth_url = volunteer_auth_url if user.is_volunteer else fund_auth_url
     you_authorized_phrase = "Ты авторизовался" if user.is_volunteer else "Вы авторизовались"
     await context.bot.send_message(
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 
 from dependency_injector.wiring import Provide
@@ -8,15 +9,18 @@ from telegram.ext import Application, CallbackQueryHandler, ContextTypes
 from src.bot.constants import callback_data, patterns
 from src.bot.constants.enum import CANCEL_RESPOND_REASONS
 from src.bot.keyboards import (
+    build_task_info_keyboard,
+    count_tasks_in_keyboard,
     get_back_menu,
     get_cancel_respond_reason_keyboard,
     get_task_info_keyboard,
     get_tasks_list_end_keyboard,
+    replace_response_to_task_button,
     view_more_tasks_keyboard,
 )
 from src.bot.services import ExternalSiteUserService, TaskService
 from src.bot.utils import delete_previous_message, registered_user_required
-from src.core.db.models import ExternalSiteUser
+from src.core.db.repository import SiteUserIdentity
 from src.core.depends import Container
 from src.core.enums import UserResponseAction, UserStatus
 from src.core.logging.utils import logger_decor
@@ -32,7 +36,7 @@ INITIAL_LAST_VIEWED_ACTUALIZING_TIME = datetime(year=2000, month=1, day=1)
 async def view_tasks_callback(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
 ):
     await _view_tasks(update, context, ext_site_user)
 
@@ -43,7 +47,7 @@ async def view_tasks_callback(
 async def view_tasks_again_callback(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
 ):
     context.user_data["last_viewed_id"] = 0
     context.user_data["last_viewed_actualizing_time"] = INITIAL_LAST_VIEWED_ACTUALIZING_TIME
@@ -53,14 +57,16 @@ async def view_tasks_again_callback(
 async def _view_tasks(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
     limit: int = 3,
     task_service: TaskService = Provide[Container.bot_services_container.bot_task_service],
+    site_user_service: ExternalSiteUserService = Provide[Container.bot_services_container.bot_site_user_service],
 ):
-    user = ext_site_user.user
     after_id = context.user_data.get("last_viewed_id", 0)
     after_datetime = context.user_data.get("last_viewed_actualizing_time", INITIAL_LAST_VIEWED_ACTUALIZING_TIME)
-    selected_rows = await task_service.get_user_tasks_actualized_after(user, after_datetime, after_id, limit)
+    selected_rows, remaining_tasks_count = await task_service.get_user_tasks_page_actualized_after(
+        ext_site_user.user_id, after_datetime, after_id, limit
+    )
 
     if not selected_rows:
         if after_datetime > INITIAL_LAST_VIEWED_ACTUALIZING_TIME:
@@ -74,18 +80,24 @@ async def _view_tasks(
 
         return
 
-    for task, actualizing_time in selected_rows:
-        await context.bot.send_message(
-            chat_id=update.effective_chat.id,
-            text=display_task(task),
-            parse_mode=ParseMode.HTML,
-            disable_web_page_preview=True,
-            reply_markup=await get_task_info_keyboard(task, ext_site_user),
+    tasks = [task for task, _ in selected_rows]
+    responses = await site_user_service.get_responses_to_tasks(tasks)
+    await asyncio.gather(
+        *(
+            context.bot.send_message(
+                chat_id=update.effective_chat.id,
+                text=display_task(task),
+                parse_mode=ParseMode.HTML,
+                disable_web_page_preview=True,
+                reply_markup=build_task_info_keyboard(task, (task.id, ext_site_user.id) in responses),
+            )
+            for task in tasks
         )
+    )
 
+    task, actualizing_time = selected_rows[-1]
     context.user_data["last_viewed_id"] = task.id
     context.user_data["last_viewed_actualizing_time"] = actualizing_time
-    remaining_tasks_count = await task_service.count_user_tasks_actualized_after(user, actualizing_time, task.id)
     await _show_remaining_tasks_count(update, context, remaining_tasks_count)
 
 
@@ -110,7 +122,7 @@ async def _show_remaining_tasks_count(update: Update, context: ContextTypes.DEFA
 async def respond_to_task_callback(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    site_user: ExternalSiteUser,
+    site_user: SiteUserIdentity,
     task_service: TaskService = Provide[Container.bot_services_container.bot_task_service],
     site_user_service: ExternalSiteUserService = Provide[Container.bot_services_container.bot_site_user_service],
     procharity_api: ProcharityAPI = Provide[Container.core_services_container.procharity_api],
@@ -156,6 +168,14 @@ async def respond_to_task_callback(
     else:
         if await site_user_service.user_responded_to_task(site_user, task):
             text = "Пожалуйста, укажи причину, по которой хочешь отменить отклик на задание"
+            if count_tasks_in_keyboard(query.message.reply_markup) > 1:
+                # Сообщение с несколькими задачами не заменяем, чтобы не потерять остальные задачи
+                await query.message.reply_text(
+                    text=f"{text} «{task.title}»",
+                    reply_markup=get_cancel_respond_reason_keyboard(task),
+                )
+                await query.answer()
+                return
             await query.message.edit_text(
                 text=text,
                 parse_mode=ParseMode.HTML,
@@ -168,7 +188,11 @@ async def respond_to_task_callback(
     if respond_status:
         await procharity_api.send_task_respond_status(site_user.external_id, task.id, respond_status)
     if status_changed:
-        await query.message.edit_reply_markup(reply_markup=await get_task_info_keyboard(task, site_user))
+        await query.message.edit_reply_markup(
+            reply_markup=replace_response_to_task_button(
+                query.message.reply_markup, task, await site_user_service.user_responded_to_task(site_user, task)
+            )
+        )
 
 
 @logger_decor
@@ -176,7 +200,7 @@ async def respond_to_task_callback(
 async def cancel_respond_reason_callback(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
     task_service: TaskService = Provide[Container.bot_services_container.bot_task_service],
     site_user_service: ExternalSiteUserService = Provide[Container.bot_services_container.bot_site_user_service],
     procharity_api: ProcharityAPI = Provide[Container.core_services_container.procharity_api],
@@ -211,7 +235,7 @@ async def cancel_respond_reason_callback(
 async def keep_task_respond_callback(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
     task_service: TaskService = Provide[Container.bot_services_container.bot_task_service],
 ):
     """Отказ от отмены отклика на задание."""
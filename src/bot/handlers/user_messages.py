@@ -2,7 +2,7 @@ from telegram import Update
 from telegram.ext import Application, ContextTypes, MessageHandler, filters
 
 from src.bot.utils import registered_user_required
-from src.core.db.models import ExternalSiteUser
+from src.core.db.repository import SiteUserIdentity
 from src.core.logging.utils import logger_decor
 
 ALLOWED_MESSAGES_FILTER = (
@@ -24,10 +24,10 @@ DISALLOWED_MESSAGES_FILTER = filters.LOCATION | filters.POLL | filters.CONTACT |
 async def allowed_messages_callback(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
 ):
     print(type(update.message.effective_attachment))
-    filling = ("твои", "") if ext_site_user.user.is_volunteer else ("ваши", "те")
+    filling = ("твои", "") if ext_site_user.is_volunteer else ("ваши", "те")
     text = (
         "Пока что мы не можем получать {} сообщения через бот — "
         "пожалуйста, пиши{} нам через форму обратной связи. "
@@ -41,9 +41,9 @@ async def allowed_messages_callback(
 async def disallowed_messages_callback(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    ext_site_user: ExternalSiteUser,
+    ext_site_user: SiteUserIdentity,
 ):
-    filling = ("",) if ext_site_user.user.is_volunteer else ("те",)
+    filling = ("",) if ext_site_user.is_volunteer else ("те",)
     text = (
         "Такие сообщения бот не принимает — "
         "пожалуйста, пиши{} нам через форму обратной связи. "
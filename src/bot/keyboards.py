@@ -1,11 +1,17 @@
-from dependency_injector.wiring import Provide
+import re
+from collections.abc import Sequence
+
+from dependency_injector.wiring import Provide, inject
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
-from src.bot.constants import callback_data, enum
+from src.bot.constants import callback_data, enum, patterns
 from src.bot.services import ExternalSiteUserService
 from src.bot.web_apps import get_feedback_web_app_info, get_task_web_app_info
-from src.core.db.models import Category, ExternalSiteUser, Task, User
+from src.core.category_tree import CategoryNode, CategoryTree
+from src.core.db.models import Task, User
+from src.core.db.repository import SiteUserIdentity
 from src.core.depends import Container
+from src.core.render_cache import TaskRenderCache
 from src.settings import settings
 
 VIEW_TASKS_BUTTON = [InlineKeyboardButton("🔎 Посмотреть актуальные задания", callback_data=callback_data.VIEW_TASKS)]
@@ -21,6 +27,7 @@ OPEN_MENU_BUTTON = [InlineKeyboardButton("Открыть меню", callback_dat
 RETURN_MENU_BUTTON = [InlineKeyboardButton("Вернуться в меню", callback_data=callback_data.MENU)]
 CHECK_CATEGORIES_BUTTON = [InlineKeyboardButton("Проверить компетенции", callback_data=callback_data.VIEW_CATEGORIES)]
 SHOW_MORE_TASKS_BUTTON = [InlineKeyboardButton("Показать ещё задания", callback_data=callback_data.VIEW_TASKS)]
+CONFIRM_CATEGORIES_BUTTON = [InlineKeyboardButton("Готово 👌", callback_data=callback_data.CONFIRM_CATEGORIES)]
 SUPPORT_SERVICE_BUTTON = [
     InlineKeyboardButton("✍ Написать в службу поддержки", callback_data=callback_data.SUPPORT_SERVICE)
 ]
@@ -88,24 +95,23 @@ def get_response_to_task_button(task: Task, cancel: bool) -> list[InlineKeyboard
     return [InlineKeyboardButton(text, callback_data=f"{action}respond_to_task_{task.id}")]
 
 
-async def get_checked_categories_keyboard(
-    categories: list[str, int, int], selected_categories: dict[Category] = None
+def build_checked_categories_keyboard(
+    tree: CategoryTree, selected_categories: dict[int, dict[int, str]] | None = None
 ) -> InlineKeyboardMarkup:
-    keyboard = []
+    """Возвращает клавиатуру родительских категорий из снимка дерева категорий,
+    отмечая категории, подкатегории которых выбраны пользователем полностью или частично.
+    """
     selected_categories = {} if selected_categories is None else selected_categories
-    for category_name, category_id, category_children_count in categories:
-        if category_id in selected_categories:
-            if category_children_count == len(selected_categories[category_id]):
-                button = InlineKeyboardButton(f"✅ {category_name}", callback_data=f"category_{category_id}")
-            else:
-                button = InlineKeyboardButton(f"☑️  {category_name}", callback_data=f"category_{category_id}")
+    keyboard = []
+    for parent in tree.parents:
+        if parent.id not in selected_categories:
+            button = parent.button
+        elif parent.children_count == len(selected_categories[parent.id]):
+            button = parent.selected_button
         else:
-            button = InlineKeyboardButton(category_name, callback_data=f"category_{category_id}")
+            button = parent.partially_selected_button
         keyboard.append([button])
-
-    keyboard.append(
-        [InlineKeyboardButton("Готово 👌", callback_data=callback_data.CONFIRM_CATEGORIES)],
-    )
+    keyboard.append(CONFIRM_CATEGORIES_BUTTON)
     return InlineKeyboardMarkup(keyboard)
 
 
@@ -114,21 +120,15 @@ async def get_view_categories_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
-async def get_subcategories_keyboard(
-    parent_id: int,
-    subcategories: list[Category],
-    selected_categories: dict[Category] = None,
+def build_subcategories_keyboard(
+    parent: CategoryNode, selected_categories: dict[int, str] | None = None
 ) -> InlineKeyboardMarkup:
-    keyboard = []
+    """Возвращает клавиатуру подкатегорий родительской категории parent из снимка дерева категорий."""
     selected_categories = {} if selected_categories is None else selected_categories
-    for category in subcategories:
-        if category.id not in selected_categories:
-            button = InlineKeyboardButton(category.name, callback_data=f"select_category_{category.id}")
-        else:
-            button = InlineKeyboardButton(f"✅ {category.name}", callback_data=f"select_category_{category.id}")
-        keyboard.append([button])
-
-    keyboard.append([InlineKeyboardButton("Назад ⬅️", callback_data=f"back_to_{parent_id}")])
+    keyboard = [
+        [child.selected_button if child.id in selected_categories else child.button] for child in parent.children
+    ]
+    keyboard.append([parent.back_button or InlineKeyboardButton("Назад ⬅️", callback_data=f"back_to_{parent.id}")])
     return InlineKeyboardMarkup(keyboard)
 
 
@@ -218,18 +218,83 @@ def get_no_mailing_keyboard() -> InlineKeyboardMarkup:
 
 async def get_task_info_keyboard(
     task: Task,
-    site_user: ExternalSiteUser,
+    site_user: SiteUserIdentity,
     site_user_service: ExternalSiteUserService = Provide[Container.bot_services_container.bot_site_user_service],
 ) -> InlineKeyboardMarkup:
     """Клавиатура, помещаемая под кратким описанием задачи"""
+    return build_task_info_keyboard(task, await site_user_service.user_responded_to_task(site_user, task))
+
+
+@inject
+def build_task_info_keyboard(
+    task: Task,
+    responded: bool,
+    task_render_cache: TaskRenderCache = Provide[Container.caches_container.task_render_cache],
+) -> InlineKeyboardMarkup:
+    """Клавиатура, помещаемая под кратким описанием задачи, для пользователя,
+    который откликнулся (responded=True) или не откликнулся на задачу.
+    Клавиатуры кэшируются, так как зависят только от id задачи.
+    """
+    key = (task.id, responded)
+    keyboard = task_render_cache.keyboards.get(key)
+    if keyboard is None:
+        keyboard = InlineKeyboardMarkup(
+            [
+                [InlineKeyboardButton("ℹ️ Посмотреть задание", web_app=get_task_web_app_info(task))],
+                get_response_to_task_button(task, responded),
+            ]
+        )
+        task_render_cache.keyboards.put(key, keyboard)
+    return keyboard
+
+
+def build_tasks_info_keyboard(tasks: Sequence[tuple[int, Task, bool]]) -> InlineKeyboardMarkup:
+    """Клавиатура, помещаемая под сообщением с несколькими задачами.
+    Для каждой задачи выводится строка из кнопки просмотра и кнопки отклика.
+
+    Args:
+        tasks: Тройки (номер задачи в сообщении, задача, признак отклика пользователя на задачу).
+    """
+    return InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton(f"ℹ️ Задание {number}", web_app=get_task_web_app_info(task)),
+                *get_response_to_task_button(task, responded),
+            ]
+            for number, task, responded in tasks
+        ]
+    )
+
+
+def replace_response_to_task_button(
+    reply_markup: InlineKeyboardMarkup, task: Task, cancel: bool
+) -> InlineKeyboardMarkup:
+    """Возвращает копию клавиатуры, в которой кнопка отклика на заданную задачу
+    заменена кнопкой, соответствующей значению параметра cancel.
+    Остальные кнопки (в том числе кнопки других задач) не меняются.
+    """
+    task_callbacks = (f"+respond_to_task_{task.id}", f"-respond_to_task_{task.id}")
+    (response_button,) = get_response_to_task_button(task, cancel)
     return InlineKeyboardMarkup(
         [
-            [InlineKeyboardButton("ℹ️ Посмотреть задание", web_app=get_task_web_app_info(task))],
-            get_response_to_task_button(task, await site_user_service.user_responded_to_task(site_user, task)),
+            [response_button if button.callback_data in task_callbacks else button for button in row]
+            for row in reply_markup.inline_keyboard
         ]
     )
 
 
+def count_tasks_in_keyboard(reply_markup: InlineKeyboardMarkup | None) -> int:
+    """Возвращает количество задач, для которых в клавиатуре есть кнопки отклика."""
+    if reply_markup is None:
+        return 0
+    return sum(
+        1
+        for row in reply_markup.inline_keyboard
+        for button in row
+        if isinstance(button.callback_data, str) and re.fullmatch(patterns.RESPOND_TO_TASK, button.callback_data)
+    )
+
+
 def get_cancel_respond_reason_keyboard(task: Task) -> InlineKeyboardMarkup:
     """Клавиатура с причинами отмены отклика на задание"""
     keyboard = [
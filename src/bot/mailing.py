@@ -0,0 +1,257 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from contextlib import suppress
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.bot.keyboards import build_task_info_keyboard, build_tasks_info_keyboard
+from src.bot.services import ExternalSiteUserService
+from src.core.db.models import MAX_LENGTH_BOT_MESSAGE, Mailing, MailingRecipient, Task, User
+from src.core.db.repository import ExternalSiteUserRepository, MailingRepository, UserRepository
+from src.core.enums import MailingType
+from src.core.messages import display_task
+from src.core.render_cache import LRUCache
+from src.core.services.bot_status import BotStatusQueue
+from src.core.services.cache_invalidation import CacheInvalidation
+from src.core.services.notification import TelegramMessageTemplate, TelegramNotification
+
+log = structlog.get_logger(module=__name__)
+
+# Количество рассылок, задания и тексты карточек которых хранит пул обработчиков рассылок
+MAILING_TASKS_CACHE_SIZE = 16
+
+
+class TaskInfoMessageTemplate(TelegramMessageTemplate):
+    """Шаблон телеграм-сообщений с информацией о задачах.
+
+    Каждый пользователь получает одно сообщение со всеми предназначенными ему задачами.
+    Если текст не помещается в одно сообщение, он разбивается на несколько сообщений,
+    под каждым из которых размещаются кнопки его задач.
+    """
+
+    def __init__(
+        self,
+        tasks: Mapping[int, Task],
+        texts: Mapping[int, str],
+        users_task_ids: Mapping[int, Sequence[int]],
+        site_user_ids: Iterable[int],
+        site_user_service: ExternalSiteUserService,
+    ):
+        """
+        Args:
+            tasks: Словарь {id задачи: задача}.
+            texts: Словарь {id задачи: текст карточки задачи}, см. render_task_texts.
+            users_task_ids: Словарь {id пользователя: id предназначенных ему задач}.
+            site_user_ids: Id пользователей сайта, связанных с получателями.
+            site_user_service: Сервис для загрузки откликов на задачи.
+        """
+        self.tasks = tasks
+        self._texts = texts
+        self._users_task_ids = users_task_ids
+        self._site_user_ids = list(site_user_ids)
+        self._site_user_service = site_user_service
+        self._responses: set[tuple[int, int]] = set()
+
+    async def prepare(self) -> None:
+        """Загружает одним запросом отклики получателей на предназначенные им задачи."""
+        task_ids = {task_id for task_ids in self._users_task_ids.values() for task_id in task_ids}
+        tasks = [self.tasks[task_id] for task_id in task_ids if task_id in self.tasks]
+        if tasks and self._site_user_ids:
+            self._responses = await self._site_user_service.get_responses_to_tasks(tasks, self._site_user_ids)
+
+    async def render(self, user: User) -> dict:
+        """Возвращает словарь с атрибутами text и reply_markup первого телеграм-сообщения
+        с информацией о задачах, предназначенного для заданного пользователя.
+        """
+        messages = await self.render_messages(user)
+        return messages[0] if messages else {}
+
+    async def render_messages(self, user: User) -> list[dict]:
+        """Возвращает список словарей с атрибутами text и reply_markup телеграм-сообщений
+        с информацией о задачах, предназначенных для заданного пользователя.
+        """
+        site_user = user.external_user
+        task_ids = [task_id for task_id in self._users_task_ids.get(user.id, ()) if task_id in self.tasks]
+        if site_user is None or not task_ids:
+            return []
+
+        if len(task_ids) == 1:
+            (task_id,) = task_ids
+            keyboard = build_task_info_keyboard(self.tasks[task_id], (task_id, site_user.id) in self._responses)
+            return [dict(text=self._texts[task_id], reply_markup=keyboard)]
+
+        messages, text, keyboard_tasks = [], "", []
+        for number, task_id in enumerate(task_ids, 1):
+            task_text = f"<b>{number}.</b> {self._texts[task_id]}"
+            if keyboard_tasks and len(text) + len(task_text) > MAX_LENGTH_BOT_MESSAGE:
+                messages.append(dict(text=text, reply_markup=build_tasks_info_keyboard(keyboard_tasks)))
+                text, keyboard_tasks = "", []
+            text += task_text
+            keyboard_tasks.append((number, self.tasks[task_id], (task_id, site_user.id) in self._responses))
+        messages.append(dict(text=text, reply_markup=build_tasks_info_keyboard(keyboard_tasks)))
+        return messages
+
+
+def render_task_texts(tasks: Sequence[tuple[Task, bool]]) -> dict[int, str]:
+    """Возвращает словарь {id задачи: текст карточки задачи} для пар (задача, признак обновления задачи)."""
+    return {task.id: display_task(task, updated_task) for task, updated_task in tasks}
+
+
+class MailingWorkerPool:
+    """Пул фоновых обработчиков очереди рассылок.
+
+    Каждый обработчик захватывает из таблицы mailing_recipients порцию получателей,
+    отправляет им сообщения и сохраняет результаты отправки. Захват выполняется
+    с ограниченным сроком действия, поэтому после перезапуска процесса
+    недоставленные сообщения будут отправлены повторно.
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker,
+        telegram_notification: TelegramNotification,
+        bot_status_queue: BotStatusQueue,
+        cache_invalidation: CacheInvalidation,
+        workers_count: int,
+        batch_size: int,
+        poll_interval: float,
+        lease_time: int,
+        max_attempts: int,
+    ) -> None:
+        self._sessionmaker = sessionmaker
+        self._telegram_notification = telegram_notification
+        self._bot_status_queue = bot_status_queue
+        self._cache_invalidation = cache_invalidation
+        self._workers_count = workers_count
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._lease_time = lease_time
+        self._max_attempts = max_attempts
+        self._stop_event = asyncio.Event()
+        self._workers: list[asyncio.Task] = []
+        # Задания и тексты карточек рассылок заданий: {id рассылки: (задачи по id, тексты по id задачи)}
+        self._mailing_tasks: LRUCache[int, tuple[dict[int, Task], dict[int, str]]] = LRUCache(
+            MAILING_TASKS_CACHE_SIZE
+        )
+
+    def start(self) -> None:
+        """Запускает фоновые обработчики очереди рассылок."""
+        self._stop_event.clear()
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self._workers_count)]
+
+    async def stop(self) -> None:
+        """Останавливает обработчики, дожидаясь завершения отправки захваченных порций."""
+        self._stop_event.set()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _work(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                processed_count = await self._process_batch()
+            except Exception as exc:
+                await log.aexception(f"Ошибка обработки очереди рассылок: {exc}")
+                processed_count = 0
+            if not processed_count:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._stop_event.wait(), self._poll_interval)
+
+    async def _process_batch(self) -> int:
+        """Отправляет сообщения очередной порции получателей.
+        Возвращает количество обработанных получателей.
+        """
+        async with self._sessionmaker() as session:
+            repository = MailingRepository(session)
+            await repository.fail_exhausted_recipients(self._max_attempts)
+            recipients = await repository.acquire_recipients(self._batch_size, self._lease_time, self._max_attempts)
+            if not recipients:
+                return 0
+
+            recipients_by_mailing = defaultdict(list)
+            for recipient in recipients:
+                recipients_by_mailing[recipient.mailing_id].append(recipient)
+
+            results = {}
+            for mailing_id, mailing_recipients in recipients_by_mailing.items():
+                mailing = await repository.get(mailing_id)
+                results.update(await self._send(session, mailing, mailing_recipients))
+
+            await repository.complete_recipients(results)
+            await self._ban_blocked_users(session)
+            return len(recipients)
+
+    async def _ban_blocked_users(self, session: AsyncSession) -> None:
+        """Помечает заблокировавших бота пользователей одним запросом
+        и ставит в очередь отправку их статуса бота на сайт.
+        """
+        blocked_telegram_ids = self._telegram_notification.pop_blocked_telegram_ids()
+        if blocked_telegram_ids:
+            self._bot_status_queue.put(await UserRepository(session).ban_by_telegram_ids(blocked_telegram_ids))
+
+    async def _send(
+        self, session: AsyncSession, mailing: Mailing, recipients: Sequence[MailingRecipient]
+    ) -> dict[int, tuple[bool, str]]:
+        """Отправляет сообщения рассылки mailing получателям recipients.
+        Возвращает словарь {id получателя: результат отправки}.
+        """
+        match mailing.type:
+            case MailingType.TASK:
+                return await self._send_task(session, mailing, recipients)
+            case MailingType.MESSAGE:
+                return await self._send_message(mailing, recipients)
+        return {recipient.id: (False, f"Неизвестный тип рассылки {mailing.type}.") for recipient in recipients}
+
+    async def _send_task(
+        self, session: AsyncSession, mailing: Mailing, recipients: Sequence[MailingRecipient]
+    ) -> dict[int, tuple[bool, str]]:
+        tasks, texts = await self._get_mailing_tasks(session, mailing)
+        if not tasks:
+            return {recipient.id: (False, "Задания не найдены.") for recipient in recipients}
+
+        user_repository = UserRepository(session)
+        users = await user_repository.get_by_ids_with_external_user([recipient.user_id for recipient in recipients])
+        users = [user for user in users if user.external_user is not None and not user.banned]
+        site_user_service = ExternalSiteUserService(
+            ExternalSiteUserRepository(session), user_repository, self._cache_invalidation
+        )
+        template = TaskInfoMessageTemplate(
+            tasks,
+            texts,
+            {recipient.user_id: recipient.task_ids or [] for recipient in recipients},
+            [user.external_user.id for user in users],
+            site_user_service,
+        )
+        send_results = await self._telegram_notification.send_messages_by_template(users, template)
+
+        results_by_user_id = {user.id: result for user, result in zip(users, send_results)}
+        return {
+            recipient.id: results_by_user_id.get(
+                recipient.user_id, (False, "Пользователь не связан с сайтом или заблокировал бота.")
+            )
+            for recipient in recipients
+        }
+
+    async def _get_mailing_tasks(
+        self, session: AsyncSession, mailing: Mailing
+    ) -> tuple[dict[int, Task], dict[int, str]]:
+        """Возвращает задачи рассылки и тексты их карточек. Они загружаются и формируются
+        один раз для всех порций получателей рассылки.
+        """
+        content = self._mailing_tasks.get(mailing.id)
+        if content is None:
+            mailing_tasks = await MailingRepository(session).get_mailing_tasks(mailing)
+            pairs = [(mailing_task.task, mailing_task.updated_task) for mailing_task in mailing_tasks]
+            content = ({task.id: task for task, _ in pairs}, render_task_texts(pairs))
+            if content[0]:
+                self._mailing_tasks.put(mailing.id, content)
+        return content
+
+    async def _send_message(
+        self, mailing: Mailing, recipients: Sequence[MailingRecipient]
+    ) -> dict[int, tuple[bool, str]]:
+        send_results = await self._telegram_notification.send_messages_by_telegram_ids(
+            mailing.message, [recipient.telegram_id for recipient in recipients]
+        )
+        return {recipient.id: result for recipient, result in zip(recipients, send_results)}
@@ -1,5 +1,6 @@
 from .category import CategoryService
 from .external_site_user import ExternalSiteUserService
+from .identity import IdentityService
 from .task import TaskService
 from .unsubscribe_reason import UnsubscribeReasonService
 from .user import UserService
@@ -7,6 +8,7 @@ from .user import UserService
 __all__ = (
     "CategoryService",
     "ExternalSiteUserService",
+    "IdentityService",
     "TaskService",
     "UnsubscribeReasonService",
     "UserService",
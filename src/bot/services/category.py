@@ -1,3 +1,4 @@
+from src.core.category_tree import CategoryTree, CategoryTreeCache
 from src.core.db.models import Category
 from src.core.db.repository.category import CategoryRepository
 
@@ -5,14 +6,13 @@ from src.core.db.repository.category import CategoryRepository
 class CategoryService:
     """Сервис бота для работы с моделью Category."""
 
-    def __init__(self, category_repository: CategoryRepository) -> None:
+    def __init__(self, category_repository: CategoryRepository, category_tree_cache: CategoryTreeCache) -> None:
         self._category_repository = category_repository
+        self._category_tree_cache = category_tree_cache
 
     async def get(self, id: int, *, is_archived: bool | None = False) -> Category:
         return await self._category_repository.get(id, is_archived=is_archived)
 
-    async def get_unarchived_subcategories(self, parent_id) -> list[Category]:
-        return await self._category_repository.get_unarchived_subcategories(parent_id)
-
-    async def get_unarchived_parents_with_children_count(self):  # -> dict[Category, int]:
-        return await self._category_repository.get_unarchived_parents_with_children_count()
+    async def get_tree(self) -> CategoryTree:
+        """Возвращает снимок дерева категорий из кэша процесса."""
+        return await self._category_tree_cache.get(self._category_repository)
@@ -1,14 +1,24 @@
+from collections.abc import Iterable
+
 from src.bot.constants.enum import HasMailingField
 from src.core.db.models import ExternalSiteUser, Task
-from src.core.db.repository import ExternalSiteUserRepository, UserRepository
+from src.core.db.repository import ExternalSiteUserRepository, SiteUserIdentity, UserRepository
+from src.core.enums import CacheName
+from src.core.services import CacheInvalidation
 
 
 class ExternalSiteUserService:
     """Сервис бота для работы с моделью ExternalSiteUser."""
 
-    def __init__(self, site_user_repository: ExternalSiteUserRepository, user_repository: UserRepository):
+    def __init__(
+        self,
+        site_user_repository: ExternalSiteUserRepository,
+        user_repository: UserRepository,
+        cache_invalidation: CacheInvalidation,
+    ):
         self._repository = site_user_repository
         self._user_repository = user_repository
+        self._cache_invalidation = cache_invalidation
 
     async def get_by_id_hash(self, id_hash: str, is_archived: bool | None = False) -> ExternalSiteUser | None:
         """Возвращает пользователя (или None) по id_hash."""
@@ -24,31 +34,43 @@ class ExternalSiteUserService:
         if user and user.external_id is not None:
             return await self._repository.get_or_none(user.external_id, is_archived=is_archived)
 
-    async def user_responded_to_task(self, site_user: ExternalSiteUser, task: Task) -> bool:
+    async def user_responded_to_task(self, site_user: ExternalSiteUser | SiteUserIdentity, task: Task) -> bool:
         """Возвращает True, если в БД имеется отклик заданного пользователя
         на заданную задачу, иначе False.
         """
         return await self._repository.user_responded_to_task(site_user, task)
 
-    async def create_user_response_to_task(self, site_user: ExternalSiteUser, task: Task) -> bool:
+    async def get_responses_to_tasks(
+        self, tasks: Iterable[Task], site_user_ids: Iterable[int] | None = None
+    ) -> set[tuple[int, int]]:
+        """Возвращает множество пар (id задачи, id пользователя) для откликов на заданные задачи.
+        Если заданы site_user_ids, учитываются только отклики этих пользователей.
+        """
+        return await self._repository.get_responses_to_tasks(tasks, site_user_ids)
+
+    async def create_user_response_to_task(self, site_user: ExternalSiteUser | SiteUserIdentity, task: Task) -> bool:
         """Создаёт отклик заданного пользователя на заданную задачу и возвращает True.
         А если такой отклик уже есть в БД, просто возвращает False.
         """
         return await self._repository.create_user_response_to_task(site_user, task)
 
-    async def delete_user_response_to_task(self, site_user: ExternalSiteUser, task: Task) -> bool:
+    async def delete_user_response_to_task(self, site_user: ExternalSiteUser | SiteUserIdentity, task: Task) -> bool:
         """Удаляет отклик заданного пользователя на заданную задачу и возвращает True.
         А если такого отклика нет в БД, просто возвращает False.
         """
         return await self._repository.delete_user_response_to_task(site_user, task)
 
-    async def set_mailing_new_tasks_status(self, site_user: ExternalSiteUser, status: bool) -> ExternalSiteUser:
-        """Устанавливает новое значение поля has_mailing_new_tasks у заданного пользователя."""
+    async def set_mailing_new_tasks_status(self, site_user_id: int, status: bool) -> ExternalSiteUser:
+        """Устанавливает новое значение поля has_mailing_new_tasks у пользователя с заданным id."""
+        site_user = await self._repository.get(site_user_id)
         site_user.has_mailing_new_tasks = status
-        return await self._repository.update(site_user.id, site_user)
+        site_user = await self._repository.update(site_user.id, site_user)
+        self._cache_invalidation.invalidate(CacheName.IDENTITY, [site_user.id])
+        return site_user
 
-    async def set_specializations(self, site_user: ExternalSiteUser, specializations: list[int]) -> ExternalSiteUser:
-        """Устанавливает новое значение поля specializations у заданного пользователя."""
+    async def set_specializations(self, site_user_id: int, specializations: list[int]) -> ExternalSiteUser:
+        """Устанавливает новое значение поля specializations у пользователя с заданным id."""
+        site_user = await self._repository.get(site_user_id)
         site_user.specializations = specializations
         return await self._repository.update(site_user.id, site_user)
 
@@ -62,9 +84,4 @@ class ExternalSiteUserService:
                 await self._repository.set_has_mailing_my_tasks(site_user, not site_user.has_mailing_my_tasks)
             case HasMailingField.procharity:
                 await self._repository.set_has_mailing_procharity(site_user, not site_user.has_mailing_procharity)
-
-    async def update_last_interaction(self, site_user: ExternalSiteUser) -> None:
-        """Обновляет last_interaction для site_user."""
-        if not site_user:
-            return
-        await self._repository.update_last_interaction(site_user)
+        self._cache_invalidation.invalidate(CacheName.IDENTITY, [site_user.id])
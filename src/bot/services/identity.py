@@ -0,0 +1,30 @@
+from src.core.db.repository import ExternalSiteUserRepository, SiteUserIdentity
+from src.core.identity_cache import IdentityCache
+
+
+class IdentityService:
+    """Сервис бота для определения пользователя сайта, от имени которого выполняется действие.
+    Результаты кэшируются на короткое время (см. IdentityCache).
+    """
+
+    def __init__(self, site_user_repository: ExternalSiteUserRepository, identity_cache: IdentityCache) -> None:
+        self._repository = site_user_repository
+        self._identity_cache = identity_cache
+
+    async def get_by_telegram_id(self, telegram_id: int) -> SiteUserIdentity | None:
+        """Возвращает пользователя сайта (или None), связанного с пользователем бота с заданным telegram_id."""
+        key = ("telegram_id", telegram_id)
+        found, identity = self._identity_cache.get(key)
+        if not found:
+            identity = await self._repository.get_identity_by_telegram_id(telegram_id)
+            self._identity_cache.put(key, identity)
+        return identity
+
+    async def get_by_id_hash(self, id_hash: str) -> SiteUserIdentity | None:
+        """Возвращает пользователя сайта (или None) по id_hash."""
+        key = ("id_hash", id_hash)
+        found, identity = self._identity_cache.get(key)
+        if not found:
+            identity = await self._repository.get_identity_by_id_hash(id_hash)
+            self._identity_cache.put(key, identity)
+        return identity
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from src.core.db.models import Task, User
+from src.core.db.models import Task
 from src.core.db.repository.task import TaskRepository
 from src.core.db.repository.user import UserRepository
 
@@ -20,28 +20,16 @@ class TaskService:
         user = await self._user_repository.get_by_telegram_id(telegram_id)
         return await self._task_repository.get_tasks_limit_for_user(limit, offset, user), offset, page_number
 
-    async def get_user_tasks_actualized_after(
-        self, user: User, after_datetime: datetime, after_id: int, limit: int
-    ) -> list[tuple[Task, datetime]]:
-        """Возвращает первые limit заданий, доступных пользователю user и актуализированных
-        после заданного момента времени after_datetime.
-        За время актуализации задачи принимается наибольшее из времён: изменения задачи и назначения
-        заданному пользователю категории, к которой относится задача.
-        Задачи, время актуализации которых совпадает с заданным, но их id > after_id, также
-        принимаются в расчёт.
-        Возвращаемое значение - список пар (задача, время её актуализации).
+    async def get_user_tasks_page_actualized_after(
+        self, user_id: int, after_datetime: datetime, after_id: int, limit: int
+    ) -> tuple[list[tuple[Task, datetime]], int]:
+        """Возвращает первые limit заданий, доступных пользователю с id user_id и актуализированных
+        после заданного момента времени after_datetime, в виде списка пар (задача, время её актуализации),
+        и количество оставшихся после них заданий. Выполняет один запрос к БД.
         """
-        return await self._task_repository.get_user_tasks_actualized_after(user, after_datetime, after_id, limit)
-
-    async def count_user_tasks_actualized_after(self, user: User, after_datetime: datetime, after_id: int) -> int:
-        """Возвращает количество заданий, доступных пользователю user и актуализированных
-        после заданного момента времени after_datetime.
-        За время актуализации задачи принимается наибольшее из времён: изменения задачи и назначения
-        заданному пользователю категории, к которой относится задача.
-        Задачи, время актуализации которых совпадает с заданным, но их id > after_id, также
-        принимаются в расчёт.
-        """
-        return await self._task_repository.count_user_tasks_actualized_after(user, after_datetime, after_id)
+        return await self._task_repository.get_user_tasks_page_actualized_after(
+            user_id, after_datetime, after_id, limit
+        )
 
     async def get_remaining_user_tasks_count(self, limit: int, offset: int, telegram_id: int) -> int:
         user = await self._user_repository.get_by_telegram_id(telegram_id)
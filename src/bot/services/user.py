@@ -1,9 +1,11 @@
 from structlog import get_logger
 from telegram import User as TelegramUser
 
-from src.core.db.models import ExternalSiteUser, User, UsersCategories
+from src.core.db.models import ExternalSiteUser, User
 from src.core.db.repository import CategoryRepository, ExternalSiteUserRepository, UserRepository
+from src.core.enums import CacheName
 from src.core.logging.utils import logger_decor
+from src.core.services import CacheInvalidation
 from src.core.services.users import BaseUserService
 
 logger = get_logger()
@@ -15,10 +17,12 @@ class UserService(BaseUserService):
         user_repository: UserRepository,
         ext_user_repository: ExternalSiteUserRepository,
         category_repository: CategoryRepository,
+        cache_invalidation: CacheInvalidation,
     ) -> None:
         super().__init__(user_repository)
         self._ext_user_repository = ext_user_repository
         self._category_repository = category_repository
+        self._cache_invalidation = cache_invalidation
 
     async def _update_or_create(self, user: User, **attrs) -> User:
         """Обновляет атрибуты заданного пользователя или создаёт нового,
@@ -66,6 +70,8 @@ class UserService(BaseUserService):
             )
             await logger.ainfo(f"Обновлены данные пользователя {user=}")
             await self.set_categories_to_user(user.id, ext_site_user.specializations)
+            # Пользователь сайта мог быть связан с другим telegram_id
+            self._cache_invalidation.invalidate(CacheName.IDENTITY)
 
         return user
 
@@ -84,7 +90,7 @@ class UserService(BaseUserService):
     async def add_category_to_user(self, telegram_id: int, category_id: int) -> None:
         """Добавляет пользователю указанную категорию"""
         user = await self._user_repository.get_by_telegram_id(telegram_id)
-        await self._user_repository.create(UsersCategories(user_id=user.id, category_id=category_id))
+        await self._user_repository.add_category_to_user(user, category_id)
 
     async def delete_category_from_user(self, telegram_id: int, category_id: int) -> None:
         """Удаляет у пользователя указанную категорию"""
@@ -149,9 +155,3 @@ class UserService(BaseUserService):
         """Возвращает пользователя (или None) по telegram_id."""
         user = await self._user_repository.get_by_telegram_id(telegram_id)
         return user
-
-    async def update_last_interaction(self, user: User) -> None:
-        """Обновляет last_interaction для user."""
-        if not user:
-            return
-        await self._user_repository.update_last_interaction(user)
@@ -0,0 +1,139 @@
+import asyncio
+import re
+import time
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Hashable
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+from src.core.db import ScopedSession, session_scope
+
+# Количество последних замеров времени обработки, по которым вычисляются перцентили
+LATENCY_SAMPLES_COUNT = 500
+
+
+def get_update_pattern(update: object) -> str:
+    """Возвращает шаблон обновления для группировки метрик: данные callback-запроса
+    с заменой чисел на <id>, команду или тип обновления.
+    """
+    if not isinstance(update, Update):
+        return type(update).__name__
+    if update.callback_query is not None:
+        return re.sub(r"\d+", "<id>", update.callback_query.data or "")
+    if update.message is not None and update.message.text and update.message.text.startswith("/"):
+        return update.message.text.split()[0]
+    for attribute in ("message", "edited_message", "my_chat_member", "chat_member"):
+        if getattr(update, attribute) is not None:
+            return attribute
+    return "update"
+
+
+class UpdateMetrics:
+    """Метрики обработки обновлений бота: количество ожидающих и обрабатываемых обновлений
+    и время обработки по шаблонам обновлений.
+    """
+
+    def __init__(self) -> None:
+        self.pending = 0
+        self.in_progress = 0
+        self._counts: dict[str, int] = defaultdict(int)
+        self._latencies: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=LATENCY_SAMPLES_COUNT))
+
+    def observe(self, pattern: str, duration: float) -> None:
+        """Учитывает обработку обновления с шаблоном pattern за duration секунд."""
+        self._counts[pattern] += 1
+        self._latencies[pattern].append(duration)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Возвращает текущие значения метрик. Время обработки указывается в миллисекундах
+        по последним LATENCY_SAMPLES_COUNT обновлениям каждого шаблона.
+        """
+        handlers = {}
+        for pattern, latencies in self._latencies.items():
+            ordered = sorted(latencies)
+            handlers[pattern] = {
+                "count": self._counts[pattern],
+                "p50_ms": round(ordered[len(ordered) // 2] * 1000, 2),
+                "p95_ms": round(ordered[min(len(ordered) - 1, len(ordered) * 95 // 100)] * 1000, 2),
+                "max_ms": round(ordered[-1] * 1000, 2),
+            }
+        return {"pending": self.pending, "in_progress": self.in_progress, "handlers": handlers}
+
+
+class ChatOrderedUpdateProcessor(BaseUpdateProcessor):
+    """Обработчик обновлений бота, выполняющий обновления разных чатов параллельно,
+    а обновления одного чата — строго по очереди в порядке поступления.
+
+    Одновременно обрабатывается не более max_concurrent_handlers обновлений, остальные ожидают.
+    Ожидающие своей очереди в чате обновления не занимают мест обработки. Ожидать очереди чата
+    или места обработки могут не более max_pending_updates обновлений вместе с обрабатываемыми
+    (семафор BaseUpdateProcessor), остальные ожидают этого семафора. Приложение создаёт задачу
+    для каждого полученного обновления, поэтому количество ожидающих обновлений не ограничено;
+    metrics.pending учитывает все ожидающие обновления, включая ожидающие семафора.
+    Каждое обновление обрабатывается в собственной области действия сессии БД.
+    """
+
+    def __init__(self, session: ScopedSession, max_concurrent_handlers: int, max_pending_updates: int):
+        super().__init__(max(max_pending_updates, max_concurrent_handlers))
+        self._session = session
+        self._handlers_semaphore = asyncio.BoundedSemaphore(max_concurrent_handlers)
+        # Блокировки чатов и количество обновлений, использующих каждую из них
+        self._chat_locks: dict[Hashable, tuple[asyncio.Lock, int]] = {}
+        # Корутины обработки поступивших, но ещё не начавших обрабатываться обновлений
+        self._waiting: set[Awaitable[Any]] = set()
+        self.metrics = UpdateMetrics()
+
+    async def process_update(self, update: object, coroutine: Awaitable[Any]) -> None:  # type: ignore[misc]
+        """Учитывает обновление в metrics.pending с момента поступления, в том числе
+        пока оно ожидает семафора BaseUpdateProcessor, и передаёт его базовому классу.
+        """
+        self._waiting.add(coroutine)
+        self.metrics.pending += 1
+        try:
+            await super().process_update(update, coroutine)
+        finally:
+            self._stop_waiting(coroutine)
+
+    async def do_process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+        chat = update.effective_chat if isinstance(update, Update) else None
+        async with self._chat_lock(chat.id if chat else None), self._handlers_semaphore:
+            self._stop_waiting(coroutine)
+            self.metrics.in_progress += 1
+            start = time.perf_counter()
+            try:
+                async with session_scope(self._session):
+                    await coroutine
+            finally:
+                self.metrics.in_progress -= 1
+                self.metrics.observe(get_update_pattern(update), time.perf_counter() - start)
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    def _stop_waiting(self, coroutine: Awaitable[Any]) -> None:
+        if coroutine in self._waiting:
+            self._waiting.remove(coroutine)
+            self.metrics.pending -= 1
+
+    @asynccontextmanager
+    async def _chat_lock(self, chat_id: Hashable | None) -> AsyncIterator[None]:
+        if chat_id is None:
+            yield
+            return
+        lock, users_count = self._chat_locks.get(chat_id, (asyncio.Lock(), 0))
+        self._chat_locks[chat_id] = (lock, users_count + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users_count = self._chat_locks[chat_id]
+            if users_count == 1:
+                del self._chat_locks[chat_id]
+            else:
+                self._chat_locks[chat_id] = (lock, users_count - 1)
@@ -7,9 +7,10 @@ from telegram.constants import ParseMode
 from telegram.ext import ContextTypes
 
 from src.bot.keyboards import get_unregistered_user_keyboard
-from src.bot.services import ExternalSiteUserService, UserService
+from src.bot.services import IdentityService
 from src.core.depends import Container
 from src.core.enums import UserRoles, UserStatus
+from src.core.services import LastInteractionBuffer
 
 ReturnType = TypeVar("ReturnType")
 ParameterTypes = ParamSpec("ParameterTypes")
@@ -40,10 +41,10 @@ def registered_user_required(handler: FuncT[ParameterTypes, ReturnType]) -> Func
 
     Если пользователь авторизован (т.е. для него имеется запись в таблице external_site_users
     с допустимым значением в поле role),
-    то вызывается обработчик (он получает дополнительный аргумент ext_site_user: ExternalSiteUser),
+    то вызывается обработчик (он получает дополнительный аргумент ext_site_user: SiteUserIdentity),
     в противном случае выводится сообщение о необходимости регистрации и обработчик не вызывается.
     Если обработчик вызван с аргументом (id_hash), то запись в таблице external_site_users ищется по нему,
-    в противном случает она ищется по telegram_id.
+    в противном случает она ищется по telegram_id. Результаты поиска кэшируются IdentityService.
     """
 
     @wraps(handler)
@@ -51,19 +52,19 @@ def registered_user_required(handler: FuncT[ParameterTypes, ReturnType]) -> Func
     async def decorated_handler(
         update: Update,
         context: ContextTypes.DEFAULT_TYPE,
-        ext_site_user_service: ExternalSiteUserService = Provide[
-            Container.bot_services_container.bot_site_user_service
+        identity_service: IdentityService = Provide[Container.bot_services_container.bot_identity_service],
+        last_interaction_buffer: LastInteractionBuffer = Provide[
+            Container.core_services_container.last_interaction_buffer
         ],
-        bot_user_service: UserService = Provide[Container.bot_services_container.bot_user_service],
         *args,
         **kwargs,
     ):
         telegram_user = update.effective_user or Never
         id_hash = context.args[0] if context.args and len(context.args) == 1 else None
         ext_site_user = (
-            await ext_site_user_service.get_by_id_hash(id_hash)
+            await identity_service.get_by_id_hash(id_hash)
             if id_hash
-            else await ext_site_user_service.get_by_telegram_id(telegram_user.id)
+            else await identity_service.get_by_telegram_id(telegram_user.id)
         )
         if (
             ext_site_user
@@ -83,10 +84,7 @@ def registered_user_required(handler: FuncT[ParameterTypes, ReturnType]) -> Func
                 parse_mode=ParseMode.HTML,
                 reply_markup=keyboard,
             )
-        if ext_site_user:
-            await ext_site_user_service.update_last_interaction(ext_site_user)
-        if user := await bot_user_service.get_by_telegram_id(telegram_user.id):
-            await bot_user_service.update_last_interaction(user)
+        last_interaction_buffer.touch(telegram_user.id, ext_site_user.id if ext_site_user else None)
 
     return decorated_handler
 
@@ -0,0 +1,144 @@
+import asyncio
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from telegram import InlineKeyboardButton
+
+from src.core.db.models import Category
+from src.core.db.repository import CategoryRepository
+from src.core.exceptions import NotFoundException
+
+
+@dataclass(frozen=True)
+class CategoryNode:
+    """Категория в снимке дерева категорий.
+
+    Кнопки клавиатур создаются при построении снимка: для родительской категории это кнопки
+    списка категорий (без отметки, с частичной и с полной отметкой) и кнопка возврата
+    из списка её подкатегорий, для подкатегории — кнопки выбора (без отметки и с отметкой).
+    """
+
+    id: int
+    name: str
+    parent_id: int | None
+    children: tuple["CategoryNode", ...]
+    button: InlineKeyboardButton
+    selected_button: InlineKeyboardButton
+    partially_selected_button: InlineKeyboardButton | None = None
+    back_button: InlineKeyboardButton | None = None
+
+    @property
+    def children_count(self) -> int:
+        return len(self.children)
+
+
+@dataclass(frozen=True)
+class CategoryTree:
+    """Неизменяемый снимок дерева неархивных категорий.
+
+    Attributes:
+        parents: Родительские категории, у которых есть неархивные подкатегории, по алфавиту.
+        categories: Словарь {id категории: категория} со всеми категориями, включая архивные.
+    """
+
+    parents: tuple[CategoryNode, ...]
+    categories: Mapping[int, CategoryNode]
+
+    def get(self, id: int) -> CategoryNode:
+        """Возвращает категорию по id или выбрасывает NotFoundException."""
+        try:
+            return self.categories[id]
+        except KeyError:
+            raise NotFoundException(object_name=Category.__name__, object_id=id)
+
+
+def _subcategory_node(category: Category) -> CategoryNode:
+    callback = f"select_category_{category.id}"
+    return CategoryNode(
+        id=category.id,
+        name=category.name,
+        parent_id=category.parent_id,
+        children=(),
+        button=InlineKeyboardButton(category.name, callback_data=callback),
+        selected_button=InlineKeyboardButton(f"✅ {category.name}", callback_data=callback),
+    )
+
+
+def _parent_node(category: Category, children: tuple[CategoryNode, ...]) -> CategoryNode:
+    callback = f"category_{category.id}"
+    return CategoryNode(
+        id=category.id,
+        name=category.name,
+        parent_id=category.parent_id,
+        children=children,
+        button=InlineKeyboardButton(category.name, callback_data=callback),
+        selected_button=InlineKeyboardButton(f"✅ {category.name}", callback_data=callback),
+        partially_selected_button=InlineKeyboardButton(f"☑️  {category.name}", callback_data=callback),
+        back_button=InlineKeyboardButton("Назад ⬅️", callback_data=f"back_to_{category.id}"),
+    )
+
+
+def build_category_tree(categories: Iterable[Category]) -> CategoryTree:
+    """Строит снимок дерева по списку всех категорий."""
+    categories = sorted(categories, key=lambda category: category.id)
+    children: dict[int, list[CategoryNode]] = {}
+    for category in categories:
+        if category.parent_id is not None and not category.is_archived:
+            children.setdefault(category.parent_id, []).append(_subcategory_node(category))
+
+    nodes = {}
+    for category in categories:
+        if category.id in children:
+            nodes[category.id] = _parent_node(category, tuple(children[category.id]))
+        else:
+            nodes[category.id] = _subcategory_node(category)
+
+    parents = sorted((node for node in nodes.values() if node.children), key=lambda node: node.name)
+    return CategoryTree(parents=tuple(parents), categories=MappingProxyType(nodes))
+
+
+class CategoryTreeCache:
+    """Хранит снимок дерева категорий процесса.
+
+    Снимок загружается из базы данных при первом обращении и перестраивается целиком
+    после актуализации категорий; читатели до замены продолжают пользоваться прежним снимком.
+    Другие процессы сбрасывают свои снимки по уведомлению (см. CacheInvalidation);
+    если уведомление было пропущено, снимок перезагружается, когда его возраст превысит ttl секунд.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._tree: CategoryTree | None = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self, repository: CategoryRepository) -> CategoryTree:
+        """Возвращает текущий снимок, загружая его при необходимости."""
+        tree = self._tree
+        if tree is None or self._expires_at < time.monotonic():
+            async with self._lock:
+                if self._tree is None or self._expires_at < time.monotonic():
+                    self._set_tree(build_category_tree(await repository.get_all()))
+                tree = self._tree
+        return tree
+
+    async def rebuild(self, repository: CategoryRepository) -> None:
+        """Загружает новый снимок и атомарно заменяет им текущий.
+        При ошибке загрузки снимок сбрасывается и будет загружен при следующем обращении.
+        """
+        async with self._lock:
+            try:
+                self._set_tree(build_category_tree(await repository.get_all()))
+            except Exception:
+                self._tree = None
+                raise
+
+    def invalidate(self) -> None:
+        """Сбрасывает снимок."""
+        self._tree = None
+
+    def _set_tree(self, tree: CategoryTree) -> None:
+        self._tree = tree
+        self._expires_at = time.monotonic() + self._ttl
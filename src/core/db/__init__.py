@@ -1,3 +1,3 @@
-from src.core.db.db import get_session
+from src.core.db.db import ScopedSession, create_scoped_session, get_session, session_scope
 
-__all__ = ("get_session",)
+__all__ = ("ScopedSession", "create_scoped_session", "get_session", "session_scope")
@@ -1,14 +1,51 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import Generator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session, async_sessionmaker, create_async_engine
 
 from src.settings import settings
 
 engine = create_async_engine(settings.database_url)
 
+# Ключ области действия сессии. Вне областей (например, при запуске приложения) равен None,
+# и все обращения используют одну общую сессию.
+session_scope_key: ContextVar[object | None] = ContextVar("session_scope_key", default=None)
+
 
 async def get_session(
     sessionmaker=async_sessionmaker(engine, expire_on_commit=False)
 ) -> Generator[AsyncSession, None, None]:
     async with sessionmaker() as session:
         yield session
+
+
+class ScopedSession(async_scoped_session):
+    """Сессия, все обращения к которой перенаправляются сессии текущей области действия
+    (HTTP-запроса или обновления телеграм-бота), см. session_scope.
+    """
+
+    async def __aenter__(self) -> AsyncSession:
+        return await self().__aenter__()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self().__aexit__(*exc_info)
+
+
+def create_scoped_session(sessionmaker: async_sessionmaker) -> ScopedSession:
+    return ScopedSession(sessionmaker, scopefunc=session_scope_key.get)
+
+
+@asynccontextmanager
+async def session_scope(session: ScopedSession) -> AsyncIterator[None]:
+    """Открывает область действия, в которой session обращается к отдельной сессии.
+    Сессия создаётся при первом обращении и закрывается при выходе из области.
+    Задачи, созданные внутри области, наследуют её сессию.
+    """
+    token = session_scope_key.set(object())
+    try:
+        yield
+    finally:
+        await session.remove()
+        session_scope_key.reset(token)
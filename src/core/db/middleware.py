@@ -0,0 +1,20 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.db.db import ScopedSession, session_scope
+
+
+class SessionScopeMiddleware:
+    """Выполняет каждый HTTP-запрос в собственной области действия сессии БД,
+    чтобы одновременные запросы не использовали одну сессию и одно соединение.
+    """
+
+    def __init__(self, app: ASGIApp, session: ScopedSession) -> None:
+        self.app = app
+        self.session = session
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        async with session_scope(self.session):
+            await self.app(scope, receive, send)
@@ -0,0 +1,59 @@
+"""coalesce task mailings
+
+Revision ID: 8d3c6a4f9e12
+Revises: 5b8e1f0c2a71
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8d3c6a4f9e12"
+down_revision = "5b8e1f0c2a71"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "mailing_tasks",
+        sa.Column("mailing_id", sa.Integer(), nullable=False),
+        sa.Column("task_id", sa.Integer(), nullable=False),
+        sa.Column("updated_task", sa.Boolean(), server_default=sa.text("false"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.ForeignKeyConstraint(["mailing_id"], ["mailings.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["task_id"],
+            ["tasks.id"],
+        ),
+        sa.PrimaryKeyConstraint("mailing_id", "task_id"),
+    )
+    op.execute(
+        "INSERT INTO mailing_tasks (mailing_id, task_id, updated_task) "
+        "SELECT id, task_id, updated_task FROM mailings WHERE task_id IS NOT NULL"
+    )
+    op.add_column("mailing_recipients", sa.Column("task_ids", sa.ARRAY(sa.Integer()), nullable=True))
+    op.execute(
+        "UPDATE mailing_recipients SET task_ids = ARRAY[mailings.task_id] "
+        "FROM mailings WHERE mailings.id = mailing_recipients.mailing_id AND mailings.task_id IS NOT NULL"
+    )
+    op.drop_constraint("mailings_task_id_fkey", "mailings", type_="foreignkey")
+    op.drop_column("mailings", "updated_task")
+    op.drop_column("mailings", "task_id")
+
+
+def downgrade() -> None:
+    op.add_column("mailings", sa.Column("task_id", sa.Integer(), nullable=True))
+    op.add_column(
+        "mailings", sa.Column("updated_task", sa.Boolean(), server_default=sa.text("false"), nullable=False)
+    )
+    op.create_foreign_key("mailings_task_id_fkey", "mailings", "tasks", ["task_id"], ["id"])
+    op.execute(
+        "UPDATE mailings SET task_id = mailing_tasks.task_id, updated_task = mailing_tasks.updated_task "
+        "FROM mailing_tasks WHERE mailing_tasks.mailing_id = mailings.id"
+    )
+    op.drop_column("mailing_recipients", "task_ids")
+    op.drop_table("mailing_tasks")
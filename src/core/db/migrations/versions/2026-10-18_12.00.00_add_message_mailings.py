@@ -0,0 +1,24 @@
+"""add message mailings
+
+Revision ID: 2f7a9c1d4b36
+Revises: 8d3c6a4f9e12
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2f7a9c1d4b36"
+down_revision = "8d3c6a4f9e12"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("mailings", sa.Column("message", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("mailings", "message")
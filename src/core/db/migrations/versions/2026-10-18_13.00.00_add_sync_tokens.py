@@ -0,0 +1,31 @@
+"""add sync tokens
+
+Revision ID: 6e4b2d8a1c53
+Revises: 2f7a9c1d4b36
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6e4b2d8a1c53"
+down_revision = "2f7a9c1d4b36"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sync_tokens",
+        sa.Column("stream", sa.String(length=16), nullable=False),
+        sa.Column("token", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.PrimaryKeyConstraint("stream"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("sync_tokens")
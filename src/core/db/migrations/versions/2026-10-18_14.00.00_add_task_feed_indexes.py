@@ -0,0 +1,35 @@
+"""add task feed indexes
+
+Revision ID: 3c9e5a7b2f18
+Revises: 6e4b2d8a1c53
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3c9e5a7b2f18"
+down_revision = "6e4b2d8a1c53"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tasks_active_category_id",
+        "tasks",
+        ["category_id", "updated_at", "id"],
+        postgresql_where=sa.text("is_archived = false"),
+    )
+    op.create_index(
+        "ix_users_categories_user_id_category_id",
+        "users_categories",
+        ["user_id", "category_id", "updated_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_categories_user_id_category_id", table_name="users_categories")
+    op.drop_index("ix_tasks_active_category_id", table_name="tasks")
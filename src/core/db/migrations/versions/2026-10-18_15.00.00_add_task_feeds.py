@@ -0,0 +1,44 @@
+"""add task feeds
+
+Revision ID: 9a1f4c6e3d27
+Revises: 3c9e5a7b2f18
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9a1f4c6e3d27"
+down_revision = "3c9e5a7b2f18"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_feeds",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("task_id", sa.Integer(), nullable=False),
+        sa.Column("actualizing_time", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "task_id"),
+    )
+    op.execute(
+        "INSERT INTO task_feeds (user_id, task_id, actualizing_time) "
+        "SELECT users_categories.user_id, tasks.id, greatest(users_categories.updated_at, tasks.updated_at) "
+        "FROM tasks JOIN users_categories ON users_categories.category_id = tasks.category_id "
+        "WHERE tasks.is_archived = false"
+    )
+    op.create_index(
+        "ix_task_feeds_user_id_actualizing_time", "task_feeds", ["user_id", "actualizing_time", "task_id"]
+    )
+    op.create_index("ix_task_feeds_task_id", "task_feeds", ["task_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_feeds_task_id", table_name="task_feeds")
+    op.drop_index("ix_task_feeds_user_id_actualizing_time", table_name="task_feeds")
+    op.drop_table("task_feeds")
@@ -0,0 +1,23 @@
+"""add external_site_users id_hash index
+
+Revision ID: 5d8b3e1f7a42
+Revises: 9a1f4c6e3d27
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5d8b3e1f7a42"
+down_revision = "9a1f4c6e3d27"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f("ix_external_site_users_id_hash"), "external_site_users", ["id_hash"])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_external_site_users_id_hash"), table_name="external_site_users")
@@ -3,18 +3,21 @@ from typing import Never
 
 from fastapi_users_db_sqlalchemy import SQLAlchemyBaseUserTable
 from passlib.context import CryptContext
-from sqlalchemy import ARRAY, BigInteger, ForeignKey, Integer, String
+from sqlalchemy import ARRAY, BigInteger, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import AbstractConcreteBase
 from sqlalchemy.orm import DeclarativeBase, Mapped, backref, mapped_column, relationship
 from sqlalchemy.sql import expression, func
 
-from src.core.enums import UserRoles
+from src.core.enums import MailingRecipientStatus, UserRoles
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 MAX_USER_ROLE_NAME_LENGTH = 20
 MAX_LENGTH_BOT_MESSAGE = 4096
+MAX_MAILING_TYPE_LENGTH = 16
+MAX_MAILING_STATUS_LENGTH = 16
+MAX_SYNC_STREAM_LENGTH = 16
 
 
 class Base(DeclarativeBase):
@@ -42,6 +45,7 @@ class UsersCategories(Base):
     """Модель отношений пользователь-категория."""
 
     __tablename__ = "users_categories"
+    __table_args__ = (Index("ix_users_categories_user_id_category_id", "user_id", "category_id", "updated_at"),)
 
     id = None
     category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"), primary_key=True)
@@ -100,7 +104,7 @@ class ExternalSiteUser(ArchivableBase):
 
     __tablename__ = "external_site_users"
 
-    id_hash: Mapped[str] = mapped_column(String(256), nullable=True)
+    id_hash: Mapped[str] = mapped_column(String(256), nullable=True, index=True)
     external_id: Mapped[int | None] = mapped_column(nullable=True, index=True)
     role: Mapped[str] = mapped_column(String(MAX_USER_ROLE_NAME_LENGTH), nullable=True)
     email: Mapped[str | None] = mapped_column(String(256), nullable=True)
@@ -123,10 +127,44 @@ class ExternalSiteUser(ArchivableBase):
         return f"<SiteUser {self.id}>"
 
 
+class TaskFeed(Base):
+    """Модель ленты заданий пользователя.
+
+    Содержит неархивные задания из категорий пользователя со временем их актуализации:
+    наибольшим из времён изменения задания и назначения пользователю категории задания.
+    Поддерживается репозиторием TaskFeedRepository при изменении заданий и категорий пользователей.
+    """
+
+    __tablename__ = "task_feeds"
+    __table_args__ = (
+        Index("ix_task_feeds_user_id_actualizing_time", "user_id", "actualizing_time", "task_id"),
+        Index("ix_task_feeds_task_id", "task_id"),
+    )
+
+    id = None
+    created_at = None
+    updated_at = None
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    actualizing_time: Mapped[datetime]
+
+    def __repr__(self):
+        return f"<User {self.user_id} - Task {self.task_id}>"
+
+
 class Task(ArchivableBase):
     """Модель задач."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index(
+            "ix_tasks_active_category_id",
+            "category_id",
+            "updated_at",
+            "id",
+            postgresql_where=expression.text("is_archived = false"),
+        ),
+    )
 
     title: Mapped[str]
     name_organization: Mapped[str] = mapped_column(nullable=True)
@@ -252,3 +290,76 @@ class TechMessage(ArchivableBase):
 
     def __repr__(self):
         return f"<Tech message - Text {self.text} - Was read {self.was_read}>"
+
+
+class Mailing(Base):
+    """Модель рассылки сообщений пользователям бота."""
+
+    __tablename__ = "mailings"
+
+    type: Mapped[str] = mapped_column(String(MAX_MAILING_TYPE_LENGTH))
+    message: Mapped[str | None] = mapped_column(nullable=True)
+    tasks: Mapped[list["MailingTask"]] = relationship(back_populates="mailing")
+    recipients: Mapped[list["MailingRecipient"]] = relationship(back_populates="mailing")
+
+    def __repr__(self):
+        return f"<Mailing {self.id} - Type {self.type}>"
+
+
+class MailingTask(Base):
+    """Модель задания, включённого в рассылку."""
+
+    __tablename__ = "mailing_tasks"
+
+    id = None
+    mailing_id: Mapped[int] = mapped_column(ForeignKey("mailings.id", ondelete="CASCADE"), primary_key=True)
+    mailing: Mapped["Mailing"] = relationship(back_populates="tasks")
+    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id"), primary_key=True)
+    task: Mapped["Task"] = relationship()
+    updated_task: Mapped[bool] = mapped_column(server_default=expression.false())
+
+    def __repr__(self):
+        return f"<Mailing {self.mailing_id} - Task {self.task_id}>"
+
+
+class MailingRecipient(Base):
+    """Модель получателя рассылки (очередь отправки сообщений)."""
+
+    __tablename__ = "mailing_recipients"
+    __table_args__ = (
+        UniqueConstraint("mailing_id", "user_id"),
+        Index(
+            "ix_mailing_recipients_unsent",
+            "id",
+            postgresql_where=expression.text("status IN ('pending', 'processing')"),
+        ),
+    )
+
+    mailing_id: Mapped[int] = mapped_column(ForeignKey("mailings.id", ondelete="CASCADE"))
+    mailing: Mapped["Mailing"] = relationship(back_populates="recipients")
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    telegram_id: Mapped[int] = mapped_column(BigInteger)
+    task_ids: Mapped[list[int] | None] = mapped_column(ARRAY(Integer), nullable=True)
+    status: Mapped[str] = mapped_column(
+        String(MAX_MAILING_STATUS_LENGTH), server_default=MailingRecipientStatus.PENDING.value
+    )
+    attempts: Mapped[int] = mapped_column(server_default="0")
+    locked_until: Mapped[datetime | None] = mapped_column(nullable=True)
+    sent_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    error: Mapped[str | None] = mapped_column(nullable=True)
+
+    def __repr__(self):
+        return f"<Mailing {self.mailing_id} - User {self.user_id} - Status {self.status}>"
+
+
+class SyncToken(Base):
+    """Модель токена последней применённой инкрементальной синхронизации с сайтом."""
+
+    __tablename__ = "sync_tokens"
+
+    id = None
+    stream: Mapped[str] = mapped_column(String(MAX_SYNC_STREAM_LENGTH), primary_key=True)
+    token: Mapped[str]
+
+    def __repr__(self):
+        return f"<SyncToken {self.stream} - {self.token}>"
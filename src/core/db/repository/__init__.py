@@ -1,9 +1,13 @@
 from .admin_repository import AdminUserRepository
 from .admin_token_request import AdminTokenRequestRepository
-from .base import AbstractRepository, ContentRepository
+from .base import AbstractRepository, ContentRepository, UpsertResult
 from .category import CategoryRepository
-from .external_site_user import ExternalSiteUserRepository
+from .external_site_user import ExternalSiteUserRepository, SiteUserIdentity
+from .mailing import MailingRepository
+from .mailing_recipient import MailingRecipientRepository
+from .sync_token import SyncTokenRepository
 from .task import TaskRepository
+from .task_feed import TaskFeedRepository
 from .tech_message import TechMessageRepository
 from .unsubscribe_reason import UnsubscribeReasonRepository
 from .user import UserRepository
@@ -11,11 +15,17 @@ from .user import UserRepository
 __all__ = (
     "AbstractRepository",
     "ContentRepository",
+    "UpsertResult",
     "CategoryRepository",
     "TaskRepository",
+    "TaskFeedRepository",
     "TechMessageRepository",
     "UserRepository",
     "ExternalSiteUserRepository",
+    "SiteUserIdentity",
+    "MailingRepository",
+    "MailingRecipientRepository",
+    "SyncTokenRepository",
     "UnsubscribeReasonRepository",
     "AdminUserRepository",
     "AdminTokenRequestRepository",
@@ -1,8 +1,34 @@
 import abc
+import json
 from abc import abstractmethod
-from typing import Any, Generic, Sequence, TypeVar
-
-from sqlalchemy import Select, false, func, select, true, update
+from typing import Any, Generic, Iterable, Mapping, NamedTuple, Sequence, TypeVar
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    ColumnElement,
+    Float,
+    Integer,
+    Select,
+    TableValuedAlias,
+    Text,
+    all_,
+    any_,
+    cast,
+    column,
+    false,
+    func,
+    literal,
+    literal_column,
+    select,
+    true,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import DuplicateColumnError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.expression import desc
@@ -15,6 +41,12 @@ from src.core.utils import auto_commit
 logger = get_logger()
 DatabaseModel = TypeVar("DatabaseModel")
 DATE_TIME_FORMAT_LAST_UPDATE = "YYYY-MM-DD HH24:MI:SS"
+LAST_INTERACTIONS_CHUNK_SIZE = 5000
+
+
+def integer_array(values: Iterable[int]) -> ColumnElement:
+    """Возвращает параметр запроса с массивом целых чисел values для сравнения через ANY/ALL."""
+    return cast(literal(list(values), ARRAY(Integer)), ARRAY(Integer))
 
 
 class AbstractRepository(abc.ABC, Generic[DatabaseModel]):
@@ -73,6 +105,27 @@ class AbstractRepository(abc.ABC, Generic[DatabaseModel]):
         objects = await self._session.scalars(select(self._model))
         return objects.all()
 
+    async def _set_last_interactions(self, key: ColumnElement, ages: Mapping[int, float]) -> None:
+        """Записывает в поле last_interaction время последнего взаимодействия с ботом
+        запросами UPDATE ... FROM (VALUES ...), по одному на каждые LAST_INTERACTIONS_CHUNK_SIZE объектов.
+        Время отсчитывается от текущего времени сервера базы данных.
+
+        Args:
+            key: Столбец, по значениям которого ищутся объекты.
+            ages: Словарь {значение столбца key: сколько секунд назад было взаимодействие}.
+        """
+        items = list(ages.items())
+        for start in range(0, len(items), LAST_INTERACTIONS_CHUNK_SIZE):
+            interactions = values(column("key", BigInteger), column("age", Float), name="interactions").data(
+                items[start : start + LAST_INTERACTIONS_CHUNK_SIZE]
+            )
+            await self._session.execute(
+                update(self._model)
+                .where(key == interactions.c.key)
+                .values(last_interaction=func.now() - interactions.c.age * literal_column("interval '1 second'"))
+                .execution_options(synchronize_session=False)
+            )
+
     @auto_commit
     async def create_all(self, objects: Sequence[DatabaseModel]) -> None:
         """Создает несколько объектов модели в базе данных."""
@@ -154,18 +207,56 @@ class ArchivableRepository(AbstractRepository):
         return db_obj
 
 
+class UpsertResult(NamedTuple):
+    """Результат добавления или обновления объекта методом ContentRepository.upsert."""
+
+    id: int
+    inserted: bool
+    changed: bool
+    modified: bool
+
+
 class ContentRepository(ArchivableRepository):
     """Абстрактный класс, для контента."""
 
     @auto_commit
-    async def archive_by_ids(self, ids: Sequence[int]) -> None:
-        """Изменяет is_archived с False на True у не указанных ids."""
-        await self._session.execute(
+    async def archive_by_ids(self, ids: Sequence[int]) -> Sequence[int]:
+        """Изменяет is_archived с False на True у не указанных ids.
+        Список ids передаётся в запрос одним параметром-массивом (id <> ALL(:ids)),
+        поэтому размер запроса не зависит от количества объектов.
+
+        Returns:
+            Список id заархивированных объектов.
+        """
+        return await self._archive_where(self._model.id != all_(integer_array(ids)))
+
+    @auto_commit
+    async def archive_selected(self, ids: Sequence[int]) -> Sequence[int]:
+        """Изменяет is_archived с False на True у указанных ids.
+
+        Returns:
+            Список id заархивированных объектов.
+        """
+        return await self._archive_where(self._model.id == any_(integer_array(ids)))
+
+    async def _archive_where(self, condition: ColumnElement[bool]) -> Sequence[int]:
+        """Архивирует неархивные объекты, удовлетворяющие условию condition, и возвращает их id."""
+        archived_ids = await self._session.scalars(
             update(self._model)
             .where(self._model.is_archived == False)  # noqa
-            .where(self._model.id.not_in(ids))
+            .where(condition)
             .values({"is_archived": True})
+            .returning(self._model.id)
+            .execution_options(synchronize_session=False)
         )
+        archived_ids = archived_ids.all()
+        await self._on_objects_changed(archived_ids)
+        return archived_ids
+
+    async def _on_objects_changed(self, ids: Sequence[int]) -> None:
+        """Вызывается после добавления, изменения или архивирования объектов с заданными id
+        в той же транзакции. Позволяет репозиториям обновлять зависящие от объектов данные.
+        """
 
     async def get_by_ids(self, ids: list[int]) -> Sequence[int]:
         """Возвращает id объектов модели из базы данных по указанным ids"""
@@ -177,6 +268,106 @@ class ContentRepository(ArchivableRepository):
         filtered_ids = await self._session.scalars(select(self._model.id).filter_by(**filter_by))
         return filtered_ids.all()
 
+    @auto_commit
+    async def upsert(self, objects: Sequence[dict[str, Any]], trigger_fields: Sequence[str]) -> list[UpsertResult]:
+        """Добавляет новые и обновляет существующие объекты одним запросом
+        INSERT ... ON CONFLICT (id) DO UPDATE. Обновлённые объекты разархивируются.
+        Существующие объекты, поля которых не изменились, не перезаписываются
+        и сохраняют прежнее время обновления.
+
+        Args:
+            objects: Словари с полями объектов (обязательно наличие поля id).
+            trigger_fields: Поля, изменение которых считается изменением объекта.
+
+        Returns:
+            Для каждого объекта: его id, признак добавления нового объекта, признак
+            изменения хотя бы одного из полей trigger_fields у существующего объекта
+            и признак перезаписи существующего объекта (изменилось хотя бы одно поле
+            или объект был архивным).
+        """
+        if not objects:
+            return []
+        # Повторная вставка строки с тем же id в одном запросе ON CONFLICT DO UPDATE недопустима
+        objects = list({obj["id"]: obj for obj in objects}.values())
+        table_columns = self._model.__table__.c
+        fields = [field for field in objects[0] if field in table_columns]
+        trigger_fields = [field for field in trigger_fields if field in fields]
+        incoming = select(self._unnest(objects, fields)).cte("incoming")
+        old = (
+            select(self._model.id, *(getattr(self._model, field) for field in trigger_fields))
+            .where(self._model.id.in_(select(incoming.c.id)))
+            .cte("old")
+        )
+        statement = pg_insert(self._model).from_select(
+            [*fields, "is_archived"],
+            select(*(self._incoming_column(incoming, field) for field in fields), false()),
+        )
+        updated_fields = [field for field in fields if field != "id"]
+        modified = self._model.is_archived == true()
+        if updated_fields:
+            modified |= tuple_(*(getattr(self._model, field) for field in updated_fields)).is_distinct_from(
+                tuple_(*(statement.excluded[field] for field in updated_fields))
+            )
+        upserted = (
+            statement.on_conflict_do_update(
+                index_elements=[self._model.id],
+                set_={
+                    **{field: statement.excluded[field] for field in updated_fields},
+                    "is_archived": False,
+                    "updated_at": func.current_timestamp(),
+                },
+                where=modified,
+            )
+            .returning(self._model.id, literal_column("xmax = 0", Boolean).label("inserted"))
+            .cte("upserted")
+        )
+        # Все части запроса видят данные до его выполнения, поэтому в old остаются прежние значения полей
+        changed = (
+            old.c.id.is_not(None)
+            & tuple_(*(old.c[field] for field in trigger_fields)).is_distinct_from(
+                tuple_(*(self._incoming_column(incoming, field) for field in trigger_fields))
+            )
+            if trigger_fields
+            else false()
+        )
+        # Неизменившиеся объекты не перезаписываются и отсутствуют в upserted
+        results = await self._session.execute(
+            select(
+                incoming.c.id,
+                func.coalesce(upserted.c.inserted, false()),
+                changed,
+                upserted.c.id.is_not(None) & ~upserted.c.inserted,
+            )
+            .select_from(incoming)
+            .outerjoin(upserted, upserted.c.id == incoming.c.id)
+            .outerjoin(old, old.c.id == incoming.c.id)
+        )
+        results = [UpsertResult(*row) for row in results]
+        await self._on_objects_changed([result.id for result in results if result.inserted or result.modified])
+        return results
+
+    def _unnest(self, objects: Sequence[dict[str, Any]], fields: Sequence[str]) -> TableValuedAlias:
+        """Возвращает набор строк unnest(...) с полями fields из переданных объектов.
+        Каждое поле передаётся в запрос одним параметром-массивом с типом соответствующего столбца модели.
+        Значения JSON-полей передаются строками и приводятся к нужному типу в _incoming_column.
+        """
+        arrays = []
+        for field in fields:
+            column_type = self._model.__table__.c[field].type
+            values = [obj.get(field) for obj in objects]
+            if isinstance(column_type, JSON):
+                column_type = Text()
+                values = [None if value is None else json.dumps(value, ensure_ascii=False) for value in values]
+            arrays.append(cast(literal(values, ARRAY(column_type)), ARRAY(column_type)))
+        return func.unnest(*arrays).table_valued(*fields).render_derived(name="incoming")
+
+    def _incoming_column(self, incoming: TableValuedAlias, field: str) -> ColumnElement:
+        """Возвращает столбец field набора строк, построенного методом _unnest, с типом столбца модели."""
+        column_type = self._model.__table__.c[field].type
+        if isinstance(column_type, JSON):
+            return cast(incoming.c[field], column_type)
+        return incoming.c[field]
+
 
 class FilterableRepository(AbstractRepository):
     """Абстрактный класс для репозитория с данными, которые можно фильтровать."""
@@ -1,12 +1,38 @@
-from sqlalchemy import func, select
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from sqlalchemy import Select, any_, false, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.db.models import ExternalSiteUser, Task, TaskResponseVolunteer
-from src.core.db.repository.base import ArchivableRepository
+from src.core.db.models import ExternalSiteUser, Task, TaskResponseVolunteer, User
+from src.core.db.repository.base import ArchivableRepository, integer_array
+from src.core.enums import UserRoles
 from src.core.exceptions import NotFoundException
 from src.core.utils import auto_commit
 
 
+@dataclass(frozen=True, slots=True)
+class SiteUserIdentity:
+    """Облегчённое представление неархивного пользователя сайта и связанного с ним пользователя бота,
+    используемое для проверки доступа в обработчиках бота.
+    """
+
+    id: int
+    external_id: int | None
+    role: str | None
+    moderation_status: str | None
+    has_mailing_new_tasks: bool | None
+    has_mailing_profile: bool | None
+    has_mailing_my_tasks: bool | None
+    has_mailing_procharity: bool | None
+    user_id: int | None
+    user_role: str | None
+
+    @property
+    def is_volunteer(self) -> bool:
+        return (self.user_role or self.role) == UserRoles.VOLUNTEER
+
+
 class ExternalSiteUserRepository(ArchivableRepository):
     """Репозиторий для работы с моделью ExternalSiteUser."""
 
@@ -18,6 +44,34 @@ class ExternalSiteUserRepository(ArchivableRepository):
         statement = select(ExternalSiteUser).where(ExternalSiteUser.id_hash == id_hash)
         return await self._session.scalar(self._add_archiveness_test_to_select(statement, is_archived))
 
+    async def get_identity_by_telegram_id(self, telegram_id: int) -> SiteUserIdentity | None:
+        """Возвращает одним запросом представление неархивного пользователя сайта (или None),
+        связанного с пользователем бота с заданным telegram_id.
+        """
+        statement = self._select_identity().join(User, User.external_id == ExternalSiteUser.id)
+        row = (await self._session.execute(statement.where(User.telegram_id == telegram_id))).first()
+        return SiteUserIdentity(*row) if row else None
+
+    async def get_identity_by_id_hash(self, id_hash: str) -> SiteUserIdentity | None:
+        """Возвращает одним запросом представление неархивного пользователя сайта (или None) по id_hash."""
+        statement = self._select_identity().outerjoin(User, User.external_id == ExternalSiteUser.id)
+        row = (await self._session.execute(statement.where(ExternalSiteUser.id_hash == id_hash))).first()
+        return SiteUserIdentity(*row) if row else None
+
+    def _select_identity(self) -> Select:
+        return select(
+            ExternalSiteUser.id,
+            ExternalSiteUser.external_id,
+            ExternalSiteUser.role,
+            ExternalSiteUser.moderation_status,
+            ExternalSiteUser.has_mailing_new_tasks,
+            ExternalSiteUser.has_mailing_profile,
+            ExternalSiteUser.has_mailing_my_tasks,
+            ExternalSiteUser.has_mailing_procharity,
+            User.id,
+            User.role,
+        ).where(ExternalSiteUser.is_archived == false())
+
     async def get_user_response_to_task_or_none(
         self, site_user: ExternalSiteUser, task: Task
     ) -> TaskResponseVolunteer | None:
@@ -30,6 +84,22 @@ class ExternalSiteUserRepository(ArchivableRepository):
             .where(TaskResponseVolunteer.task_id == task.id)
         )
 
+    async def get_responses_to_tasks(
+        self, tasks: Iterable[Task], site_user_ids: Iterable[int] | None = None
+    ) -> set[tuple[int, int]]:
+        """Возвращает множество пар (id задачи, id пользователя) для откликов на заданные задачи.
+        Если заданы site_user_ids, учитываются только отклики этих пользователей.
+        """
+        statement = select(TaskResponseVolunteer.task_id, TaskResponseVolunteer.external_site_user_id).where(
+            TaskResponseVolunteer.task_id == any_(integer_array(task.id for task in tasks))
+        )
+        if site_user_ids is not None:
+            statement = statement.where(
+                TaskResponseVolunteer.external_site_user_id == any_(integer_array(site_user_ids))
+            )
+        responses = await self._session.execute(statement)
+        return set(responses.tuples())
+
     async def user_responded_to_task(self, site_user: ExternalSiteUser, task: Task) -> bool:
         """Возвращает True, если в БД имеется отклик заданного пользователя
         на заданную задачу, иначе False.
@@ -101,7 +171,11 @@ class ExternalSiteUserRepository(ArchivableRepository):
         site_user.has_mailing_procharity = has_mailing_procharity
         await self.update(site_user.id, site_user)
 
-    async def update_last_interaction(self, site_user: ExternalSiteUser) -> None:
-        """Обновляет статус ExternalSiteUser.last_interaction текущим временем."""
-        site_user.last_interaction = func.now()
-        await self.update(site_user.id, site_user)
+    @auto_commit
+    async def set_last_interactions(self, ages: Mapping[int, float]) -> None:
+        """Записывает время последнего взаимодействия с ботом пользователям сайта.
+
+        Args:
+            ages: Словарь {id пользователя сайта: сколько секунд назад было взаимодействие}.
+        """
+        await self._set_last_interactions(ExternalSiteUser.id, ages)
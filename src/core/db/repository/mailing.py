@@ -0,0 +1,161 @@
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+
+from sqlalchemy import Select, and_, any_, func, insert, literal, or_, orm, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.db.models import Mailing, MailingRecipient, MailingTask, Task, User, UsersCategories
+from src.core.db.repository.base import AbstractRepository, integer_array
+from src.core.enums import MailingRecipientStatus, MailingType
+from src.core.utils import auto_commit
+
+
+class MailingRepository(AbstractRepository):
+    """Репозиторий для работы с моделями Mailing и MailingRecipient."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session, Mailing)
+
+    @auto_commit
+    async def create_task_mailing(self, tasks: Iterable[tuple[int, bool]]) -> Mailing | None:
+        """Создаёт рассылку заданий и ставит в очередь по одному сообщению каждому пользователю,
+        подписанному на категорию хотя бы одного из заданий. Для каждого получателя сохраняется
+        список заданий из его категорий. Если заданий нет, рассылка не создаётся.
+
+        Args:
+            tasks: Пары (id задания, признак обновления задания).
+        """
+        mailing_tasks = [MailingTask(task_id=task_id, updated_task=updated_task) for task_id, updated_task in tasks]
+        if not mailing_tasks:
+            return None
+
+        mailing = Mailing(type=MailingType.TASK, tasks=mailing_tasks)
+        self._session.add(mailing)
+        await self._session.flush()
+        task_ids = integer_array(mailing_task.task_id for mailing_task in mailing_tasks)
+        user_task_ids = func.array_agg(aggregate_order_by(Task.id, Task.id))
+        await self._session.execute(
+            insert(MailingRecipient).from_select(
+                ["mailing_id", "user_id", "telegram_id", "task_ids"],
+                select(literal(mailing.id), User.id, User.telegram_id, user_task_ids)
+                .join(UsersCategories, UsersCategories.user_id == User.id)
+                .join(User.external_user)
+                .join(Task, Task.category_id == UsersCategories.category_id)
+                .where(Task.id == any_(task_ids))
+                .where(User.has_mailing.is_(True) & User.banned.is_(False))
+                .group_by(User.id),
+            )
+        )
+        return mailing
+
+    @auto_commit
+    async def create_message_mailing(self, message: str, recipients: Select) -> Mailing:
+        """Создаёт рассылку текстового сообщения и ставит его в очередь отправки.
+
+        Args:
+            message: Текст сообщения.
+            recipients: Оператор SELECT, возвращающий id и telegram_id получателей.
+        """
+        mailing = Mailing(type=MailingType.MESSAGE, message=message)
+        self._session.add(mailing)
+        await self._session.flush()
+        recipients = recipients.subquery()
+        await self._session.execute(
+            insert(MailingRecipient).from_select(
+                ["mailing_id", "user_id", "telegram_id"],
+                select(literal(mailing.id), *recipients.c),
+            )
+        )
+        return mailing
+
+    async def get_recipients_statistics(self, mailing: Mailing) -> dict[str, tuple[int, datetime | None]]:
+        """Возвращает статистику получателей рассылки в виде словаря
+        {статус отправки: (количество получателей, время последнего изменения)}.
+        """
+        rows = await self._session.execute(
+            select(MailingRecipient.status, func.count(), func.max(MailingRecipient.updated_at))
+            .where(MailingRecipient.mailing_id == mailing.id)
+            .group_by(MailingRecipient.status)
+        )
+        return {status: (count, updated_at) for status, count, updated_at in rows}
+
+    async def get_mailing_tasks(self, mailing: Mailing) -> Sequence[MailingTask]:
+        """Возвращает задания рассылки вместе с заданиями и их категориями."""
+        mailing_tasks = await self._session.scalars(
+            select(MailingTask)
+            .options(orm.joinedload(MailingTask.task).joinedload(Task.category))
+            .where(MailingTask.mailing_id == mailing.id)
+        )
+        return mailing_tasks.all()
+
+    @auto_commit
+    async def acquire_recipients(self, limit: int, lease_time: int, max_attempts: int) -> Sequence[MailingRecipient]:
+        """Захватывает для отправки не более limit получателей из очереди.
+
+        Берутся ожидающие отправки получатели и получатели, срок захвата которых истёк
+        (например, после перезапуска процесса). Получатели, уже захваченные другими
+        обработчиками, пропускаются (SKIP LOCKED).
+        """
+        now = func.current_timestamp()
+        candidates = (
+            select(MailingRecipient.id)
+            .where(
+                or_(
+                    MailingRecipient.status == MailingRecipientStatus.PENDING,
+                    and_(
+                        MailingRecipient.status == MailingRecipientStatus.PROCESSING,
+                        MailingRecipient.locked_until < now,
+                    ),
+                )
+            )
+            .where(MailingRecipient.attempts < max_attempts)
+            .order_by(MailingRecipient.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        recipients = await self._session.scalars(
+            update(MailingRecipient)
+            .where(MailingRecipient.id.in_(candidates))
+            .values(
+                status=MailingRecipientStatus.PROCESSING,
+                attempts=MailingRecipient.attempts + 1,
+                locked_until=now + timedelta(seconds=lease_time),
+            )
+            .returning(MailingRecipient)
+            .execution_options(synchronize_session=False)
+        )
+        return sorted(recipients.all(), key=lambda recipient: recipient.id)
+
+    @auto_commit
+    async def fail_exhausted_recipients(self, max_attempts: int) -> None:
+        """Помечает неотправленными получателей, исчерпавших число попыток отправки."""
+        await self._session.execute(
+            update(MailingRecipient)
+            .where(MailingRecipient.status == MailingRecipientStatus.PROCESSING)
+            .where(MailingRecipient.locked_until < func.current_timestamp())
+            .where(MailingRecipient.attempts >= max_attempts)
+            .values(status=MailingRecipientStatus.FAILED, locked_until=None, error="Превышено число попыток отправки.")
+        )
+
+    @auto_commit
+    async def complete_recipients(self, results: dict[int, tuple[bool, str]]) -> None:
+        """Сохраняет результаты отправки сообщений получателям.
+
+        Args:
+            results: Словарь {id получателя: (признак успешной отправки, сообщение о результате)}.
+        """
+        sent_ids = [recipient_id for recipient_id, (success, _) in results.items() if success]
+        failed = [
+            {"id": recipient_id, "status": MailingRecipientStatus.FAILED, "locked_until": None, "error": msg}
+            for recipient_id, (success, msg) in results.items()
+            if not success
+        ]
+        if sent_ids:
+            await self._session.execute(
+                update(MailingRecipient)
+                .where(MailingRecipient.id.in_(sent_ids))
+                .values(status=MailingRecipientStatus.SENT, locked_until=None, sent_at=func.current_timestamp())
+            )
+        if failed:
+            await self._session.execute(update(MailingRecipient), failed)
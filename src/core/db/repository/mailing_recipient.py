@@ -0,0 +1,40 @@
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.db.models import MailingRecipient
+from src.core.db.repository.base import FilterableRepository
+
+
+class MailingRecipientRepository(FilterableRepository):
+    """Репозиторий для работы с моделью MailingRecipient."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session, MailingRecipient)
+
+    def apply_filter(self, statement: Select, filter_by: dict[str, Any]) -> Select:
+        """Применяет фильтрацию по рассылке (mailing_id) и статусу отправки (status)."""
+        if (mailing_id := filter_by.get("mailing_id")) is not None:
+            statement = statement.where(MailingRecipient.mailing_id == mailing_id)
+        if (status := filter_by.get("status")) is not None:
+            statement = statement.where(MailingRecipient.status == status)
+        return statement
+
+    async def count_by_filter(self, filter_by: dict[str, Any]) -> int:
+        """Возвращает количество записей, удовлетворяющих фильтру"""
+        statement = self.apply_filter(select(func.count()).select_from(MailingRecipient), filter_by)
+        return await self._session.scalar(statement)
+
+    async def get_filtered_objects_by_page(
+        self, filter_by: dict[str, Any], page: int, limit: int
+    ) -> Sequence[MailingRecipient]:
+        """Получает отфильтрованных получателей рассылки, ограниченных параметрами page и limit,
+        в порядке постановки в очередь.
+        """
+        statement = self.apply_filter(select(MailingRecipient), filter_by)
+        recipients = await self._session.scalars(
+            statement.order_by(MailingRecipient.id).limit(limit).offset((page - 1) * limit)
+        )
+        return recipients.all()
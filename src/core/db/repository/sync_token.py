@@ -0,0 +1,39 @@
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.db.models import SyncToken
+from src.core.db.repository.base import AbstractRepository
+from src.core.enums import SyncStream
+from src.core.utils import auto_commit
+
+
+class SyncTokenRepository(AbstractRepository):
+    """Репозиторий для работы с моделью SyncToken."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session, SyncToken)
+
+    async def get_token(self, stream: SyncStream, *, for_update: bool = False) -> str | None:
+        """Возвращает токен последней применённой синхронизации потока stream.
+
+        Args:
+            stream: Поток синхронизации.
+            for_update: Заблокировать запись до конца транзакции, чтобы синхронизации
+                одного потока применялись последовательно.
+        """
+        statement = select(SyncToken.token).where(SyncToken.stream == stream)
+        if for_update:
+            statement = statement.with_for_update()
+        return await self._session.scalar(statement)
+
+    @auto_commit
+    async def set_token(self, stream: SyncStream, token: str) -> None:
+        """Сохраняет токен последней применённой синхронизации потока stream."""
+        statement = insert(SyncToken).values(stream=stream, token=token)
+        await self._session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[SyncToken.stream],
+                set_={"token": statement.excluded.token, "updated_at": func.current_timestamp()},
+            )
+        )
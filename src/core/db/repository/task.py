@@ -1,22 +1,35 @@
 from collections.abc import Sequence
 from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import contains_eager, joinedload
-from sqlalchemy.sql.expression import ColumnElement, and_, false, or_
+from sqlalchemy.orm import joinedload
+from sqlalchemy.sql.expression import ColumnElement, false
 
-from src.core.db.models import Category, Task, User, UsersCategories
+from src.core.db.models import Category, Task, TaskFeed, User
 from src.core.db.repository.base import ContentRepository
+from src.core.db.repository.task_feed import TaskFeedRepository
 
 
 class TaskRepository(ContentRepository):
     """Репозиторий для работы с моделью Task."""
 
-    _actualizing_time = func.greatest(UsersCategories.updated_at, Task.updated_at)
-
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session, Task)
+        self._task_feed_repository = TaskFeedRepository(session)
+
+    async def archive(self, id: int) -> Task:
+        """Архивирует задачу по ID, удаляет её из лент заданий пользователей и возвращает её."""
+        await self._session.commit()
+        async with self._session.begin():
+            task = await self.get(id)
+            task.is_archived = True
+            task = await self.update(id, task, commit=False)
+            await self._task_feed_repository.refresh_tasks([id], commit=False)
+        return task
+
+    async def _on_objects_changed(self, ids: Sequence[int]) -> None:
+        await self._task_feed_repository.refresh_tasks(ids, commit=False)
 
     async def get_tasks_for_user(self, user_id: int, limit: int = 3, offset: int = 0) -> Sequence[Task]:
         """Получить список задач из категорий на которые подписан пользователь."""
@@ -30,58 +43,37 @@ class TaskRepository(ContentRepository):
         )
         return tasks.all()
 
-    async def get_user_tasks_actualized_after(
-        self, user: User, after_datetime: datetime, after_id: int, limit: int
-    ) -> list[tuple[Task, datetime]]:
-        """Возвращает первые limit заданий, доступных пользователю user и актуализированных
-        после заданного момента времени after_datetime.
+    async def get_user_tasks_page_actualized_after(
+        self, user_id: int, after_datetime: datetime, after_id: int, limit: int
+    ) -> tuple[list[tuple[Task, datetime]], int]:
+        """Возвращает одним запросом первые limit заданий, доступных пользователю с id user_id и актуализированных
+        после заданного момента времени after_datetime, и количество оставшихся после них заданий.
         За время актуализации задачи принимается наибольшее из времён: изменения задачи и назначения
         заданному пользователю категории, к которой относится задача.
         Задачи, время актуализации которых совпадает с заданным, но их id > after_id, также
-        принимаются в расчёт.
-        Возвращаемое значение - список пар (задача, время её актуализации).
+        принимаются в расчёт. Задачи выбираются из ленты заданий пользователя (TaskFeed).
+        Количество вычисляется оконной функцией count(*) OVER () до применения LIMIT.
         """
-        select_statement = (
-            select(Task, self._actualizing_time)
-            .select_from(Task)
-            .join(Category)
-            .join(UsersCategories)
-            .options(contains_eager(Task.category))
-            .where(UsersCategories.user_id == user.id)
-            .where(Task.is_archived == false())
+        total = func.count().over()
+        rows = await self._session.execute(
+            select(Task, TaskFeed.actualizing_time, total)
+            .join(TaskFeed, TaskFeed.task_id == Task.id)
+            .options(joinedload(Task.category))
+            .where(TaskFeed.user_id == user_id)
             .where(self._get_condition_of_tasks_actualized_after(after_datetime, after_id))
-            .order_by(self._actualizing_time, Task.id)
+            .order_by(TaskFeed.actualizing_time, TaskFeed.task_id)
             .limit(limit)
         )
-        tasks = await self._session.execute(select_statement)
-        return tasks.all()
-
-    async def count_user_tasks_actualized_after(self, user: User, after_datetime: datetime, after_id: int) -> int:
-        """Возвращает количество заданий, доступных пользователю user и актуализированных
-        после заданного момента времени after_datetime.
-        За время актуализации задачи принимается наибольшее из времён: изменения задачи и назначения
-        заданному пользователю категории, к которой относится задача.
-        Задачи, время актуализации которых совпадает с заданным, но их id > after_id, также
-        принимаются в расчёт.
-        """
-        select_statement = (
-            select(func.count(Task.id))
-            .join(Category)
-            .join(UsersCategories)
-            .where(UsersCategories.user_id == user.id)
-            .where(Task.is_archived == false())
-            .where(self._get_condition_of_tasks_actualized_after(after_datetime, after_id))
-        )
-        return await self._session.scalar(select_statement)
+        rows = rows.all()
+        if not rows:
+            return [], 0
+        return [(task, actualizing_time) for task, actualizing_time, _ in rows], rows[0][2] - len(rows)
 
     def _get_condition_of_tasks_actualized_after(self, after_datetime: datetime, after_id: int) -> ColumnElement[bool]:
-        """Возвращает условие, что задача актуализирована после заданного момента времени after_datetime
-        для использования в методе where.
+        """Возвращает условие, что задача ленты пользователя актуализирована после заданного момента времени
+        after_datetime (или в этот момент, но её id > after_id) для использования в методе where.
         """
-        return or_(
-            self._actualizing_time > after_datetime,
-            and_(self._actualizing_time == after_datetime, Task.id > after_id),
-        )
+        return tuple_(TaskFeed.actualizing_time, TaskFeed.task_id) > tuple_(after_datetime, after_id)
 
     async def get_all_user_tasks(self) -> Sequence[Task]:
         """Получить список задач из категорий на которые подписан пользователь."""
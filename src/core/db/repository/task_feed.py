@@ -0,0 +1,45 @@
+from collections.abc import Sequence
+
+from sqlalchemy import ColumnElement, any_, delete, false, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.db.models import Task, TaskFeed, UsersCategories
+from src.core.db.repository.base import AbstractRepository, integer_array
+from src.core.utils import auto_commit
+
+
+class TaskFeedRepository(AbstractRepository):
+    """Репозиторий для работы с моделью TaskFeed (лентами заданий пользователей).
+
+    Ленты обновляются в транзакции, изменяющей задания или категории пользователей:
+    строки затронутых заданий или пользователей удаляются и строятся заново.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session, TaskFeed)
+
+    @auto_commit
+    async def refresh_users(self, user_ids: Sequence[int]) -> None:
+        """Перестраивает ленты заданий пользователей с заданными id."""
+        await self._session.execute(delete(TaskFeed).where(TaskFeed.user_id == any_(integer_array(user_ids))))
+        await self._insert(UsersCategories.user_id == any_(integer_array(user_ids)))
+
+    @auto_commit
+    async def refresh_tasks(self, task_ids: Sequence[int]) -> None:
+        """Обновляет задания с заданными id в лентах пользователей.
+        Архивные задания удаляются из лент.
+        """
+        await self._session.execute(delete(TaskFeed).where(TaskFeed.task_id == any_(integer_array(task_ids))))
+        await self._insert(Task.id == any_(integer_array(task_ids)))
+
+    async def _insert(self, condition: ColumnElement[bool]) -> None:
+        """Добавляет в ленты пользователей неархивные задания из их категорий, удовлетворяющие условию condition."""
+        await self._session.execute(
+            insert(TaskFeed).from_select(
+                ["user_id", "task_id", "actualizing_time"],
+                select(UsersCategories.user_id, Task.id, func.greatest(UsersCategories.updated_at, Task.updated_at))
+                .join(UsersCategories, UsersCategories.category_id == Task.category_id)
+                .where(Task.is_archived == false())
+                .where(condition),
+            )
+        )
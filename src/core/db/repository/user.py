@@ -1,12 +1,13 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Any
 
-from sqlalchemy import Select, and_, delete, desc, func, insert, or_, orm, select, text
+from sqlalchemy import Select, and_, delete, desc, func, insert, or_, orm, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from structlog import get_logger
 
 from src.core.db.models import ExternalSiteUser, User, UsersCategories
 from src.core.db.repository.base import FilterableRepository
+from src.core.db.repository.task_feed import TaskFeedRepository
 from src.core.enums import UserRoleFilterValues, UserStatusFilterValues
 from src.core.utils import auto_commit
 
@@ -18,6 +19,7 @@ class UserRepository(FilterableRepository):
 
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session, User)
+        self._task_feed_repository = TaskFeedRepository(session)
 
     @auto_commit
     async def get_by_user_id(self, user_id: int) -> User | None:
@@ -30,6 +32,13 @@ class UserRepository(FilterableRepository):
             select(User).options(orm.selectinload(User.external_user)).where(User.telegram_id == telegram_id)
         )
 
+    async def get_by_ids_with_external_user(self, ids: Sequence[int]) -> Sequence[User]:
+        """Возвращает пользователей по списку id вместе со связанными пользователями сайта."""
+        users = await self._session.scalars(
+            select(User).options(orm.selectinload(User.external_user)).where(User.id.in_(ids))
+        )
+        return users.all()
+
     async def get_by_external_id(self, external_id: int) -> User | None:
         """Возвращает пользователя (или None) по external_id."""
         return await self._session.scalar(select(User).where(User.external_id == external_id))
@@ -64,6 +73,21 @@ class UserRepository(FilterableRepository):
         user.banned = banned
         await self.update(user.id, user)
 
+    @auto_commit
+    async def ban_by_telegram_ids(self, telegram_ids: Iterable[int]) -> Sequence[int]:
+        """Устанавливает статус User.banned пользователям с заданными telegram_id одним запросом.
+        Возвращает id пользователей, у которых статус изменился.
+        """
+        user_ids = await self._session.scalars(
+            update(User)
+            .where(User.telegram_id.in_(list(telegram_ids)))
+            .where(User.banned.is_(False))
+            .values(banned=True)
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        )
+        return user_ids.all()
+
     async def set_categories_to_user(self, user_id: int, categories_ids: list[int] | None) -> None:
         """Присваивает или удаляет список категорий."""
         await self._session.commit()
@@ -75,8 +99,15 @@ class UserRepository(FilterableRepository):
                         [{"user_id": user_id, "category_id": category_id} for category_id in categories_ids]
                     )
                 )
+            await self._task_feed_repository.refresh_users([user_id], commit=False)
         await logger.ainfo("Изменены категории у пользователя")
 
+    @auto_commit
+    async def add_category_to_user(self, user: User, category_id: int) -> None:
+        """Добавляет категорию пользователю."""
+        await self._session.execute(insert(UsersCategories).values(user_id=user.id, category_id=category_id))
+        await self._task_feed_repository.refresh_users([user.id], commit=False)
+
     @auto_commit
     async def delete_category_from_user(self, user: User, category_id: int) -> None:
         """Удаляет категорию у пользователя."""
@@ -85,6 +116,7 @@ class UserRepository(FilterableRepository):
             .where(UsersCategories.user_id == user.id)
             .where(UsersCategories.category_id == category_id)
         )
+        await self._task_feed_repository.refresh_users([user.id], commit=False)
 
     async def set_mailing(self, user: User, has_mailing: bool) -> None:
         """
@@ -163,7 +195,21 @@ class UserRepository(FilterableRepository):
         objects = await self._session.scalars(statement.order_by(desc(text(column_name))))
         return objects.all()
 
-    async def update_last_interaction(self, user: User) -> None:
-        """Обновляет статус User.last_interaction текущим временем."""
-        user.last_interaction = func.now()
-        await self.update(user.id, user)
+    def get_recipients_by_filter_statement(self, filter_by: dict[str, Any]) -> Select:
+        """Возвращает оператор SELECT, выбирающий id и telegram_id пользователей,
+        удовлетворяющих фильтру. Используется для постановки рассылки в очередь
+        без загрузки пользователей из БД.
+        """
+        return self.apply_filter(
+            select(User.id, User.telegram_id).join(User.external_user, isouter=True),
+            filter_by,
+        )
+
+    @auto_commit
+    async def set_last_interactions(self, ages: Mapping[int, float]) -> None:
+        """Записывает время последнего взаимодействия с ботом пользователям.
+
+        Args:
+            ages: Словарь {telegram_id пользователя: сколько секунд назад было взаимодействие}.
+        """
+        await self._set_last_interactions(User.telegram_id, ages)
@@ -1,6 +1,7 @@
 from .api_services import APIServicesContainer
 from .applications import ApplicationsContainer
 from .bot_services import BotServicesContainer
+from .caches import CachesContainer
 from .container import Container
 from .data_base_connection import DataBaseConnectionContainer
 from .jwt_services import JWTServicesContainer
@@ -11,6 +12,7 @@ __all__ = (
     "APIServicesContainer",
     "ApplicationsContainer",
     "BotServicesContainer",
+    "CachesContainer",
     "Container",
     "DataBaseConnectionContainer",
     "JWTServicesContainer",
@@ -20,6 +20,8 @@ class APIServicesContainer(containers.DeclarativeContainer):
     data_base_connection = providers.DependenciesContainer()
     applications = providers.DependenciesContainer()
     telegram_notification = providers.Dependency()
+    bot_status_queue = providers.Dependency()
+    caches = providers.DependenciesContainer()
 
     admin_service = providers.Factory(
         AdminService,
@@ -31,22 +33,30 @@ class APIServicesContainer(containers.DeclarativeContainer):
         site_user_repository=repositories.site_user_repository,
         task_repository=repositories.task_repository,
         session=data_base_connection.session,
+        cache_invalidation=caches.cache_invalidation,
     )
     category_service = providers.Factory(
         CategoryService,
         category_repository=repositories.category_repository,
         session=data_base_connection.session,
+        category_tree_cache=caches.category_tree_cache,
+        cache_invalidation=caches.cache_invalidation,
     )
     task_service = providers.Factory(
         TaskService,
         task_repository=repositories.task_repository,
+        sync_token_repository=repositories.sync_token_repository,
         session=data_base_connection.session,
+        cache_invalidation=caches.cache_invalidation,
     )
     message_service = providers.Factory(
         TelegramNotificationService,
         session=data_base_connection.session,
         telegram_notification=telegram_notification,
         user_repository=repositories.user_repository,
+        mailing_repository=repositories.mailing_repository,
+        mailing_recipient_repository=repositories.mailing_recipient_repository,
+        bot_status_queue=bot_status_queue,
     )
     analytic_service = providers.Factory(
         AnalyticsService,
@@ -58,6 +68,7 @@ class APIServicesContainer(containers.DeclarativeContainer):
         HealthCheckService,
         task_repository=repositories.task_repository,
         telegram_bot=applications.telegram_bot,
+        task_render_cache=caches.task_render_cache,
     )
     admin_token_request_service = providers.Factory(
         AdminTokenRequestService,
@@ -5,6 +5,7 @@ from src.api.constants import OPENAPI_TAGS
 from src.api.main import init_fastapi
 from src.bot import create_bot
 from src.bot.main import init_bot
+from src.core.services import TelegramDispatcher, TelegramDispatcherRateLimiter
 from src.settings import Settings
 
 
@@ -12,15 +13,29 @@ class ApplicationsContainer(containers.DeclarativeContainer):
     """Контейнер зависимостей Applications."""
 
     settings = providers.Dependency(instance_of=Settings)
+    session = providers.Dependency()
+    # Общий для всех отправителей процесса диспетчер, через который проходят и запросы бота
+    telegram_dispatcher = providers.Singleton(
+        TelegramDispatcher,
+        global_rate=settings.provided.TELEGRAM_GLOBAL_RATE_LIMIT,
+        chat_interval=settings.provided.TELEGRAM_CHAT_SEND_INTERVAL,
+        max_concurrency=settings.provided.TELEGRAM_MAX_CONCURRENT_SENDS,
+        max_retries=settings.provided.TELEGRAM_MAX_RETRIES,
+    )
     telegram_bot = providers.Singleton(
         init_bot,
         telegram_bot=providers.Singleton(
             create_bot,
             bot_token=settings.provided.BOT_TOKEN,
+            session=session,
+            concurrent_updates=settings.provided.BOT_CONCURRENT_UPDATES,
+            max_pending_updates=settings.provided.BOT_MAX_PENDING_UPDATES,
+            rate_limiter=providers.Singleton(TelegramDispatcherRateLimiter, dispatcher=telegram_dispatcher),
         ),
     )
     fastapi_app = providers.Singleton(
         init_fastapi,
         fastapi_app=providers.Singleton(FastAPI, debug=settings.provided.DEBUG, openapi_tags=OPENAPI_TAGS),
         settings=settings,
+        session=session,
     )
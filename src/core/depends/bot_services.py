@@ -1,6 +1,6 @@
 from dependency_injector import containers, providers
 
-from src.bot.services import UnsubscribeReasonService
+from src.bot.services import IdentityService, UnsubscribeReasonService
 from src.bot.services.category import CategoryService as BotCategoryService
 from src.bot.services.external_site_user import ExternalSiteUserService as BotExternalSiteUserService
 from src.bot.services.task import TaskService as BotTaskService
@@ -11,15 +11,18 @@ class BotServicesContainer(containers.DeclarativeContainer):
     """Контейнер зависимостей Bot services."""
 
     repositories = providers.DependenciesContainer()
+    caches = providers.DependenciesContainer()
     bot_category_service = providers.Factory(
         BotCategoryService,
         category_repository=repositories.category_repository,
+        category_tree_cache=caches.category_tree_cache,
     )
     bot_user_service = providers.Factory(
         BotUserService,
         user_repository=repositories.user_repository,
         ext_user_repository=repositories.site_user_repository,
         category_repository=repositories.category_repository,
+        cache_invalidation=caches.cache_invalidation,
     )
     bot_task_service = providers.Factory(
         BotTaskService,
@@ -30,6 +33,12 @@ class BotServicesContainer(containers.DeclarativeContainer):
         BotExternalSiteUserService,
         site_user_repository=repositories.site_user_repository,
         user_repository=repositories.user_repository,
+        cache_invalidation=caches.cache_invalidation,
+    )
+    bot_identity_service = providers.Factory(
+        IdentityService,
+        site_user_repository=repositories.site_user_repository,
+        identity_cache=caches.identity_cache,
     )
     unsubscribe_reason_service = providers.Factory(
         UnsubscribeReasonService,
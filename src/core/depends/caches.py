@@ -0,0 +1,28 @@
+from dependency_injector import containers, providers
+
+from src.core.category_tree import CategoryTreeCache
+from src.core.identity_cache import IdentityCache
+from src.core.render_cache import TaskRenderCache
+from src.core.services.cache_invalidation import CacheInvalidation
+from src.settings import Settings
+
+
+class CachesContainer(containers.DeclarativeContainer):
+    """Контейнер кэшей процесса приложения."""
+
+    settings = providers.Dependency(instance_of=Settings)
+    data_base_connection = providers.DependenciesContainer()
+
+    identity_cache = providers.Singleton(
+        IdentityCache, ttl=settings.provided.IDENTITY_CACHE_TTL, maxsize=settings.provided.IDENTITY_CACHE_SIZE
+    )
+    category_tree_cache = providers.Singleton(CategoryTreeCache, ttl=settings.provided.CATEGORY_TREE_TTL)
+    task_render_cache = providers.Singleton(TaskRenderCache, maxsize=settings.provided.TASK_RENDER_CACHE_SIZE)
+    cache_invalidation = providers.Singleton(
+        CacheInvalidation,
+        engine=data_base_connection.engine,
+        identity_cache=identity_cache,
+        category_tree_cache=category_tree_cache,
+        task_render_cache=task_render_cache,
+        retry_interval=settings.provided.CACHE_INVALIDATION_INTERVAL,
+    )
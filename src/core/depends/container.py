@@ -5,6 +5,7 @@ from src.settings import get_settings
 from .api_services import APIServicesContainer
 from .applications import ApplicationsContainer
 from .bot_services import BotServicesContainer
+from .caches import CachesContainer
 from .core_services import CoreServicesContainer
 from .data_base_connection import DataBaseConnectionContainer
 from .jwt_services import JWTServicesContainer
@@ -19,7 +20,13 @@ class Container(containers.DeclarativeContainer):
 
     database_connection_container = providers.Container(DataBaseConnectionContainer, settings=settings)
 
-    applications_container = providers.Container(ApplicationsContainer, settings=settings)
+    caches_container = providers.Container(
+        CachesContainer, settings=settings, data_base_connection=database_connection_container
+    )
+
+    applications_container = providers.Container(
+        ApplicationsContainer, settings=settings, session=database_connection_container.session
+    )
 
     repositories_container = providers.Container(
         RepositoriesContainer, data_base_connection=database_connection_container
@@ -31,6 +38,7 @@ class Container(containers.DeclarativeContainer):
         sessionmaker=database_connection_container.sessionmaker,
         settings=settings,
         telegram_bot=applications_container.telegram_bot,
+        telegram_dispatcher=applications_container.telegram_dispatcher,
     )
     api_services_container = providers.Container(
         APIServicesContainer,
@@ -38,8 +46,12 @@ class Container(containers.DeclarativeContainer):
         data_base_connection=database_connection_container,
         applications=applications_container,
         telegram_notification=core_services_container.telegram_notification,
+        bot_status_queue=core_services_container.bot_status_queue,
+        caches=caches_container,
+    )
+    bot_services_container = providers.Container(
+        BotServicesContainer, repositories=repositories_container, caches=caches_container
     )
-    bot_services_container = providers.Container(BotServicesContainer, repositories=repositories_container)
 
     jwt_services_container = providers.Container(JWTServicesContainer, settings=settings)
 
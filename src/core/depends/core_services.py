@@ -1,6 +1,14 @@
 from dependency_injector import containers, providers
 
-from src.core.services import EmailProvider, ProcharityAPI, TechMessageService, TelegramNotification
+from src.core.services import (
+    BotStatusQueue,
+    EmailProvider,
+    LastInteractionBuffer,
+    ProcharityAPI,
+    ProcharityHTTPClient,
+    TechMessageService,
+    TelegramNotification,
+)
 
 
 class CoreServicesContainer(containers.DeclarativeContainer):
@@ -9,10 +17,28 @@ class CoreServicesContainer(containers.DeclarativeContainer):
     sessionmaker = providers.Dependency()
     settings = providers.Dependency()
     telegram_bot = providers.Dependency()
+    telegram_dispatcher = providers.Dependency()
 
     email_provider = providers.Factory(EmailProvider, sessionmaker=sessionmaker, settings=settings)
-    telegram_notification = providers.Factory(TelegramNotification, telegram_bot=telegram_bot)
+    telegram_notification = providers.Factory(
+        TelegramNotification, telegram_bot=telegram_bot, dispatcher=telegram_dispatcher
+    )
     tech_message = providers.Factory(TechMessageService, repository=repositories.tech_message_repository)
+    procharity_http_client = providers.Singleton(
+        ProcharityHTTPClient,
+        connection_limit=settings.provided.PROCHARITY_API_CONNECTION_LIMIT,
+        timeout=settings.provided.PROCHARITY_API_TIMEOUT,
+    )
     procharity_api = providers.Factory(
-        ProcharityAPI, settings=settings, email_provider=email_provider, tech_message_service=tech_message
+        ProcharityAPI,
+        settings=settings,
+        http_client=procharity_http_client,
+        email_provider=email_provider,
+        tech_message_service=tech_message,
+    )
+    bot_status_queue = providers.Singleton(BotStatusQueue, sessionmaker=sessionmaker, procharity_api=procharity_api)
+    last_interaction_buffer = providers.Singleton(
+        LastInteractionBuffer,
+        sessionmaker=sessionmaker,
+        flush_interval=settings.provided.LAST_INTERACTION_FLUSH_INTERVAL,
     )
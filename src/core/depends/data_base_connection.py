@@ -1,7 +1,7 @@
 from dependency_injector import containers, providers
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
-from src.core.db import get_session
+from src.core.db import create_scoped_session
 from src.settings import Settings
 
 
@@ -18,7 +18,8 @@ class DataBaseConnectionContainer(containers.DeclarativeContainer):
         bind=engine,
         expire_on_commit=False,
     )
-    session = providers.Resource(
-        get_session,
+    # Сессия текущего HTTP-запроса или обновления бота (см. session_scope)
+    session = providers.Singleton(
+        create_scoped_session,
         sessionmaker=sessionmaker,
     )
@@ -1,6 +1,6 @@
 from dependency_injector import containers, providers
 
-from src.api.pagination import AdminUserPaginator, TechMessagePaginator, UserPaginator
+from src.api.pagination import AdminUserPaginator, MailingRecipientPaginator, TechMessagePaginator, UserPaginator
 
 
 class PaginateContainer(containers.DeclarativeContainer):
@@ -22,3 +22,8 @@ class PaginateContainer(containers.DeclarativeContainer):
         TechMessagePaginator,
         repository=repositories.tech_message_repository,
     )
+
+    mailing_recipient_paginate = providers.Factory(
+        MailingRecipientPaginator,
+        repository=repositories.mailing_recipient_repository,
+    )
@@ -5,6 +5,9 @@ from src.core.db.repository import (
     AdminUserRepository,
     CategoryRepository,
     ExternalSiteUserRepository,
+    MailingRecipientRepository,
+    MailingRepository,
+    SyncTokenRepository,
     TaskRepository,
     TechMessageRepository,
     UnsubscribeReasonRepository,
@@ -48,3 +51,15 @@ class RepositoriesContainer(containers.DeclarativeContainer):
         TechMessageRepository,
         session=data_base_connection.session,
     )
+    mailing_repository = providers.Factory(
+        MailingRepository,
+        session=data_base_connection.session,
+    )
+    mailing_recipient_repository = providers.Factory(
+        MailingRecipientRepository,
+        session=data_base_connection.session,
+    )
+    sync_token_repository = providers.Factory(
+        SyncTokenRepository,
+        session=data_base_connection.session,
+    )
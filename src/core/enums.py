@@ -76,3 +76,73 @@ class UserStatusFilterValues(StrEnum):
     NO_MODERATED = "no_moderated"
     BLOCKED = "blocked"
     UNKNOWN = "unknown"
+
+
+class MailingType(StrEnum):
+    """Типы рассылок, отправляемых через очередь mailing_recipients.
+
+    - task: рассылка информации о новой или обновлённой задаче;
+    - message: рассылка текстового сообщения от администратора.
+    """
+
+    TASK = "task"
+    MESSAGE = "message"
+
+
+class MailingRecipientStatus(StrEnum):
+    """Статусы доставки рассылки получателю.
+
+    - pending: ожидает отправки;
+    - processing: взят в обработку одним из фоновых обработчиков;
+    - sent: отправлено;
+    - failed: отправка не удалась.
+    """
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class SyncStream(StrEnum):
+    """Потоки инкрементальной синхронизации данных с сайтом.
+
+    - tasks: синхронизация задач.
+    """
+
+    TASKS = "tasks"
+
+
+class RunMode(StrEnum):
+    """Роли процесса приложения.
+
+    - api: API для сайта и админ-панели;
+    - bot: обработка обновлений телеграм-бота;
+    - worker: фоновая отправка рассылок из очереди в БД;
+    - all: все роли в одном процессе.
+    """
+
+    API = "api"
+    BOT = "bot"
+    WORKER = "worker"
+    ALL = "all"
+
+    @property
+    def runs_api(self) -> bool:
+        return self in (self.__class__.API, self.__class__.ALL)
+
+    @property
+    def runs_bot(self) -> bool:
+        return self in (self.__class__.BOT, self.__class__.ALL)
+
+    @property
+    def runs_workers(self) -> bool:
+        return self in (self.__class__.WORKER, self.__class__.ALL)
+
+
+class CacheName(StrEnum):
+    """Кэши процесса, сбрасываемые во всех процессах приложения при изменении данных."""
+
+    IDENTITY = "identity"
+    TASK_RENDER = "task_render"
+    CATEGORY_TREE = "category_tree"
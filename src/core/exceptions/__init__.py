@@ -9,6 +9,7 @@ from .exceptions import (
     InvalidToken,
     NotFoundException,
     NullException,
+    SyncTokenConflict,
     TokenNotProvided,
     UnauthorizedError,
     UserAlreadyExists,
@@ -26,6 +27,7 @@ __all__ = (
     "InvalidToken",
     "NotFoundException",
     "NullException",
+    "SyncTokenConflict",
     "TokenNotProvided",
     "UnauthorizedError",
     "UserAlreadyExists",
@@ -95,3 +95,13 @@ class BadRequestException(ApplicationException):
 
     def __init__(self, detail: str):
         self.detail = detail
+
+
+class SyncTokenConflict(ApplicationException):
+    status_code: HTTPStatus = HTTPStatus.CONFLICT
+
+    def __init__(self, sync_token: str | None):
+        self.detail = (
+            f"Токен предыдущей синхронизации не совпадает с последним применённым ({sync_token}). "
+            "Необходима полная синхронизация."
+        )
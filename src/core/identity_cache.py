@@ -0,0 +1,49 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+
+from src.core.db.repository import SiteUserIdentity
+
+
+class IdentityCache:
+    """Кэш пользователей сайта, найденных по telegram_id или id_hash, с ограниченным временем
+    жизни записей. Хранит и отрицательные результаты поиска, чтобы обработчики бота
+    не обращались к БД при каждом действии незарегистрированного пользователя.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, SiteUserIdentity | None]] = OrderedDict()
+
+    def get(self, key: Hashable) -> tuple[bool, SiteUserIdentity | None]:
+        """Возвращает пару (признак наличия записи в кэше, пользователь или None)."""
+        entry = self._data.get(key)
+        if entry is None:
+            return False, None
+        expires_at, identity = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return False, None
+        return True, identity
+
+    def put(self, key: Hashable, identity: SiteUserIdentity | None) -> None:
+        """Сохраняет результат поиска, вытесняя при необходимости самую старую запись."""
+        self._data[key] = (time.monotonic() + self._ttl, identity)
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, site_user_ids: Iterable[int] | None = None) -> None:
+        """Удаляет из кэша записи заданных пользователей сайта и все отрицательные результаты.
+        Если site_user_ids не заданы, кэш очищается полностью.
+        """
+        if site_user_ids is None:
+            self._data.clear()
+            return
+        site_user_ids = set(site_user_ids)
+        stale_keys = [
+            key for key, (_, identity) in self._data.items() if identity is None or identity.id in site_user_ids
+        ]
+        for key in stale_keys:
+            del self._data[key]
@@ -1,14 +1,32 @@
-from dependency_injector.wiring import Provide
+from dependency_injector.wiring import Provide, inject
 
 from src.core.db.models import Task
 from src.core.depends.container import Container
+from src.core.render_cache import TaskRenderCache
 
 TASK_DEADLINE_FORMAT = "%d.%m.%y"
 
 
+@inject
 def display_task(
     task: Task,
     updated_task: bool = False,
+    task_render_cache: TaskRenderCache = Provide[Container.caches_container.task_render_cache],
+) -> str:
+    """Возвращает HTML-карточку задачи.
+    Карточки кэшируются до изменения задачи (поля updated_at).
+    """
+    key = (task.id, task.updated_at, updated_task)
+    text = task_render_cache.texts.get(key)
+    if text is None:
+        text = _render_task(task, updated_task)
+        task_render_cache.texts.put(key, text)
+    return text
+
+
+def _render_task(
+    task: Task,
+    updated_task: bool,
     bonus_info_url: str = Provide[Container.settings.provided.procharity_bonus_info_url],
 ) -> str:
     deadline = task.deadline.strftime(TASK_DEADLINE_FORMAT) if task.deadline else "Не указан."
@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Кэш ограниченного размера с вытеснением давно не использованных записей.
+    Ведёт счётчики попаданий и промахов.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        """Возвращает значение по ключу key или None, если его нет в кэше."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Сохраняет значение в кэше, вытесняя при необходимости самую старую запись."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, predicate: Callable[[K], bool]) -> None:
+        """Удаляет из кэша записи, ключи которых удовлетворяют условию predicate."""
+        for key in [key for key in self._data if predicate(key)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        """Очищает кэш."""
+        self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Возвращает размер кэша и счётчики попаданий и промахов."""
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+class TaskRenderCache:
+    """Кэш карточек задач и клавиатур к ним."""
+
+    def __init__(self, maxsize: int) -> None:
+        # Тексты карточек задач. Ключ: (id задачи, время её обновления, признак обновлённой задачи)
+        self.texts: LRUCache[tuple, str] = LRUCache(maxsize)
+        # Клавиатуры под карточками задач. Ключ: (id задачи, признак отклика пользователя на задачу)
+        self.keyboards: LRUCache[tuple, object] = LRUCache(maxsize)
+
+    def invalidate(self, task_ids: Iterable[int] | None = None) -> None:
+        """Удаляет из кэша карточки и клавиатуры заданных задач.
+        Если task_ids не заданы, кэш очищается полностью.
+        """
+        if task_ids is None:
+            self.texts.clear()
+            self.keyboards.clear()
+            return
+        task_ids = set(task_ids)
+        self.texts.invalidate(lambda key: key[0] in task_ids)
+        self.keyboards.invalidate(lambda key: key[0] in task_ids)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Возвращает размеры и счётчики попаданий и промахов кэшей карточек и клавиатур."""
+        return {"texts": self.texts.stats(), "keyboards": self.keyboards.stats()}
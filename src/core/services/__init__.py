@@ -1,13 +1,24 @@
+from .bot_status import BotStatusQueue
+from .cache_invalidation import CacheInvalidation
 from .email import EmailProvider
-from .notification import TelegramNotification
-from .procharity_api import ProcharityAPI
+from .last_interaction import LastInteractionBuffer
+from .leader_election import LeaderElection
+from .notification import TelegramDispatcher, TelegramDispatcherRateLimiter, TelegramNotification
+from .procharity_api import ProcharityAPI, ProcharityHTTPClient
 from .tech_message import TechMessageService
 from .users import BaseUserService
 
 __all__ = (
+    "BotStatusQueue",
+    "CacheInvalidation",
     "EmailProvider",
+    "LastInteractionBuffer",
+    "LeaderElection",
+    "TelegramDispatcher",
+    "TelegramDispatcherRateLimiter",
     "TelegramNotification",
     "ProcharityAPI",
+    "ProcharityHTTPClient",
     "BaseUserService",
     "TechMessageService",
 )
@@ -0,0 +1,66 @@
+import asyncio
+from collections.abc import Iterable
+from contextlib import suppress
+
+import structlog
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.core.db.repository import UserRepository
+
+from .procharity_api import ProcharityAPI
+
+log = structlog.get_logger(module=__name__)
+
+
+class BotStatusQueue:
+    """Очередь фоновой отправки на сайт статусов бота пользователей.
+
+    Используется, когда статус меняется у многих пользователей сразу (например,
+    после рассылки, в ходе которой выяснилось, что бот заблокирован), чтобы
+    запросы к сайту не задерживали отправку сообщений.
+    """
+
+    def __init__(self, sessionmaker: async_sessionmaker, procharity_api: ProcharityAPI, batch_size: int = 100):
+        self._sessionmaker = sessionmaker
+        self._procharity_api = procharity_api
+        self._batch_size = batch_size
+        self._queue: asyncio.Queue[int] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+
+    def put(self, user_ids: Iterable[int]) -> None:
+        """Ставит в очередь отправку статусов бота пользователей с заданными id."""
+        for user_id in user_ids:
+            self._queue.put_nowait(user_id)
+
+    def start(self) -> None:
+        """Запускает фоновую отправку статусов."""
+        self._worker = asyncio.create_task(self._work())
+
+    async def stop(self) -> None:
+        """Отправляет оставшиеся в очереди статусы и останавливает фоновую отправку."""
+        if self._worker is None:
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._worker
+        self._worker = None
+
+    async def _work(self) -> None:
+        while True:
+            user_ids = [await self._queue.get()]
+            while len(user_ids) < self._batch_size and not self._queue.empty():
+                user_ids.append(self._queue.get_nowait())
+            try:
+                await self._send(user_ids)
+            except Exception as exc:
+                await log.aexception(f"Ошибка отправки статусов бота на сайт: {exc}")
+            finally:
+                for _ in user_ids:
+                    self._queue.task_done()
+
+    async def _send(self, user_ids: list[int]) -> None:
+        async with self._sessionmaker() as session:
+            users = await UserRepository(session).get_by_ids_with_external_user(user_ids)
+        for user in users:
+            await self._procharity_api.send_user_bot_status(user)
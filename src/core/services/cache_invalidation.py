@@ -0,0 +1,155 @@
+import asyncio
+import json
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+
+import structlog
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.core.category_tree import CategoryTreeCache
+from src.core.enums import CacheName
+from src.core.identity_cache import IdentityCache
+from src.core.render_cache import TaskRenderCache
+
+log = structlog.get_logger(module=__name__)
+
+CACHE_INVALIDATION_CHANNEL = "procharity_cache_invalidation"
+# Размер сообщения NOTIFY ограничен 8000 байтами: при превышении сбрасывается весь кэш
+MAX_PAYLOAD_SIZE = 7000
+# Наибольшее количество уведомлений, ожидающих отправки, пока нет соединения с БД
+MAX_PENDING_PAYLOADS = 1000
+
+
+class CacheInvalidation:
+    """Сброс кэшей процесса во всех процессах приложения.
+
+    Кэш сбрасывается в текущем процессе сразу, а остальным процессам рассылается
+    уведомление PostgreSQL NOTIFY. Каждый процесс удерживает соединение, на котором
+    слушает уведомления, и периодически проверяет его; после восстановления соединения
+    все кэши процесса сбрасываются, так как уведомления могли быть пропущены.
+    Пока соединения нет, кэши пользователей и дерева категорий обновляются по истечении
+    их времени жизни.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        identity_cache: IdentityCache,
+        category_tree_cache: CategoryTreeCache,
+        task_render_cache: TaskRenderCache,
+        retry_interval: float,
+    ) -> None:
+        """
+        Args:
+            engine: Движок БД, из пула которого берётся соединение для уведомлений.
+            identity_cache: Кэш пользователей сайта.
+            category_tree_cache: Кэш снимка дерева категорий.
+            task_render_cache: Кэш карточек задач и клавиатур к ним.
+            retry_interval: Интервал попыток соединения и проверок соединения, в секундах.
+        """
+        self._engine = engine
+        self._handlers: dict[CacheName, Callable[[list[int] | None], None]] = {
+            CacheName.IDENTITY: identity_cache.invalidate,
+            CacheName.CATEGORY_TREE: lambda ids: category_tree_cache.invalidate(),
+            CacheName.TASK_RENDER: task_render_cache.invalidate,
+        }
+        self._retry_interval = retry_interval
+        self._sender = uuid.uuid4().hex
+        self._payloads: deque[str] = deque(maxlen=MAX_PENDING_PAYLOADS)
+        self._wakeup = asyncio.Event()
+        self._stop_event = asyncio.Event()
+        self._worker: asyncio.Task | None = None
+
+    def invalidate(self, cache: CacheName, ids: Iterable[int] | None = None) -> None:
+        """Сбрасывает записи кэша cache с заданными ids (или весь кэш, если ids не заданы)
+        в текущем процессе и во всех остальных процессах приложения.
+        """
+        ids = None if ids is None else sorted(set(ids))
+        self._handlers[cache](ids)
+        self.publish(cache, ids)
+
+    def publish(self, cache: CacheName, ids: Iterable[int] | None = None) -> None:
+        """Сбрасывает записи кэша cache с заданными ids (или весь кэш) только в остальных процессах,
+        например когда текущий процесс уже обновил свой кэш.
+        """
+        ids = None if ids is None else sorted(set(ids))
+        payload = json.dumps({"sender": self._sender, "cache": cache, "ids": ids})
+        if len(payload.encode()) > MAX_PAYLOAD_SIZE:
+            payload = json.dumps({"sender": self._sender, "cache": cache, "ids": None})
+        if self._worker is not None:
+            self._payloads.append(payload)
+            self._wakeup.set()
+
+    def start(self) -> None:
+        """Запускает приём и отправку уведомлений."""
+        self._stop_event.clear()
+        self._worker = asyncio.create_task(self._work())
+
+    async def stop(self) -> None:
+        """Отправляет накопленные уведомления и останавливает их приём."""
+        if self._worker is None:
+            return
+        self._stop_event.set()
+        self._wakeup.set()
+        await self._worker
+        self._worker = None
+
+    async def _work(self) -> None:
+        connection: AsyncConnection | None = None
+        try:
+            while True:
+                self._wakeup.clear()
+                try:
+                    if connection is None:
+                        connection = await self._listen()
+                    await self._send_queued(connection)
+                    await connection.scalar(select(1))
+                    await connection.commit()
+                except Exception as exc:
+                    await log.aexception(f"Ошибка соединения для сброса кэшей: {exc}")
+                    if connection is not None:
+                        await self._close(connection)
+                        connection = None
+                if self._stop_event.is_set():
+                    break
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self._retry_interval)
+        finally:
+            if connection is not None:
+                await self._close(connection)
+
+    async def _listen(self) -> AsyncConnection:
+        connection = await self._engine.connect()
+        try:
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.add_listener(CACHE_INVALIDATION_CHANNEL, self._on_notification)
+        except Exception:
+            await connection.close()
+            raise
+        # Уведомления, отправленные до подписки, могли быть пропущены
+        for handler in self._handlers.values():
+            handler(None)
+        return connection
+
+    async def _send_queued(self, connection: AsyncConnection) -> None:
+        while self._payloads:
+            await connection.execute(select(func.pg_notify(CACHE_INVALIDATION_CHANNEL, self._payloads[0])))
+            await connection.commit()
+            self._payloads.popleft()
+
+    async def _close(self, connection: AsyncConnection) -> None:
+        """Закрывает соединение, не возвращая его в пул вместе с подпиской на уведомления."""
+        with suppress(Exception):
+            await connection.invalidate()
+        await connection.close()
+
+    def _on_notification(self, driver_connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            if message["sender"] != self._sender:
+                self._handlers[CacheName(message["cache"])](message["ids"])
+        except Exception as exc:
+            log.exception(f"Ошибка обработки уведомления о сбросе кэша {payload}: {exc}")
@@ -0,0 +1,83 @@
+import asyncio
+import time
+from contextlib import suppress
+
+import structlog
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.core.db.repository import ExternalSiteUserRepository, UserRepository
+
+log = structlog.get_logger(module=__name__)
+
+
+class LastInteractionBuffer:
+    """Буфер отложенной записи времени последнего взаимодействия пользователей с ботом.
+
+    Обработчики бота только отмечают взаимодействие в памяти, а накопленные отметки
+    периодически записываются в базу данных одним запросом для каждой таблицы
+    и при остановке приложения. Для каждого пользователя хранится только последняя отметка.
+    """
+
+    def __init__(self, sessionmaker: async_sessionmaker, flush_interval: float):
+        self._sessionmaker = sessionmaker
+        self._flush_interval = flush_interval
+        self._users: dict[int, float] = {}
+        self._site_users: dict[int, float] = {}
+        self._stop_event = asyncio.Event()
+        self._worker: asyncio.Task | None = None
+
+    def touch(self, telegram_id: int, site_user_id: int | None = None) -> None:
+        """Отмечает взаимодействие с ботом пользователя с заданным telegram_id
+        и, если задан site_user_id, связанного с ним пользователя сайта.
+        """
+        now = time.monotonic()
+        self._users[telegram_id] = now
+        if site_user_id is not None:
+            self._site_users[site_user_id] = now
+
+    def start(self) -> None:
+        """Запускает периодическую запись отметок."""
+        self._stop_event.clear()
+        self._worker = asyncio.create_task(self._work())
+
+    async def stop(self) -> None:
+        """Останавливает периодическую запись и записывает оставшиеся отметки."""
+        if self._worker is not None:
+            self._stop_event.set()
+            await self._worker
+            self._worker = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Записывает накопленные отметки в базу данных.
+        Если запись не удалась, отметки возвращаются в буфер, если их не сменили более новые.
+        """
+        users, self._users = self._users, {}
+        site_users, self._site_users = self._site_users, {}
+        if not users and not site_users:
+            return
+        now = time.monotonic()
+        try:
+            async with self._sessionmaker() as session:
+                await UserRepository(session).set_last_interactions(
+                    {telegram_id: now - moment for telegram_id, moment in users.items()}, commit=False
+                )
+                await ExternalSiteUserRepository(session).set_last_interactions(
+                    {site_user_id: now - moment for site_user_id, moment in site_users.items()}, commit=False
+                )
+                await session.commit()
+        except Exception:
+            self._users = users | self._users
+            self._site_users = site_users | self._site_users
+            raise
+
+    async def _work(self) -> None:
+        while not self._stop_event.is_set():
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stop_event.wait(), self._flush_interval)
+            if self._stop_event.is_set():
+                break
+            try:
+                await self.flush()
+            except Exception as exc:
+                await log.aexception(f"Ошибка записи времени последнего взаимодействия с ботом: {exc}")
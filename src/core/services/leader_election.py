@@ -0,0 +1,117 @@
+import asyncio
+import zlib
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+
+import structlog
+from sqlalchemy import BigInteger, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+log = structlog.get_logger(module=__name__)
+
+
+class LeaderElection:
+    """Выбор ведущего процесса для задачи, которую должен выполнять только один процесс
+    приложения (например, при запуске uvicorn с несколькими рабочими процессами).
+
+    Ведущим становится процесс, захвативший сессионную рекомендательную блокировку PostgreSQL
+    с ключом, вычисляемым по имени задачи. Соединение с захваченной блокировкой удерживается
+    до остановки процесса и периодически проверяется; при его потере блокировка освобождается
+    сервером и ведущим становится другой процесс. Остальные процессы периодически пытаются
+    захватить блокировку.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        name: str,
+        retry_interval: float,
+        on_elected: Callable[[], Awaitable[None]],
+        on_demoted: Callable[[], Awaitable[None]] | None = None,
+    ):
+        """
+        Args:
+            engine: Движок БД, из пула которого берётся соединение для блокировки.
+            name: Имя задачи.
+            retry_interval: Интервал попыток захвата блокировки и проверок соединения, в секундах.
+            on_elected: Вызывается, когда процесс становится ведущим.
+            on_demoted: Вызывается, когда процесс перестаёт быть ведущим.
+        """
+        self._engine = engine
+        self._name = name
+        self._lock_key = zlib.crc32(f"procharity:{name}".encode())
+        self._retry_interval = retry_interval
+        self._on_elected = on_elected
+        self._on_demoted = on_demoted
+        self._connection: AsyncConnection | None = None
+        self._stop_event = asyncio.Event()
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._connection is not None
+
+    def start(self) -> None:
+        """Запускает выбор ведущего процесса."""
+        self._stop_event.clear()
+        self._worker = asyncio.create_task(self._work())
+
+    async def stop(self) -> None:
+        """Останавливает выбор и освобождает блокировку, если процесс был ведущим."""
+        if self._worker is None:
+            return
+        self._stop_event.set()
+        await self._worker
+        self._worker = None
+
+    async def _work(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    if self._connection is None:
+                        await self._elect()
+                    else:
+                        await self._connection.scalar(select(1))
+                        await self._connection.commit()
+                except Exception as exc:
+                    await log.aexception(f"Ошибка выбора ведущего процесса для задачи {self._name}: {exc}")
+                    await self._resign()
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._stop_event.wait(), self._retry_interval)
+        finally:
+            await self._resign()
+
+    async def _elect(self) -> None:
+        connection = await self._engine.connect()
+        try:
+            acquired = await connection.scalar(select(func.pg_try_advisory_lock(literal(self._lock_key, BigInteger))))
+            await connection.commit()
+        except Exception:
+            await connection.close()
+            raise
+        if not acquired:
+            await connection.close()
+            return
+        self._connection = connection
+        await log.ainfo(f"Процесс стал ведущим для задачи {self._name}")
+        await self._on_elected()
+
+    async def _resign(self) -> None:
+        """Освобождает блокировку. Если соединение неисправно, оно закрывается,
+        чтобы блокировка не вернулась в пул вместе с ним.
+        """
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        if self._on_demoted is not None:
+            try:
+                await self._on_demoted()
+            except Exception as exc:
+                await log.aexception(f"Ошибка остановки задачи {self._name} ведущего процесса: {exc}")
+        try:
+            await connection.scalar(select(func.pg_advisory_unlock(literal(self._lock_key, BigInteger))))
+            await connection.commit()
+        except Exception:
+            await connection.invalidate()
+        await connection.close()
+        await log.ainfo(f"Процесс перестал быть ведущим для задачи {self._name}")
@@ -1,32 +1,241 @@
 import asyncio
-from typing import Iterable
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Coroutine, Iterable
+from typing import Any, TypeVar
 
 import structlog
 from telegram import TelegramObject
 from telegram.constants import ParseMode
-from telegram.error import BadRequest, Forbidden, TelegramError
-from telegram.ext import Application
+from telegram.error import BadRequest, Forbidden, RetryAfter, TelegramError
+from telegram.ext import Application, BaseRateLimiter
 
 from src.core.db.models import User
 
 log = structlog.get_logger(module=__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class TelegramMessageTemplate:
     """Базовый класс шаблонов телеграм-сообщений."""
 
-    async def render(user: User) -> dict:
+    async def prepare(self) -> None:
+        """Загружает общие для всех получателей данные перед рассылкой.
+        Вызывается один раз перед формированием сообщений.
+        """
+
+    async def render(self, user: User) -> dict:
         """Возвращает словарь с атрибутами телеграм-сообщения, предназначенного
         для заданного пользователя.
         Ключи словаря соответствуют параметрам функции Bot.send_message().
         """
         raise NotImplementedError
 
+    async def render_messages(self, user: User) -> list[dict]:
+        """Возвращает список словарей с атрибутами телеграм-сообщений, предназначенных
+        для заданного пользователя. Используется шаблонами, которые могут формировать
+        для пользователя несколько сообщений.
+        """
+        return [await self.render(user)]
+
+
+class TokenBucket:
+    """Ограничитель частоты по алгоритму token bucket.
+
+    Маркеры пополняются со скоростью rate в секунду, но их не может быть больше capacity.
+    Ожидающие получения маркера обслуживаются в порядке очереди.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else rate
+        self._tokens = self._capacity
+        self._updated_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Дожидается появления маркера и забирает его."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._updated_at is not None:
+                    self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class TelegramDispatcher:
+    """Диспетчер отправки сообщений с учётом ограничений Telegram Bot API.
+
+    Ограничивает общую частоту отправки (около 30 сообщений в секунду), частоту отправки
+    в один чат и количество одновременно выполняемых запросов. После ответа RetryAfter
+    отправка приостанавливается на указанное Telegram время.
+    Один экземпляр диспетчера должен использоваться всеми отправителями процесса:
+    запросы бота проходят через него с помощью TelegramDispatcherRateLimiter.
+    """
+
+    # Размер словаря времени отправки по чатам, при превышении которого из него удаляются устаревшие записи
+    CHAT_TIMES_PRUNE_SIZE = 10_000
+
+    def __init__(
+        self,
+        global_rate: float,
+        chat_interval: float,
+        max_concurrency: int,
+        max_retries: int,
+    ) -> None:
+        self._bucket = TokenBucket(global_rate)
+        self._chat_interval = chat_interval
+        self._max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self._chat_next_times: dict[int, float] = {}
+        self._paused_until = 0.0
+
+    async def throttle(self, chat_id: int | str | None = None) -> None:
+        """Дожидается момента, когда можно отправить сообщение.
+        Если задан chat_id, также соблюдается интервал между сообщениями в этот чат.
+        """
+        loop = asyncio.get_running_loop()
+        if chat_id is not None:
+            now = loop.time()
+            if len(self._chat_next_times) >= self.CHAT_TIMES_PRUNE_SIZE:
+                self._chat_next_times = {
+                    chat: next_time for chat, next_time in self._chat_next_times.items() if next_time > now
+                }
+            chat_next_time = max(now, self._chat_next_times.get(chat_id, now))
+            self._chat_next_times[chat_id] = chat_next_time + self._chat_interval
+            if chat_next_time > now:
+                await asyncio.sleep(chat_next_time - now)
+
+        while (delay := self._paused_until - loop.time()) > 0:
+            await asyncio.sleep(delay)
+        await self._bucket.acquire()
+
+    def pause(self, retry_after: float) -> None:
+        """Приостанавливает отправку всех сообщений на retry_after секунд."""
+        self._paused_until = max(self._paused_until, asyncio.get_running_loop().time() + retry_after)
+
+    async def for_each(
+        self,
+        func: Callable[[T], Awaitable[R]],
+        items: Iterable[T] | AsyncIterable[T],
+        on_result: Callable[[int, R | Exception], None],
+    ) -> int:
+        """Применяет корутину func к элементам items, выполняя не более max_concurrency вызовов
+        одновременно. Элементы извлекаются из items по мере освобождения обработчиков,
+        поэтому количество ожидающих корутин не зависит от числа элементов.
+
+        Результаты не сохраняются: каждый из них по мере получения передаётся в on_result
+        вместе с порядковым номером элемента, поэтому массовая рассылка может подсчитывать
+        итоги, не храня результаты всех отправок. Исключение, выброшенное func, передаётся
+        в on_result вместо результата и не прерывает обработку остальных элементов.
+        Возвращает количество обработанных элементов.
+        """
+        iterator = _aiter(items)
+        lock = asyncio.Lock()
+        count = 0
+
+        async def worker() -> None:
+            nonlocal count
+            while True:
+                async with lock:
+                    try:
+                        item = await anext(iterator)
+                    except StopAsyncIteration:
+                        return
+                    index = count
+                    count += 1
+                try:
+                    result = await func(item)
+                except Exception as exc:
+                    await log.aexception(f"Ошибка обработки элемента рассылки: {exc}")
+                    result = exc
+                on_result(index, result)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self._max_concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        return count
+
+    async def map(
+        self, func: Callable[[T], Awaitable[R]], items: Iterable[T] | AsyncIterable[T]
+    ) -> list[R | Exception]:
+        """Применяет корутину func к элементам items так же, как for_each.
+        Возвращает результаты (или выброшенные исключения) в порядке следования элементов.
+        """
+        results: dict[int, R | Exception] = {}
+        count = await self.for_each(func, items, results.__setitem__)
+        return [results[index] for index in range(count)]
+
+
+class TelegramDispatcherRateLimiter(BaseRateLimiter[bool]):
+    """Ограничитель частоты запросов бота, передающий их общему TelegramDispatcher процесса,
+    поэтому ответы обработчиков бота и массовые рассылки расходуют один лимит Telegram.
+
+    Ограничиваются запросы, адресованные чату (отправка и изменение сообщений).
+    Интервал между сообщениями в один чат соблюдается только для запросов с rate_limit_args=True
+    (массовые рассылки), чтобы ответы на действия пользователя не задерживались.
+    После ответа RetryAfter отправка приостанавливается, а запрос повторяется
+    не более dispatcher.max_retries раз.
+    """
+
+    def __init__(self, dispatcher: TelegramDispatcher) -> None:
+        self._dispatcher = dispatcher
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, bool | dict[str, Any] | list[dict[str, Any]]]],
+        args: Any,
+        kwargs: dict[str, Any],
+        endpoint: str,
+        data: dict[str, Any],
+        rate_limit_args: bool | None,
+    ) -> bool | dict[str, Any] | list[dict[str, Any]]:
+        chat_id = data.get("chat_id")
+        attempt = 0
+        while True:
+            if chat_id is not None:
+                await self._dispatcher.throttle(chat_id if rate_limit_args else None)
+            try:
+                return await callback(*args, **kwargs)
+            except RetryAfter as exc:
+                self._dispatcher.pause(exc.retry_after)
+                if attempt >= self._dispatcher.max_retries:
+                    raise
+                attempt += 1
+                await log.ainfo(f"Превышен лимит запросов {endpoint}, повтор через {exc.retry_after} с.")
+
+
+async def _aiter(items: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
 
 class TelegramNotification:
-    def __init__(self, telegram_bot: Application):
+    def __init__(self, telegram_bot: Application, dispatcher: TelegramDispatcher):
         self.__bot_application = telegram_bot
         self.__bot = telegram_bot.bot
+        self.__dispatcher = dispatcher
+        self.__blocked_telegram_ids: set[int] = set()
 
     async def __send_message(
         self,
@@ -34,6 +243,7 @@ class TelegramNotification:
         text: str,
         reply_markup: TelegramObject | None = None,
     ) -> tuple[bool, str]:
+        # Частоту отправки и повторы после RetryAfter обеспечивает TelegramDispatcherRateLimiter бота
         try:
             await self.__bot.send_message(
                 chat_id=telegram_id,
@@ -41,40 +251,96 @@ class TelegramNotification:
                 parse_mode=ParseMode.HTML,
                 disable_web_page_preview=True,
                 reply_markup=reply_markup,
+                rate_limit_args=True,
             )
-            msg = f"Отправлено оповещение пользователю {telegram_id}"
-            await log.adebug(msg)
-            return True, msg
-        except TelegramError as exc:
-            msg = f"Ошибка отправки сообщения пользователю {telegram_id}."
-            match exc:
-                case BadRequest():
-                    msg += " Некорректный id."
-                case Forbidden():
-                    msg += " Бот заблокирован."
-            msg += " " + exc.message
+        except RetryAfter as exc:
+            msg = f"Ошибка отправки сообщения пользователю {telegram_id}. {exc.message}"
             await log.ainfo(msg)
             return False, msg
+        except TelegramError as exc:
+            return await self.__handle_error(telegram_id, exc)
+        msg = f"Отправлено оповещение пользователю {telegram_id}"
+        await log.adebug(msg)
+        return True, msg
+
+    async def __handle_error(self, telegram_id: int, exc: TelegramError) -> tuple[bool, str]:
+        msg = f"Ошибка отправки сообщения пользователю {telegram_id}."
+        match exc:
+            case BadRequest():
+                msg += " Некорректный id."
+            case Forbidden():
+                msg += " Бот заблокирован."
+                self.__blocked_telegram_ids.add(telegram_id)
+        msg += " " + exc.message
+        await log.ainfo(msg)
+        return False, msg
+
+    def pop_blocked_telegram_ids(self) -> set[int]:
+        """Возвращает telegram_id пользователей, заблокировавших бота, которые были выявлены
+        при отправке сообщений с момента предыдущего вызова.
+        """
+        blocked_telegram_ids, self.__blocked_telegram_ids = self.__blocked_telegram_ids, set()
+        return blocked_telegram_ids
 
     async def send_messages(
         self,
         message: str,
-        users: Iterable[User],
+        users: Iterable[User] | AsyncIterable[User],
         reply_markup: TelegramObject | None = None,
     ) -> list[tuple[bool, str]]:
         """Делает массовую рассылку сообщения message пользователям users."""
-        send_message_tasks = [self.__send_message(user.telegram_id, message, reply_markup) for user in users]
-        result = await asyncio.gather(*send_message_tasks)
-        return result
+        return await self.map(
+            lambda user: self.__send_message(user.telegram_id, message, reply_markup), users
+        )
+
+    async def send_messages_by_telegram_ids(
+        self,
+        message: str,
+        telegram_ids: Iterable[int] | AsyncIterable[int],
+        reply_markup: TelegramObject | None = None,
+    ) -> list[tuple[bool, str]]:
+        """Делает массовую рассылку сообщения message по списку telegram_ids.
+        Очередной telegram_id запрашивается только после освобождения одного из отправителей.
+        """
+        return await self.map(
+            lambda telegram_id: self.__send_message(telegram_id, message, reply_markup), telegram_ids
+        )
+
+    async def map(
+        self, func: Callable[[T], Awaitable[tuple[bool, str]]], items: Iterable[T] | AsyncIterable[T]
+    ) -> list[tuple[bool, str]]:
+        """Применяет к элементам items корутину func, отправляющую сообщения, с ограничением
+        количества одновременных отправок. Возвращает результаты в порядке следования элементов;
+        исключение при обработке элемента считается неуспешной отправкой.
+        """
+        results = await self.__dispatcher.map(func, items)
+        return [
+            (False, f"Ошибка отправки сообщения. {result}") if isinstance(result, Exception) else result
+            for result in results
+        ]
 
     async def send_messages_by_template(
         self,
-        users: list[User],
+        users: Iterable[User] | AsyncIterable[User],
         template: TelegramMessageTemplate,
     ) -> list[tuple[bool, str]]:
-        """Отправляет пользователям users сообщения на основе шаблона template."""
-        send_message_tasks = [self.__send_message(user.telegram_id, **(await template.render(user))) for user in users]
-        return await asyncio.gather(*send_message_tasks)
+        """Отправляет пользователям users сообщения на основе шаблона template.
+        Сообщения формируются непосредственно перед отправкой. Если шаблон формирует
+        для пользователя несколько сообщений, результатом считается первая ошибка
+        или результат отправки последнего сообщения. Если шаблон не сформировал
+        для пользователя ни одного сообщения, отправка считается неуспешной.
+        """
+
+        async def send(user: User) -> tuple[bool, str]:
+            result = (False, f"Нет сообщений для пользователя {user.telegram_id}.")
+            for message in await template.render_messages(user):
+                result = await self.__send_message(user.telegram_id, **message)
+                if not result[0]:
+                    break
+            return result
+
+        await template.prepare()
+        return await self.map(send, users)
 
     async def send_message(
         self,
@@ -1,3 +1,5 @@
+import asyncio
+
 import aiohttp
 from structlog import get_logger
 
@@ -17,12 +19,55 @@ from .tech_message import TechMessageService
 
 logger = get_logger(module=__name__)
 
+# Время, в течение которого неиспользуемое соединение с сайтом остаётся открытым, в секундах
+KEEPALIVE_TIMEOUT = 60
+
+
+class ProcharityHTTPClient:
+    """Клиент HTTP-запросов к сайту с пулом постоянных соединений.
+
+    Сессия aiohttp создаётся при первом запросе и используется всеми запросами процесса,
+    поэтому повторные запросы не устанавливают новое TCP- и TLS-соединение.
+    """
+
+    def __init__(self, connection_limit: int, timeout: float):
+        """
+        Args:
+            connection_limit: Наибольшее количество одновременно открытых соединений.
+            timeout: Наибольшее время выполнения запроса, в секундах.
+        """
+        self._connection_limit = connection_limit
+        self._timeout = timeout
+        self._session: aiohttp.ClientSession | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._connection_limit, keepalive_timeout=KEEPALIVE_TIMEOUT),
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Закрывает сессию и все её соединения."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
 
 class ProcharityAPI:
     """Сервис для отправки сообщений на сайт."""
 
-    def __init__(self, settings: Settings, email_provider: EmailProvider, tech_message_service: TechMessageService):
+    def __init__(
+        self,
+        settings: Settings,
+        http_client: ProcharityHTTPClient,
+        email_provider: EmailProvider,
+        tech_message_service: TechMessageService,
+    ):
         self._settings = settings
+        self._http_client = http_client
         self._email_provider = email_provider
         self._tech_message_service = tech_message_service
 
@@ -44,23 +89,24 @@ class ProcharityAPI:
             False: отправка выполнена неуспешно.
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url=url, data=data, headers=self.token_header_dict) as response:
-                    data = await response.json()
-                    if response.status != 200:
-                        await self._notify_of_data_transfer_error(
-                            user_id, log_description, f"status = {response.status}, message = {data}"
-                        )
-                        return False
-                    else:
-                        await logger.adebug(
-                            f"Успешная передача данных на сайт: {log_description} пользователя {user_id}. Ответ: {data}"
-                        )
-                        return True
+            async with self._http_client.session.post(url=url, data=data, headers=self.token_header_dict) as response:
+                data = await response.json()
+                if response.status != 200:
+                    await self._notify_of_data_transfer_error(
+                        user_id, log_description, f"status = {response.status}, message = {data}"
+                    )
+                    return False
+                else:
+                    await logger.adebug(
+                        f"Успешная передача данных на сайт: {log_description} пользователя {user_id}. Ответ: {data}"
+                    )
+                    return True
         except aiohttp.ClientResponseError as e:
             await self._notify_of_data_transfer_error(
                 user_id, log_description, f"Неверный ответ от сайта ({e.message})."
             )
+        except asyncio.TimeoutError:
+            await self._notify_of_data_transfer_error(user_id, log_description, "Сайт не ответил вовремя.")
         except Exception as e:
             await logger.aexception(e)
 
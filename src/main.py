@@ -1,9 +1,11 @@
 from fastapi import FastAPI
 
 from src.core.depends import Container
+from src.core.enums import RunMode
 
 
-def main(run_bot: bool = True) -> FastAPI:
+def main(run_mode: RunMode | None = None) -> FastAPI:
+    """Создаёт приложение процесса с ролью run_mode (по умолчанию — из настройки RUN_MODE)."""
     container = Container()
     container.wire(packages=(__package__,))
-    return container.applications_container.fastapi_app(run_bot=run_bot)
+    return container.applications_container.fastapi_app(run_mode=run_mode or container.settings().RUN_MODE)
@@ -7,6 +7,8 @@ from urllib.parse import urljoin
 from pydantic import AnyHttpUrl, BeforeValidator, EmailStr, TypeAdapter, field_validator
 from pydantic_settings import BaseSettings
 
+from src.core.enums import RunMode
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 Url = Annotated[str, BeforeValidator(lambda value: str(TypeAdapter(AnyHttpUrl).validate_python(value)))]
@@ -46,6 +48,9 @@ class Settings(BaseSettings):
     DB_HOST: str = "localhost"
     DB_PORT: int = 5432
 
+    # Роль процесса: api, bot, worker или all (все роли в одном процессе)
+    RUN_MODE: RunMode = RunMode.ALL
+
     # Настройки бота
     BOT_TOKEN: str
     BOT_WEBHOOK_MODE: bool = False
@@ -96,6 +101,50 @@ class Settings(BaseSettings):
     # Изменение ключевых полей может потребовать изменения формата сообщения в src.core.messages.display_task()
     TRIGGER_MAILING_FIELDS: list[str] = ["title", "deadline", "category_id", "bonus"]
 
+    # Ограничения частоты отправки сообщений в Telegram
+    TELEGRAM_GLOBAL_RATE_LIMIT: float = 30.0
+    TELEGRAM_CHAT_SEND_INTERVAL: float = 1.0
+    TELEGRAM_MAX_CONCURRENT_SENDS: int = 30
+    TELEGRAM_MAX_RETRIES: int = 3
+
+    # Количество обновлений бота, обрабатываемых одновременно (обновления одного чата
+    # обрабатываются по очереди), и наибольшее количество принятых в обработку обновлений
+    BOT_CONCURRENT_UPDATES: int = 16
+    BOT_MAX_PENDING_UPDATES: int = 256
+
+    # Настройки фоновой отправки рассылок
+    MAILING_WORKERS: int = 4
+    MAILING_BATCH_SIZE: int = 30
+    MAILING_POLL_INTERVAL: float = 1.0
+    MAILING_LEASE_TIME: int = 5 * 60
+    MAILING_MAX_ATTEMPTS: int = 3
+
+    # Количество карточек задач и клавиатур к ним, хранимых в кэше
+    TASK_RENDER_CACHE_SIZE: int = 1024
+
+    # Время жизни (в секундах) и размер кэша пользователей, определяемых обработчиками бота
+    IDENTITY_CACHE_TTL: float = 30.0
+    IDENTITY_CACHE_SIZE: int = 10000
+
+    # Количество задач, проверяемых и записываемых за раз при потоковой актуализации задач
+    TASKS_STREAM_CHUNK_SIZE: int = 500
+
+    # Интервал записи в БД времени последнего взаимодействия пользователей с ботом, в секундах
+    LAST_INTERACTION_FLUSH_INTERVAL: float = 30.0
+
+    # Интервал попыток процесса стать ведущим (получение обновлений бота, регистрация webhook)
+    # и проверок соединения ведущего процесса с БД, в секундах
+    LEADER_ELECTION_INTERVAL: float = 10.0
+
+    # Наибольший возраст снимка дерева категорий в процессе, в секундах. После актуализации категорий
+    # процесс API перестраивает свой снимок, а остальные процессы сбрасывают свои по уведомлению;
+    # по истечении этого времени снимок перезагружается, даже если уведомление было пропущено
+    CATEGORY_TREE_TTL: float = 5 * 60
+
+    # Интервал проверок соединения, на котором процесс получает уведомления о сбросе кэшей
+    # от других процессов, и попыток его восстановления, в секундах
+    CACHE_INVALIDATION_INTERVAL: float = 10.0
+
     # Отображать ли меню для настройки уведомлений
     SHOW_NOTIFICATION_SETTINGS_MENU: bool = False
 
@@ -103,6 +152,9 @@ class Settings(BaseSettings):
     PROCHARITY_URL: Url = "https://procharity.ru"
     HELP_PROCHARITY_URL: Url = "https://help.procharity.ru/"
     ACCESS_TOKEN_SEND_DATA_TO_PROCHARITY: str = ""
+    # Наибольшее количество одновременных соединений с сайтом и время ожидания ответа сайта, в секундах
+    PROCHARITY_API_CONNECTION_LIMIT: int = 20
+    PROCHARITY_API_TIMEOUT: float = 10.0
 
     @field_validator("APPLICATION_URL", "PROCHARITY_URL", "HELP_PROCHARITY_URL", "STATIC_URL")
     @classmethod
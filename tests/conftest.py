@@ -0,0 +1,22 @@
+import os
+
+import pytest
+
+# Обязательные настройки приложения, не используемые модульными тестами
+os.environ.setdefault("POSTGRES_DB", "test")
+os.environ.setdefault("POSTGRES_USER", "test")
+os.environ.setdefault("POSTGRES_PASSWORD", "test")
+os.environ.setdefault("BOT_TOKEN", "123456:TEST")
+os.environ.setdefault("ORGANIZATIONS_EMAIL", "test@example.com")
+os.environ.setdefault("EMAIL_ADMIN", "test@example.com")
+
+
+@pytest.fixture
+def container():
+    """Контейнер зависимостей, связанный с модулями, которые получают кэши через Provide."""
+    from src.core.depends import Container
+
+    container = Container()
+    container.wire(modules=["src.bot.keyboards", "src.core.messages"])
+    yield container
+    container.unwire()
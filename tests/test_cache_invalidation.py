@@ -0,0 +1,64 @@
+import json
+from types import SimpleNamespace
+
+from src.core.category_tree import CategoryTreeCache, build_category_tree
+from src.core.enums import CacheName
+from src.core.identity_cache import IdentityCache
+from src.core.render_cache import TaskRenderCache
+from src.core.services.cache_invalidation import CACHE_INVALIDATION_CHANNEL, CacheInvalidation
+
+
+def create_caches() -> SimpleNamespace:
+    caches = SimpleNamespace(
+        identity=IdentityCache(ttl=60, maxsize=10),
+        category_tree=CategoryTreeCache(ttl=60),
+        task_render=TaskRenderCache(10),
+    )
+    caches.identity.put(("id_hash", "first"), SimpleNamespace(id=1))
+    caches.identity.put(("id_hash", "second"), SimpleNamespace(id=2))
+    caches.category_tree._set_tree(build_category_tree([]))
+    caches.task_render.texts.put((1, None, False), "first")
+    caches.task_render.texts.put((2, None, False), "second")
+    caches.invalidation = CacheInvalidation(
+        engine=None,
+        identity_cache=caches.identity,
+        category_tree_cache=caches.category_tree,
+        task_render_cache=caches.task_render,
+        retry_interval=1,
+    )
+    return caches
+
+
+def notify(cache_invalidation: CacheInvalidation, sender: str, cache: CacheName, ids: list[int] | None) -> None:
+    payload = json.dumps({"sender": sender, "cache": cache, "ids": ids})
+    cache_invalidation._on_notification(None, 0, CACHE_INVALIDATION_CHANNEL, payload)
+
+
+def test_invalidate_applies_to_current_process():
+    caches = create_caches()
+
+    caches.invalidation.invalidate(CacheName.IDENTITY, [1])
+    caches.invalidation.invalidate(CacheName.TASK_RENDER)
+
+    assert caches.identity.get(("id_hash", "first")) == (False, None)
+    assert caches.identity.get(("id_hash", "second"))[0]
+    assert caches.task_render.stats()["texts"]["size"] == 0
+
+
+def test_notification_from_other_process_is_applied():
+    caches = create_caches()
+
+    notify(caches.invalidation, "other", CacheName.TASK_RENDER, [2])
+    notify(caches.invalidation, "other", CacheName.CATEGORY_TREE, None)
+
+    assert caches.task_render.texts.get((1, None, False)) == "first"
+    assert caches.task_render.texts.get((2, None, False)) is None
+    assert caches.category_tree._tree is None
+
+
+def test_own_notification_is_ignored():
+    caches = create_caches()
+
+    notify(caches.invalidation, caches.invalidation._sender, CacheName.TASK_RENDER, None)
+
+    assert caches.task_render.stats()["texts"]["size"] == 2
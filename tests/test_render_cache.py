@@ -0,0 +1,30 @@
+from src.core.render_cache import LRUCache, TaskRenderCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put(1, "first")
+    cache.put(2, "second")
+    cache.get(1)
+    cache.put(3, "third")
+
+    assert cache.get(2) is None
+    assert cache.get(1) == "first"
+    assert cache.stats() == {"size": 2, "hits": 2, "misses": 1}
+
+
+def test_task_render_cache_invalidates_selected_tasks():
+    cache = TaskRenderCache(10)
+    cache.texts.put((1, None, False), "first")
+    cache.texts.put((2, None, False), "second")
+    cache.keyboards.put((1, True), "keyboard")
+
+    cache.invalidate([1])
+
+    assert cache.texts.get((1, None, False)) is None
+    assert cache.texts.get((2, None, False)) == "second"
+    assert cache.stats()["keyboards"]["size"] == 0
+
+    cache.invalidate()
+
+    assert cache.stats()["texts"]["size"] == 0
@@ -0,0 +1,78 @@
+import asyncio
+from types import SimpleNamespace
+
+from src.bot.mailing import TaskInfoMessageTemplate
+from src.core.db.models import MAX_LENGTH_BOT_MESSAGE, ExternalSiteUser, Task, User
+from src.core.services.notification import TelegramDispatcher, TelegramNotification
+
+
+class SiteUserServiceStub:
+    def __init__(self, responses: set[tuple[int, int]] | None = None) -> None:
+        self.responses = responses or set()
+        self.calls = []
+
+    async def get_responses_to_tasks(self, tasks, site_user_ids=None):
+        self.calls.append(({task.id for task in tasks}, set(site_user_ids)))
+        return self.responses
+
+
+def create_user(user_id: int = 1, site_user_id: int | None = 10) -> User:
+    external_user = ExternalSiteUser(id=site_user_id) if site_user_id is not None else None
+    return User(id=user_id, telegram_id=user_id * 100, external_user=external_user)
+
+
+def create_template(texts: dict[int, str], users_task_ids: dict[int, list[int]], service=None):
+    tasks = {task_id: Task(id=task_id) for task_id in texts}
+    return TaskInfoMessageTemplate(tasks, texts, users_task_ids, [10], service or SiteUserServiceStub())
+
+
+def test_render_messages_single_task(container):
+    template = create_template({1: "first"}, {1: [1]})
+
+    messages = asyncio.run(template.render_messages(create_user()))
+
+    assert len(messages) == 1
+    assert messages[0]["text"] == "first"
+    assert container.caches_container.task_render_cache().keyboards.stats()["size"] == 1
+
+
+def test_render_messages_splits_long_text():
+    task_text = "x" * (MAX_LENGTH_BOT_MESSAGE // 3)
+    texts = {task_id: task_text for task_id in range(1, 6)}
+    template = create_template(texts, {1: list(texts)})
+
+    messages = asyncio.run(template.render_messages(create_user()))
+
+    assert len(messages) > 1
+    assert all(len(message["text"]) <= MAX_LENGTH_BOT_MESSAGE for message in messages)
+    keyboard_rows = [row for message in messages for row in message["reply_markup"].inline_keyboard]
+    assert len(keyboard_rows) == len(texts)
+    assert "<b>5.</b>" in messages[-1]["text"]
+
+
+def test_render_messages_empty_for_user_without_site_user_or_tasks():
+    template = create_template({1: "first"}, {1: [1], 2: [2]})
+
+    assert asyncio.run(template.render_messages(create_user(site_user_id=None))) == []
+    assert asyncio.run(template.render_messages(create_user(user_id=2))) == []
+    assert asyncio.run(template.render_messages(create_user(user_id=3))) == []
+
+
+def test_prepare_loads_responses_of_batch_users_for_their_tasks():
+    service = SiteUserServiceStub()
+    template = create_template({1: "first", 2: "second", 3: "third"}, {1: [1, 2]}, service)
+
+    asyncio.run(template.prepare())
+
+    assert service.calls == [({1, 2}, {10})]
+
+
+def test_send_messages_by_template_reports_users_without_messages():
+    dispatcher = TelegramDispatcher(global_rate=1000, chat_interval=0, max_concurrency=2, max_retries=0)
+    notification = TelegramNotification(SimpleNamespace(bot=None), dispatcher)
+    template = create_template({1: "first"}, {})
+
+    results = asyncio.run(notification.send_messages_by_template([create_user()], template))
+
+    assert len(results) == 1
+    assert results[0][0] is False
@@ -0,0 +1,107 @@
+import asyncio
+
+from telegram.error import RetryAfter
+
+from src.core.services.notification import TelegramDispatcher, TelegramDispatcherRateLimiter
+
+
+def create_dispatcher(max_concurrency: int = 3) -> TelegramDispatcher:
+    return TelegramDispatcher(global_rate=1000, chat_interval=0, max_concurrency=max_concurrency, max_retries=0)
+
+
+async def double_later(item: int) -> int:
+    # Первые элементы обрабатываются дольше последних, поэтому завершаются не по порядку
+    await asyncio.sleep(0.001 * (10 - item))
+    return item * 2
+
+
+def test_map_returns_results_in_items_order():
+    results = asyncio.run(create_dispatcher().map(double_later, range(10)))
+
+    assert results == [item * 2 for item in range(10)]
+
+
+def test_map_accepts_async_iterable():
+    async def items():
+        for item in range(5):
+            yield item
+
+    results = asyncio.run(create_dispatcher().map(double_later, items()))
+
+    assert results == [0, 2, 4, 6, 8]
+
+
+def test_map_limits_concurrency():
+    running = max_running = 0
+
+    async def func(item: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return item
+
+    asyncio.run(create_dispatcher(max_concurrency=2).map(func, range(10)))
+
+    assert max_running == 2
+
+
+def test_for_each_passes_results_without_collecting_them():
+    sent_count = 0
+
+    def on_result(index: int, result: int) -> None:
+        nonlocal sent_count
+        sent_count += result
+
+    count = asyncio.run(create_dispatcher().for_each(lambda item: asyncio.sleep(0, result=1), range(100), on_result))
+
+    assert count == sent_count == 100
+
+
+def test_map_isolates_item_errors():
+    async def func(item: int) -> int:
+        if item == 3:
+            raise ValueError("bad item")
+        return item
+
+    results = asyncio.run(create_dispatcher().map(func, range(6)))
+
+    assert [result for result in results if not isinstance(result, Exception)] == [0, 1, 2, 4, 5]
+    assert isinstance(results[3], ValueError)
+
+
+def test_rate_limiter_spaces_only_broadcast_messages_to_chat():
+    limiter = TelegramDispatcherRateLimiter(
+        TelegramDispatcher(global_rate=1000, chat_interval=0.2, max_concurrency=1, max_retries=0)
+    )
+
+    async def send(rate_limit_args: bool | None) -> float:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for _ in range(2):
+            await limiter.process_request(
+                lambda: asyncio.sleep(0, result=True), (), {}, "sendMessage", {"chat_id": 1}, rate_limit_args
+            )
+        return loop.time() - started
+
+    assert asyncio.run(send(None)) < 0.1
+    assert asyncio.run(send(True)) >= 0.2
+
+
+def test_rate_limiter_retries_after_retry_after():
+    dispatcher = TelegramDispatcher(global_rate=1000, chat_interval=0, max_concurrency=1, max_retries=1)
+    limiter = TelegramDispatcherRateLimiter(dispatcher)
+    calls = 0
+
+    async def callback() -> bool:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RetryAfter(0)
+        return True
+
+    result = asyncio.run(limiter.process_request(callback, (), {}, "sendMessage", {"chat_id": 1}, None))
+
+    assert result is True
+    assert calls == 2